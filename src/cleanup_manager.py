@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import Optional
 
 from src.utils.logger import get_logger
-from src.utils.state_manager import StateManager
+from src.utils.state_manager import get_state_manager
 
 logger = get_logger(__name__)
 
@@ -57,7 +57,8 @@ class CleanupManager:
         self.temp_dir = Path(temp_dir)
         self.output_dir = Path(output_dir)
 
-        self.state_manager = StateManager()
+        # Misma instancia que el resto de la app: un solo state en memoria
+        self.state_manager = get_state_manager()
 
         logger.debug(
             f"CleanupManager initialized: "
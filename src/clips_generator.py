@@ -5,14 +5,70 @@ ClipsAI analiza la transcripción y detecta cambios de tema usando
 algoritmo TextTiling con BERT embeddings para marcar puntos de corte.
 """
 
-import json
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import Optional
 
 from clipsai import ClipFinder, Transcription
 
+from .utils.json_io import dumps_json, loads_json
 from .utils.logger import setup_logger
 
+# Duración mínima (segundos) de un clip generado por cortes de tiempo fijo
+_MIN_FIXED_TIME_CLIP_DURATION = 30
+
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parseo un JSON una sola vez por versión del archivo
+
+    mtime_ns y size forman parte de la clave: si el archivo cambia en disco,
+    la siguiente llamada lo vuelve a leer. El dict devuelto es compartido,
+    así que quien lo use no debe modificarlo.
+    """
+    return loads_json(Path(path).read_bytes())
+
+
+class _SegmentIndex:
+    """
+    Índice de segmentos ordenado por inicio para consultas de solapamiento
+
+    Lo construyo una vez por transcripción y cada consulta cuesta
+    O(log N + m) en lugar de recorrer todos los segmentos.
+    """
+
+    __slots__ = ("segments", "starts", "ends", "max_ends", "texts")
+
+    def __init__(self, segments: list[dict]):
+        # Guardo la lista original para detectar si cambió la transcripción
+        self.segments = segments
+
+        # WhisperX ya entrega los segmentos ordenados; sorted es estable y
+        # prácticamente gratis en ese caso
+        ordered = sorted(segments, key=lambda seg: seg.get("start", 0.0))
+        self.starts = [seg.get("start", 0.0) for seg in ordered]
+        self.ends = [seg.get("end", 0.0) for seg in ordered]
+        self.texts = [seg.get("text", "").strip() for seg in ordered]
+
+        # Máximo acumulado de los finales: es monótono aunque los finales no lo
+        # sean, así que puedo hacer bisect sobre él para acotar por la izquierda
+        self.max_ends = list(accumulate(self.ends, max))
+
+    def text_between(self, start_time: float, end_time: float) -> str:
+        # Candidatos: segmentos con start < end_time ...
+        hi = bisect_left(self.starts, end_time)
+        # ... descartando el prefijo donde ningún segmento termina después de start_time
+        lo = bisect_right(self.max_ends, start_time, 0, hi)
+
+        return " ".join(
+            self.texts[i]
+            for i in range(lo, hi)
+            if self.ends[i] > start_time and self.texts[i]
+        )
+
 
 class ClipsGenerator:
     """
@@ -53,6 +109,9 @@ class ClipsGenerator:
             min_clip_duration=min_clip_duration, max_clip_duration=max_clip_duration
         )
 
+        # Índice de la última transcripción consultada en _get_text_for_timerange
+        self._segment_index: Optional[_SegmentIndex] = None
+
         self.logger.info(
             f"ClipsGenerator inicializado "
             f"(clips: {min_clip_duration}s - {max_clip_duration}s)"
@@ -75,12 +134,18 @@ class ClipsGenerator:
         try:
             transcript_file = Path(transcript_path)
 
-            if not transcript_file.exists():
+            # Un solo stat: me dice si existe y me da la clave de caché
+            try:
+                stat = transcript_file.stat()
+            except FileNotFoundError:
                 self.logger.error(f"Transcripción no encontrada: {transcript_path}")
                 return None
 
-            with open(transcript_file, encoding="utf-8") as f:
-                data = json.load(f)
+            # Cacheado por (ruta, mtime, tamaño): regenerar clips del mismo
+            # video no vuelve a parsear la transcripción
+            data = _load_json_cached(
+                str(transcript_file.absolute()), stat.st_mtime_ns, stat.st_size
+            )
 
             self.logger.info(
                 f"Transcripción cargada: {len(data.get('segments', []))} segmentos"
@@ -204,6 +269,14 @@ class ClipsGenerator:
         # Calculo duración total
         total_duration = segments[-1].get("end", 0)
 
+        # Si el video entero no llega al mínimo, ningún corte puede servir
+        if total_duration < _MIN_FIXED_TIME_CLIP_DURATION:
+            self.logger.warning(
+                f"Video demasiado corto para cortes de tiempo fijo "
+                f"({total_duration:.1f}s < {_MIN_FIXED_TIME_CLIP_DURATION}s)"
+            )
+            return None
+
         self.logger.info(f"Generando clips de tiempo fijo: {clip_duration}s cada uno")
         self.logger.info(f"Duración total: {total_duration:.1f}s")
 
@@ -217,7 +290,7 @@ class ClipsGenerator:
             duration = end_time - start_time
 
             # Solo creo el clip si tiene al menos 30 segundos
-            if duration >= 30:
+            if duration >= _MIN_FIXED_TIME_CLIP_DURATION:
                 # Extraigo el texto para este rango
                 clip_text = self._get_text_for_timerange(
                     whisperx_data, start_time, end_time
@@ -393,20 +466,14 @@ class ClipsGenerator:
         """
         segments = transcript_data.get("segments", [])
 
-        clip_text_parts = []
-
-        for seg in segments:
-            seg_start = seg.get("start", 0.0)
-            seg_end = seg.get("end", 0.0)
-
-            # Si el segmento se solapa con el rango, lo incluyo
-            # Uso >= y <= para incluir bordes
-            if seg_start < end_time and seg_end > start_time:
-                text = seg.get("text", "").strip()
-                if text:
-                    clip_text_parts.append(text)
+        # Reutilizo el índice mientras sigan consultando la misma transcripción
+        # (un clip tras otro en generate_clips / _generate_fixed_time_clips)
+        index = self._segment_index
+        if index is None or index.segments is not segments:
+            index = _SegmentIndex(segments)
+            self._segment_index = index
 
-        return " ".join(clip_text_parts)
+        return index.text_between(start_time, end_time)
 
     def _format_time(self, seconds: float) -> str:
         """
@@ -414,8 +481,7 @@ class ClipsGenerator:
 
         Ejemplo: 125.5 → "02:05"
         """
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+        mins, secs = divmod(int(seconds), 60)
         return f"{mins:02d}:{secs:02d}"
 
     def save_clips_metadata(
@@ -452,8 +518,7 @@ class ClipsGenerator:
         }
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            output_file.write_bytes(dumps_json(metadata))
 
             self.logger.info(f"📝 Metadata guardada: {output_file}")
 
@@ -473,8 +538,7 @@ class ClipsGenerator:
         - Editar clips manualmente y recargarlos
         """
         try:
-            with open(metadata_path, encoding="utf-8") as f:
-                return json.load(f)
+            return loads_json(Path(metadata_path).read_bytes())
         except Exception as e:
             self.logger.error(f"Error cargando metadata: {e}")
             return None
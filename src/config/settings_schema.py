@@ -294,6 +294,13 @@ def _normalize_ffmpeg_threads(value: int) -> int:
     return value
 
 
+def _normalize_export_workers(value: int) -> int:
+    # 0 = auto (half the CPUs), positive = number of clips exported in parallel
+    if value < 0 or value > 16:
+        raise ValueError("Export workers must be between 0 and 16 (0=auto)")
+    return value
+
+
 # --- Output/naming normalizers ---
 
 
@@ -611,6 +618,34 @@ APP_SETTINGS: tuple[SettingDefinition, ...] = (
         help_text="Thread count: 0=auto, 7=use 7 threads, -2=all CPUs minus 2.",
         normalize=_normalize_ffmpeg_threads,
     ),
+    SettingDefinition(
+        key="export_workers",
+        group="export",
+        label="Parallel clip exports:",
+        python_type=int,
+        default=1,
+        placeholder="1",
+        help_text="Clips exported at the same time: 1=one by one, 0=auto (half the CPUs). With face tracking, each worker also runs its own face detection, so CPU and memory use grow with the worker count.",
+        normalize=_normalize_export_workers,
+    ),
+    SettingDefinition(
+        key="fast_trim",
+        group="export",
+        label="Fast trim (no re-encode):",
+        python_type=bool,
+        default=False,
+        placeholder="true or false",
+        help_text="Copy streams without re-encoding when a clip has no subtitles, logo or aspect change. Much faster, but cuts snap to the nearest keyframe.",
+    ),
+    SettingDefinition(
+        key="hardware_encoding",
+        group="export",
+        label="Hardware encoding:",
+        python_type=bool,
+        default=False,
+        placeholder="true or false",
+        help_text="Encode with the GPU (NVENC, Quick Sync or VideoToolbox) when available; falls back to libx264.",
+    ),
     SettingDefinition(
         key="enable_face_tracking",
         group="export",
@@ -295,9 +295,10 @@ class CopysGenerator:
                     )
 
                 # User message con los clips del batch
+                # (JSON compacto: la indentación solo suma tokens de entrada)
                 user_message = f"""Clasifica estos {len(clips_input)} clips en viral/educational/storytelling:
 
-{json.dumps(clips_input, indent=2, ensure_ascii=False)}
+{json.dumps(clips_input, ensure_ascii=False, separators=(",", ":"))}
 
 Responde SOLO con JSON válido (sin markdown):"""
 
@@ -532,10 +533,10 @@ Responde SOLO con JSON válido (sin markdown):"""
                     }
                 )
 
-            # User message para este batch
+            # User message para este batch (JSON compacto, menos tokens)
             user_message = f"""Genera copies para estos {len(clips_input)} clips en estilo {style}:
 
-{json.dumps(clips_input, indent=2, ensure_ascii=False)}
+{json.dumps(clips_input, ensure_ascii=False, separators=(",", ":"))}
 
 Responde SOLO con JSON válido (sin markdown):"""
 
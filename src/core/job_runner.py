@@ -778,6 +778,17 @@ class JobRunner:
             ffmpeg_threads=int(
                 settings.get("ffmpeg_threads", app_settings.get("ffmpeg_threads", 0))
             ),
+            export_workers=int(
+                settings.get("export_workers", app_settings.get("export_workers", 1))
+            ),
+            fast_trim=bool(
+                settings.get("fast_trim", app_settings.get("fast_trim", False))
+            ),
+            hardware_encoding=bool(
+                settings.get(
+                    "hardware_encoding", app_settings.get("hardware_encoding", False)
+                )
+            ),
             subtitle_max_chars_per_line=int(
                 settings.get(
                     "subtitle_max_chars_per_line",
@@ -990,6 +1001,11 @@ class JobRunner:
                     "ffmpeg_threads", app_settings.get("ffmpeg_threads", 0)
                 )
             ),
+            hardware_encoding=bool(
+                shorts_settings.get(
+                    "hardware_encoding", app_settings.get("hardware_encoding", False)
+                )
+            ),
             subtitle_max_chars_per_line=subtitle_max_chars_per_line,
             subtitle_max_duration=subtitle_max_duration,
             flat_output=True,
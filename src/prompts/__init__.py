@@ -14,6 +14,8 @@ Estilos disponibles:
 - storytelling: Narrativa personal, conexión emocional
 """
 
+from functools import lru_cache
+
 from .base_prompts import (
     JSON_FORMAT_INSTRUCTIONS,
     SYSTEM_PROMPT,
@@ -24,6 +26,7 @@ from .storytelling_prompt import get_storytelling_prompt
 from .viral_prompt import get_viral_prompt
 
 
+@lru_cache(maxsize=None)
 def get_prompt_for_style(style: str = "viral") -> str:
     """
     Retorna el prompt completo para el estilo especificado.
@@ -32,6 +35,8 @@ def get_prompt_for_style(style: str = "viral") -> str:
     - Combina system prompt base + style prompt específico
     - Valida que el estilo sea correcto
     - Facilita el uso desde copys_generator.py
+    - Cacheada: cada estilo se construye una sola vez por proceso
+      (copys_generator la llama por cada batch)
 
     Args:
         style: Estilo de copy ("viral", "educational", "storytelling")
@@ -137,6 +137,7 @@ class FFmpegVideoWriter:
         codec: str = "libx264",
         preset: str = "fast",
         crf: int = 23,
+        threads: int = 0,
     ):
         """
         Inicializa VideoWriter con FFmpeg subprocess.
@@ -149,6 +150,7 @@ class FFmpegVideoWriter:
             codec: Codec FFmpeg (libx264, h264_videotoolbox, mpeg4)
             preset: Preset de encoding (ultrafast, fast, medium, slow)
             crf: Calidad (18-28, menor = mejor calidad)
+            threads: Threads del encoder (0 = auto de FFmpeg)
         """
         self.output_path = output_path
         self.width = width
@@ -163,6 +165,12 @@ class FFmpegVideoWriter:
         cmd = [
             "ffmpeg",
             "-y",  # Sobrescribir si existe
+            # Solo errores: stderr es un PIPE que no se lee hasta release(), con
+            # estadísticas de progreso podría llenarse y bloquear a FFmpeg
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-nostats",
             "-f",
             "rawvideo",
             "-vcodec",
@@ -181,6 +189,8 @@ class FFmpegVideoWriter:
             preset,
             "-crf",
             str(crf),
+            "-threads",
+            str(threads),
             str(output_path),
         ]
 
@@ -488,6 +498,9 @@ class FaceReframer:
         target_resolution: tuple[int, int],
         start_time: float | None = None,
         end_time: float | None = None,
+        threads: int = 0,
+        preset: str = "fast",
+        crf: int = 23,
     ) -> str:
         """
         PIPELINE PRINCIPAL: Genera video con crop dinámico basado en face tracking
@@ -519,6 +532,9 @@ class FaceReframer:
             target_resolution: (width, height) ej. (1080, 1920)
             start_time: Timestamp inicio (segundos) - para procesar solo clip
             end_time: Timestamp fin (segundos)
+            threads: Threads del encoder FFmpeg (0 = auto)
+            preset: Preset de encoding del video temporal
+            crf: Calidad del video temporal (menor = mejor calidad)
 
         Returns:
             output_path: Path al video temporal generado
@@ -591,8 +607,9 @@ class FaceReframer:
                     height=target_height,
                     fps=fps,
                     codec=codec,
-                    preset="fast",  # Coherente con video_exporter.py
-                    crf=23,  # Calidad coherente con video_exporter.py
+                    preset=preset,
+                    crf=crf,
+                    threads=threads,
                 )
 
                 if test_writer.isOpened():
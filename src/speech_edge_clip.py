@@ -53,6 +53,20 @@ def load_transcript_segments(
     with open(transcript_file, encoding="utf-8") as f:
         data = json.load(f)
 
+    return transcript_segments_from_data(data)
+
+
+def transcript_segments_from_data(
+    data: Any,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Extract `(segments, word_segments)` from an already-parsed WhisperX transcript.
+
+    Lets callers that process many clips parse the transcript JSON only once.
+    """
+    if not isinstance(data, dict):
+        return [], []
+
     segments = data.get("segments") or []
     word_segments = data.get("word_segments") or []
     if not isinstance(segments, list):
@@ -137,6 +151,7 @@ def compute_speech_aware_boundaries(
     clip_end: Seconds,
     trim_ms_start: int = 0,
     trim_ms_end: int = 0,
+    transcript_data: dict[str, Any] | None = None,
 ) -> tuple[Seconds, Seconds]:
     """
     Trim excess silence from a clip window using WhisperX word timestamps.
@@ -144,6 +159,9 @@ def compute_speech_aware_boundaries(
     `trim_ms_start` / `trim_ms_end` represent the maximum silence buffer to keep before/after speech.
     If leading/trailing silence is less than the buffer, that side is left unchanged.
     A value of `0` disables trimming for that side.
+
+    If `transcript_data` (the parsed transcript JSON) is given, it is used instead of
+    re-reading `transcript_path`.
     """
     if clip_end <= clip_start:
         return clip_start, clip_end
@@ -154,7 +172,10 @@ def compute_speech_aware_boundaries(
         return clip_start, clip_end
 
     try:
-        segments, word_segments = load_transcript_segments(transcript_path)
+        if transcript_data is not None:
+            segments, word_segments = transcript_segments_from_data(transcript_data)
+        else:
+            segments, word_segments = load_transcript_segments(transcript_path)
     except Exception as e:
         logger.debug(f"Speech-aware trimming disabled (failed to load transcript): {e}")
         return clip_start, clip_end
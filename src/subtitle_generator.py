@@ -81,6 +81,22 @@ class SubtitleGenerator:
             self.logger.error(f"Error generando subtítulos: {e}")
             return None
 
+    def load_transcript(self, transcript_path: str) -> dict:
+        """
+        Cargo el JSON de transcripción una sola vez
+
+        Pensado para exportaciones de muchos clips: el resultado se pasa a
+        generate_srt_for_clip(transcript_data=...) para no re-parsear por clip.
+
+        Args:
+            transcript_path: Ruta al JSON de transcripción
+
+        Returns:
+            Dict con la transcripción parseada
+        """
+        with open(transcript_path, encoding="utf-8") as f:
+            return json.load(f)
+
     def generate_srt_for_clip(
         self,
         transcript_path: str,
@@ -89,6 +105,7 @@ class SubtitleGenerator:
         output_path: str,
         max_chars_per_line: int = 42,
         max_duration: float = 5.0,
+        transcript_data: Optional[dict] = None,
     ) -> Optional[str]:
         """
         Genero archivo SRT para un clip específico
@@ -100,14 +117,15 @@ class SubtitleGenerator:
             output_path: Ruta de salida para el SRT
             max_chars_per_line: Máximo de caracteres por línea
             max_duration: Duración máxima de un subtítulo
+            transcript_data: Transcripción ya parseada (evita releer transcript_path)
 
         Returns:
             Ruta al archivo SRT generado, o None si falla
         """
         try:
-            # Cargo la transcripción
-            with open(transcript_path, encoding="utf-8") as f:
-                transcript_data = json.load(f)
+            # Cargo la transcripción (si no me la pasaron ya parseada)
+            if transcript_data is None:
+                transcript_data = self.load_transcript(transcript_path)
 
             segments = transcript_data.get("segments", [])
 
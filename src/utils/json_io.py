@@ -0,0 +1,39 @@
+"""
+JSON I/O - Parseo y serialización JSON con orjson opcional
+
+orjson parsea transcripciones y salidas de ffprobe bastante más rápido que
+json; si no está instalado uso la librería estándar con el mismo resultado.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None  # type: ignore
+
+
+def loads_json(data: bytes | str) -> Any:
+    """
+    Parseo JSON (bytes o str) con orjson si está instalado, si no con json
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serializo a JSON indentado (UTF-8 sin escapar) con orjson si está instalado
+
+    Si orjson no sabe serializar algún valor (p.ej. claves no-str), uso json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
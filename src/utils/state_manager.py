@@ -51,6 +51,8 @@ class StateManager:
     ):
         # Donde guardo el estado del proyecto
         self.state_file = Path(state_file)
+        # True mientras register_video_full agrupa varios cambios en un solo write
+        self._defer_save = False
 
         # Root estable del proyecto (para rutas que no dependen del CWD)
         self.app_root = (
@@ -189,6 +191,8 @@ class StateManager:
         """
         Guardo el estado actual al archivo JSON
         """
+        if self._defer_save:
+            return
         with open(self.state_file, "w", encoding="utf-8") as f:
             json.dump(self.state, f, indent=2, ensure_ascii=False)
 
@@ -264,6 +268,47 @@ class StateManager:
             existing["last_updated"] = now
             self._save_state()
 
+    def register_video_full(
+        self,
+        video_id: str,
+        filename: str,
+        video_path: Optional[str] = None,
+        *,
+        transcript_path: Optional[str] = None,
+        clips: Optional[list[dict]] = None,
+        clips_metadata_path: Optional[str] = None,
+        exported_paths: Optional[list[str]] = None,
+        aspect_ratio: Optional[str] = None,
+        content_type: str = "tutorial",
+        preset: Optional[dict] = None,
+    ) -> None:
+        """
+        Registro un video junto con sus artifacts escribiendo el state una sola vez
+
+        Equivale a register_video + mark_transcribed + mark_clips_generated +
+        mark_clips_exported (solo los pasos cuyos argumentos se pasan).
+        """
+        self._defer_save = True
+        try:
+            self.register_video(
+                video_id,
+                filename,
+                video_path=video_path,
+                content_type=content_type,
+                preset=preset,
+            )
+            if transcript_path:
+                self.mark_transcribed(video_id, transcript_path)
+            if clips is not None:
+                self.mark_clips_generated(video_id, clips, clips_metadata_path)
+            if exported_paths is not None:
+                self.mark_clips_exported(
+                    video_id, exported_paths, aspect_ratio=aspect_ratio
+                )
+        finally:
+            self._defer_save = False
+        self._save_state()
+
     def get_video_path(self, video_id: str) -> Optional[str]:
         """
         Obtengo la ruta al archivo de video (si está registrada)
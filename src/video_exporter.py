@@ -5,11 +5,18 @@ Este módulo toma los clips generados y los exporta a archivos de video reales.
 Usa ffmpeg para cortar con precisión y opcionalmente cambiar aspect ratio.
 """
 
-import json
+import functools
 import os
+import re
+import shutil
 import subprocess
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from fractions import Fraction
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 from rich.progress import Progress
@@ -17,10 +24,16 @@ from rich.progress import Progress
 from src.reframer import FaceReframer
 from src.speech_edge_clip import compute_speech_aware_boundaries
 from src.subtitle_generator import SubtitleGenerator
+from src.utils.json_io import loads_json
 from src.utils.logger import get_logger
+from src.utils.logo import coerce_logo_file
 
 logger = get_logger(__name__)
 
+# Caracteres especiales en rutas dentro de filtros ffmpeg (`subtitles=...`, `movie=...`).
+# Un solo pass con regex equivale a escapar backslashes primero y luego `:` y `'`.
+_FILTER_PATH_ESCAPE_RE = re.compile(r"([\\:'])")
+
 
 def _safe_parse_ffprobe_r_frame_rate(r_frame_rate: object) -> float:
     """
@@ -66,6 +79,251 @@ def _resolve_ffmpeg_threads(threads: int) -> int:
     return max(1, result)  # At least 1 thread
 
 
+# Tope de hilos para libavfilter: más allá de 4 el subtitles/overlay no escala
+_MAX_FILTER_THREADS = 4
+
+
+def _resolve_filter_threads(threads: int) -> int:
+    """
+    Resolve thread count for ffmpeg -filter_threads / -filter_complex_threads.
+
+    Stays within the same CPU budget as the encoder (`threads`, resolved with
+    `_resolve_ffmpeg_threads`), capped at `_MAX_FILTER_THREADS`.
+    """
+    budget = _resolve_ffmpeg_threads(threads) or os.cpu_count() or 4
+    return max(1, min(_MAX_FILTER_THREADS, budget))
+
+
+# Estilos predefinidos para subtítulos (force_style de ffmpeg)
+# TODOS con texto AMARILLO para máxima visibilidad
+_SUBTITLE_STYLES: Mapping[str, dict[str, str]] = MappingProxyType(
+    {
+        "default": {
+            "FontName": "Arial",
+            "FontSize": "18",
+            "PrimaryColour": "&H0000FFFF",  # AMARILLO
+            "OutlineColour": "&H00000000",  # Negro
+            "Outline": "2",
+            "Shadow": "1",
+            "Bold": "0",
+        },
+        "bold": {
+            "FontName": "Arial",
+            "FontSize": "22",
+            "PrimaryColour": "&H0000FFFF",  # AMARILLO
+            "OutlineColour": "&H00000000",
+            "Outline": "2",
+            "Shadow": "1",
+            "Bold": "-1",
+        },
+        "yellow": {
+            "FontName": "Arial",
+            "FontSize": "20",
+            "PrimaryColour": "&H0000FFFF",  # AMARILLO
+            "OutlineColour": "&H00000000",
+            "Outline": "2",
+            "Shadow": "1",
+            "Bold": "-1",
+        },
+        "tiktok": {
+            "FontName": "Arial",
+            "FontSize": "20",
+            "PrimaryColour": "&H0000FFFF",  # AMARILLO
+            "OutlineColour": "&H00000000",
+            "Outline": "2",
+            "Shadow": "2",
+            "Bold": "-1",
+            "Alignment": "10",  # Centro arriba
+        },
+        "small": {
+            "FontName": "Arial",
+            "FontSize": "10",
+            "PrimaryColour": "&H0000FFFF",  # AMARILLO
+            "OutlineColour": "&H00000000",
+            "Outline": "1",
+            "Shadow": "1",
+            "Bold": "0",
+            "Alignment": "6",  # Centro medio-arriba
+            "MarginV": "100",
+        },
+        "tiny": {
+            "FontName": "Arial",
+            "FontSize": "8",
+            "PrimaryColour": "&H0000FFFF",  # AMARILLO
+            "OutlineColour": "&H00000000",
+            "Outline": "1",
+            "Shadow": "0",
+            "Bold": "0",
+            "Alignment": "6",  # Centro medio-arriba
+            "MarginV": "100",
+        },
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_binary(name: str) -> str:
+    """
+    Resolve `name` (ffmpeg/ffprobe) to an absolute path once per process.
+
+    Falls back to the bare name so subprocess still searches PATH (and raises
+    the usual FileNotFoundError) when the binary is not installed.
+    """
+    return shutil.which(name) or name
+
+
+# Solo errores en stderr: el output capturado de cada encode queda en pocos bytes
+# en lugar de acumular banner + estadísticas de progreso en memoria.
+_FFMPEG_QUIET_ARGS = ("-hide_banner", "-loglevel", "error", "-nostats")
+
+# Fragmentos fijos de los comandos de export (se expanden con * al armar cmd)
+_AUDIO_ENCODER_ARGS = ("-c:a", "aac")
+_STREAM_COPY_ARGS = ("-c", "copy", "-avoid_negative_ts", "make_zero")
+
+
+def _decode_ffmpeg_output(output: bytes) -> str:
+    """
+    Decode captured ffmpeg/ffprobe output for logging.
+
+    Output is captured as raw bytes and only decoded when it is actually
+    needed (error paths), instead of paying text decoding on every run.
+    """
+    return output.decode("utf-8", errors="replace")
+
+
+# Encoders H.264 por hardware, en orden de preferencia (NVIDIA, Intel, macOS).
+# VAAPI queda fuera: requiere hwupload y device explícito en el filtergraph.
+_HW_ENCODER_CANDIDATES = ("h264_nvenc", "h264_qsv", "h264_videotoolbox")
+
+# Un driver colgado puede bloquear la prueba de encoder; tras esto se descarta
+_HW_ENCODER_PROBE_TIMEOUT = 10
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """
+    Return the first hardware H.264 encoder that can actually encode here.
+
+    Being listed in `ffmpeg -encoders` is not enough (NVENC is compiled into
+    most builds even without a GPU), so each candidate is tried on a tiny
+    synthetic clip. Returns None if none works.
+    """
+    try:
+        listed = subprocess.run(
+            [_resolve_binary("ffmpeg"), "-hide_banner", "-encoders"],
+            capture_output=True,
+            check=False,
+        ).stdout
+    except OSError:
+        return None
+
+    for encoder in _HW_ENCODER_CANDIDATES:
+        if encoder.encode() not in listed:
+            continue
+        try:
+            probe = subprocess.run(
+                [
+                    _resolve_binary("ffmpeg"),
+                    *_FFMPEG_QUIET_ARGS,
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=black:s=256x256:d=0.1",
+                    "-c:v",
+                    encoder,
+                    "-f",
+                    "null",
+                    "-",
+                ],
+                capture_output=True,
+                check=False,
+                timeout=_HW_ENCODER_PROBE_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if probe.returncode == 0:
+            return encoder
+    return None
+
+
+def _video_encoder_args(encoder: str, crf: int) -> list[str]:
+    """
+    Build the video codec arguments for `encoder`, mapping CRF to its quality knob.
+    """
+    if encoder == "h264_nvenc":
+        return ["-c:v", encoder, "-preset", "p4", "-rc", "vbr", "-cq", str(crf)]
+    if encoder == "h264_qsv":
+        return ["-c:v", encoder, "-preset", "fast", "-global_quality", str(crf)]
+    if encoder == "h264_videotoolbox":
+        # VideoToolbox no tiene modo CRF; uso un bitrate fijo razonable para 1080p
+        return ["-c:v", encoder, "-b:v", "6M"]
+    return ["-c:v", "libx264", "-preset", "fast", "-crf", str(crf)]
+
+
+# Filtros de ffmpeg por aspect ratio: crop al centro + resize
+_ASPECT_FILTERS: Mapping[str, str] = MappingProxyType(
+    {
+        # Vertical (para Instagram Reels, TikTok, YouTube Shorts)
+        "9:16": "crop=ih*9/16:ih,scale=1080:1920",
+        # Cuadrado (para Instagram post)
+        "1:1": "crop=ih:ih,scale=1080:1080",
+        # Horizontal estándar (ya suele ser así, pero por si acaso)
+        "16:9": "scale=1920:1080",
+    }
+)
+
+# Coordenadas de overlay del logo (margen de 20px) por posición
+_LOGO_POSITIONS: Mapping[str, str] = MappingProxyType(
+    {
+        "top-right": "W-w-20:20",
+        "top-left": "20:20",
+        "bottom-right": "W-w-20:H-h-20",
+        "bottom-left": "20:H-h-20",
+    }
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Run ffprobe on `path` and return its raw JSON output (bytes).
+
+    `mtime_ns` and `size` are only part of the cache key: if the file changes,
+    the key changes and ffprobe runs again. Failures raise and are not cached.
+    """
+    cmd = [
+        _resolve_binary("ffprobe"),
+        "-v",
+        "quiet",
+        # Solo lee el contenedor (no decodifica), un thread es suficiente
+        "-threads",
+        "1",
+        "-print_format",
+        "json",
+        "-show_format",
+        "-show_streams",
+        path,
+    ]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return result.stdout
+
+
+def _resolve_export_workers(workers: int) -> int:
+    """
+    Resolve how many clips are exported in parallel.
+
+    Args:
+        workers: 0=auto (half the CPUs), positive=specific count
+
+    Returns:
+        Worker count (at least 1)
+    """
+    if workers > 0:
+        return workers
+    cpu_count = os.cpu_count() or 4
+    return max(1, cpu_count // 2)
+
+
 class VideoExporter:
     """
     Exporto clips de video usando ffmpeg
@@ -95,7 +353,9 @@ class VideoExporter:
         """
         try:
             result = subprocess.run(
-                ["ffmpeg", "-version"], capture_output=True, text=True, check=False
+                [_resolve_binary("ffmpeg"), "-version"],
+                capture_output=True,
+                check=False,
             )
             return result.returncode == 0
         except FileNotFoundError:
@@ -128,6 +388,9 @@ class VideoExporter:
         # Video quality and performance
         video_crf: int = 23,
         ffmpeg_threads: int = 0,
+        export_workers: int = 1,
+        fast_trim: bool = False,
+        hardware_encoding: bool = False,
         # Subtitle formatting
         subtitle_max_chars_per_line: int = 42,
         subtitle_max_duration: float = 5.0,
@@ -156,10 +419,20 @@ class VideoExporter:
             logo_scale: Escala del logo relativa al ancho del video (0.1 = 10%).
             trim_ms_start: Máximo silencio (ms) a conservar antes del habla (requiere transcript_path).
             trim_ms_end: Máximo silencio (ms) a conservar después del habla (requiere transcript_path).
+            export_workers: Clips exportados en paralelo (1 = secuencial, 0 = auto: mitad de CPUs).
+                Con ffmpeg_threads=0 (o negativo) los threads de CPU se reparten entre
+                los workers. Con face tracking cada worker corre su propio FaceReframer
+                (OpenCV/MediaPipe) en su thread, así que también se paraleliza la
+                detección de rostros (más CPU y memoria por worker).
+            fast_trim: Si True y el clip no lleva subtítulos, logo ni cambio de aspect
+                ratio, copia los streams sin re-codificar (mucho más rápido, pero el
+                corte se ajusta al keyframe más cercano).
+            hardware_encoding: Si True, usa un encoder H.264 por hardware (NVENC, QSV,
+                VideoToolbox) si hay uno funcionando; si no, libx264.
             flat_output: Si True, escribe directamente en output_dir sin crear subcarpeta.
 
         Returns:
-            Lista de rutas a los clips exportados
+            Lista de rutas a los clips exportados (en el mismo orden que `clips`)
         """
         video_path = Path(video_path)
 
@@ -179,12 +452,8 @@ class VideoExporter:
 
         logger.info(f"Exportando clips a: {video_output_dir}")
 
-        exported_clips = []
-
         resolved_logo_path = None
         if add_logo:
-            from src.utils.logo import coerce_logo_file
-
             resolved_logo_path = coerce_logo_file(logo_path)
             if not resolved_logo_path:
                 logger.warning(
@@ -192,13 +461,45 @@ class VideoExporter:
                 )
                 add_logo = False
 
-        # Progress bar
-        with Progress() as progress:
+        # Parseo la transcripción una sola vez para todos los clips
+        # (speech-aware trimming y subtítulos la consultan por clip)
+        transcript_data: Optional[dict] = None
+        if transcript_path and (add_subtitles or trim_ms_start > 0 or trim_ms_end > 0):
+            try:
+                transcript_data = self.subtitle_generator.load_transcript(
+                    transcript_path
+                )
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not preload transcript {transcript_path}: {e}")
+
+        video_encoder = self._resolve_video_encoder(hardware_encoding)
+
+        # Cada ffmpeg corre en su propio proceso, así que un pool de threads basta
+        # para exportar varios clips a la vez. Acoto el total de threads de ffmpeg
+        # para no sobresuscribir la CPU cuando hay más de un worker.
+        workers = min(_resolve_export_workers(export_workers), max(1, len(clips)))
+        # Sin un número explícito de threads (auto o "todas menos N") reparto ese
+        # presupuesto entre los workers para no sobre-suscribir la CPU
+        if workers > 1 and ffmpeg_threads <= 0:
+            budget = _resolve_ffmpeg_threads(ffmpeg_threads) or os.cpu_count() or 4
+            ffmpeg_threads = max(1, budget // workers)
+        if workers > 1:
+            logger.info(f"Exporting with {workers} parallel workers")
+
+        # Progress bar. El único temporal por clip es el video reframeado por
+        # face tracking: va a un directorio en el temp del sistema que se borra
+        # completo al terminar (incluso si algo falla a mitad del lote). Sin face
+        # tracking no creo ninguno.
+        if enable_face_tracking and aspect_ratio == "9:16":
+            clip_temp_dir = tempfile.TemporaryDirectory(prefix="cliperai_")
+        else:
+            clip_temp_dir = nullcontext()
+        with clip_temp_dir as temp_dir, Progress() as progress:
             task = progress.add_task(
                 f"[cyan]Exporting {len(clips)} clips...", total=len(clips)
             )
 
-            for clip in clips:
+            def export_one(clip: dict) -> Optional[Path]:
                 # Determinar carpeta de salida según estilo (si aplica)
                 clip_output_dir = video_output_dir
 
@@ -210,14 +511,16 @@ class VideoExporter:
                     clip_output_dir = video_output_dir / style
                     clip_output_dir.mkdir(parents=True, exist_ok=True)
 
-                clip_path = self._export_single_clip(
+                return self._export_single_clip(
                     video_path=video_path,
                     clip=clip,
                     video_name=video_name,
                     output_dir=clip_output_dir,
+                    temp_dir=Path(temp_dir) if temp_dir else None,
                     aspect_ratio=aspect_ratio,
                     add_subtitles=add_subtitles,
                     transcript_path=transcript_path,
+                    transcript_data=transcript_data,
                     subtitle_style=subtitle_style,
                     custom_style=custom_style,
                     trim_ms_start=trim_ms_start,
@@ -231,14 +534,23 @@ class VideoExporter:
                     logo_scale=logo_scale,
                     video_crf=video_crf,
                     ffmpeg_threads=ffmpeg_threads,
+                    fast_trim=fast_trim,
+                    video_encoder=video_encoder,
                     subtitle_max_chars_per_line=subtitle_max_chars_per_line,
                     subtitle_max_duration=subtitle_max_duration,
                 )
 
-                if clip_path:
-                    exported_clips.append(str(clip_path))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(export_one, clip) for clip in clips]
+                for _ in as_completed(futures):
+                    progress.update(task, advance=1)
 
-                progress.update(task, advance=1)
+            # Mantengo el orden original de los clips
+            exported_clips = [
+                str(clip_path)
+                for clip_path in (future.result() for future in futures)
+                if clip_path
+            ]
 
         return exported_clips
 
@@ -258,6 +570,7 @@ class VideoExporter:
         logo_scale: float = 0.1,
         video_crf: int = 23,
         ffmpeg_threads: int = 0,
+        hardware_encoding: bool = False,
         subtitle_max_chars_per_line: int = 42,
         subtitle_max_duration: float = 5.0,
         flat_output: bool = False,
@@ -272,6 +585,7 @@ class VideoExporter:
         con subtítulos/logo) y puede aplicar recorte "speech-aware" si hay transcript.
 
         Args:
+            hardware_encoding: Si True, usa un encoder H.264 por hardware si hay uno.
             flat_output: Si True, escribe directamente en output_dir sin crear subcarpeta.
         """
         video_path_p = Path(video_path)
@@ -294,8 +608,6 @@ class VideoExporter:
         has_subtitles = bool(srt_file and srt_file.exists())
         resolved_logo_path: Optional[str] = None
         if add_logo:
-            from src.utils.logo import coerce_logo_file
-
             resolved_logo_path = coerce_logo_file(logo_path)
             if not resolved_logo_path:
                 logger.warning(
@@ -365,87 +677,12 @@ class VideoExporter:
                     "Failed to regenerate trimmed SRT; subtitles may be desynced if trimming occurred."
                 )
 
-        # Use a two-step process when both logo and subtitles are enabled to avoid subtitle duplication bugs.
-        needs_two_steps = has_logo and has_subtitles
-        temp_path_step1 = video_output_dir / f"{output_path.stem}_step1_temp.mp4"
-
         try:
-            if needs_two_steps:
-                logger.info(
-                    "Applying logo first, then subtitles in a second step (shorts export)."
-                )
+            video_encoder = self._resolve_video_encoder(hardware_encoding)
 
-                logo_chains, logo_out = self._get_logo_overlay_filter(
-                    video_stream="[0:v]",
-                    logo_stream="[1:v]",
-                    position=logo_position,
-                    scale=logo_scale,
-                )
-                resolved_threads = _resolve_ffmpeg_threads(ffmpeg_threads)
-                # Build command with trim args before -i for fast seeking
-                cmd1 = ["ffmpeg"]
-                cmd1.extend(trim_args)  # -ss before -i for fast seeking
-                cmd1.extend(["-i", str(video_path_p)])
-                cmd1.extend(["-i", str(resolved_logo_path)])
-                cmd1.extend(duration_args)  # -t after inputs
-                cmd1.extend(
-                    [
-                        "-filter_complex",
-                        ";".join(logo_chains),
-                        "-map",
-                        logo_out,
-                        "-map",
-                        "0:a?",
-                        "-sn",
-                        "-c:v",
-                        "libx264",
-                        "-c:a",
-                        "aac",
-                        "-preset",
-                        "fast",
-                        "-crf",
-                        str(video_crf),
-                        "-threads",
-                        str(resolved_threads),
-                        "-y",
-                        str(temp_path_step1),
-                    ]
-                )
-                result1 = subprocess.run(
-                    cmd1, capture_output=True, text=True, check=False
-                )
-                if result1.returncode != 0:
-                    raise RuntimeError(
-                        f"Error exporting short (step 1): {result1.stderr}"
-                    )
-
-                subtitle_filter = self._get_subtitle_filter(
-                    str(srt_file), subtitle_style, custom_style
-                )
-                cmd2 = [
-                    "ffmpeg",
-                    "-i",
-                    str(temp_path_step1),
-                    "-vf",
-                    subtitle_filter,
-                    "-c:a",
-                    "copy",
-                    "-y",
-                    str(output_path),
-                ]
-                result2 = subprocess.run(
-                    cmd2, capture_output=True, text=True, check=False
-                )
-                if result2.returncode != 0:
-                    raise RuntimeError(
-                        f"Error exporting short (step 2): {result2.stderr}"
-                    )
-
-                return str(output_path)
-
-            # Single-step path (logo only, subtitles only, or neither).
+            # Single pass: logo and subtitles share one filtergraph.
             # Build command with trim args
-            cmd = ["ffmpeg"]
+            cmd = [_resolve_binary("ffmpeg"), *_FFMPEG_QUIET_ARGS]
             cmd.extend(trim_args)  # -ss before -i for fast seeking
 
             if has_logo:
@@ -455,11 +692,20 @@ class VideoExporter:
                     position=logo_position,
                     scale=logo_scale,
                 )
+                if has_subtitles:
+                    # Subtitles go last so they are drawn on top of the logo
+                    subtitle_filter = self._get_subtitle_filter(
+                        str(srt_file), subtitle_style, custom_style
+                    )
+                    logo_chains.append(f"{logo_out}{subtitle_filter}[v_final]")
+                    logo_out = "[v_final]"
                 cmd.extend(["-i", str(video_path_p)])
                 cmd.extend(["-i", str(resolved_logo_path)])
                 cmd.extend(duration_args)  # -t after inputs
                 cmd.extend(
                     [
+                        "-filter_complex_threads",
+                        str(_resolve_filter_threads(ffmpeg_threads)),
                         "-filter_complex",
                         ";".join(logo_chains),
                         "-map",
@@ -472,7 +718,16 @@ class VideoExporter:
                 )
                 cmd.extend(["-i", str(video_path_p)])
                 cmd.extend(duration_args)
-                cmd.extend(["-vf", subtitle_filter, "-map", "0:v"])
+                cmd.extend(
+                    [
+                        "-filter_threads",
+                        str(_resolve_filter_threads(ffmpeg_threads)),
+                        "-vf",
+                        subtitle_filter,
+                        "-map",
+                        "0:v",
+                    ]
+                )
             else:
                 cmd.extend(["-i", str(video_path_p)])
                 cmd.extend(duration_args)
@@ -484,14 +739,8 @@ class VideoExporter:
                     "-map",
                     "0:a?",
                     "-sn",
-                    "-c:v",
-                    "libx264",
-                    "-c:a",
-                    "aac",
-                    "-preset",
-                    "fast",
-                    "-crf",
-                    str(video_crf),
+                    *_video_encoder_args(video_encoder, video_crf),
+                    *_AUDIO_ENCODER_ARGS,
                     "-threads",
                     str(resolved_threads),
                     "-y",
@@ -499,26 +748,39 @@ class VideoExporter:
                 ]
             )
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            result = subprocess.run(cmd, capture_output=True, check=False)
             if result.returncode != 0:
-                raise RuntimeError(f"Error exporting short: {result.stderr}")
+                output_path.unlink(missing_ok=True)
+                raise RuntimeError(
+                    f"Error exporting short: {_decode_ffmpeg_output(result.stderr)}"
+                )
 
             return str(output_path)
 
         finally:
-            if temp_path_step1.exists():
-                temp_path_step1.unlink()
             if temp_srt_path and temp_srt_path.exists():
                 temp_srt_path.unlink()
 
+    def _resolve_video_encoder(self, hardware_encoding: bool) -> str:
+        """
+        Elijo el encoder de video: hardware si se pidió y hay uno usable, si no libx264
+        """
+        if not hardware_encoding:
+            return "libx264"
+        encoder = _detect_hw_encoder()
+        if encoder is None:
+            logger.info("No hardware H.264 encoder available; using libx264")
+            return "libx264"
+        logger.info(f"Using hardware encoder: {encoder}")
+        return encoder
+
     def _escape_ffmpeg_filter_path(self, path: str) -> str:
         """
         Escapa una ruta para usarse dentro de un string de filtro de ffmpeg.
 
         Nota: esto está pensado para filtros como `subtitles=...` y `movie=...`.
         """
-        # Order matters: escape backslashes first.
-        return path.replace("\\", "\\\\").replace(":", "\\:").replace("'", "\\'")
+        return _FILTER_PATH_ESCAPE_RE.sub(r"\\\1", path)
 
     def _export_single_clip(
         self,
@@ -526,9 +788,11 @@ class VideoExporter:
         clip: dict,
         video_name: str,
         output_dir: Path,
+        temp_dir: Optional[Path] = None,
         aspect_ratio: Optional[str] = None,
         add_subtitles: bool = False,
         transcript_path: Optional[str] = None,
+        transcript_data: Optional[dict] = None,
         subtitle_style: str = "default",
         custom_style: Optional[dict[str, str]] = None,
         enable_face_tracking: bool = False,
@@ -544,6 +808,8 @@ class VideoExporter:
         # Video quality and performance
         video_crf: int = 23,
         ffmpeg_threads: int = 0,
+        fast_trim: bool = False,
+        video_encoder: str = "libx264",
         # Subtitle formatting
         subtitle_max_chars_per_line: int = 42,
         subtitle_max_duration: float = 5.0,
@@ -560,6 +826,7 @@ class VideoExporter:
                 clip_end=end_time,
                 trim_ms_start=trim_ms_start,
                 trim_ms_end=trim_ms_end,
+                transcript_data=transcript_data,
             )
             if new_start != start_time or new_end != end_time:
                 logger.info(
@@ -582,8 +849,8 @@ class VideoExporter:
         output_path = output_dir / output_filename
 
         # Define paths for temporary files
-        temp_path_step1 = output_dir / f"{clip_id}_step1_temp.mp4"
-        temp_reframed_path = output_dir / f"{clip_id}_reframed_temp.mp4"
+        work_dir = temp_dir if temp_dir is not None else output_dir
+        temp_reframed_path = work_dir / f"{clip_id}_reframed_temp.mp4"
 
         subtitle_file = None
         if add_subtitles and transcript_path:
@@ -596,6 +863,7 @@ class VideoExporter:
                 output_path=str(subtitle_file),
                 max_chars_per_line=subtitle_max_chars_per_line,
                 max_duration=subtitle_max_duration,
+                transcript_data=transcript_data,
             )
 
         video_to_process = video_path
@@ -615,6 +883,11 @@ class VideoExporter:
                     target_resolution=(1080, 1920),
                     start_time=start_time,
                     end_time=end_time,
+                    threads=_resolve_ffmpeg_threads(ffmpeg_threads),
+                    # Intermedio que se re-codifica enseguida: encode rápido y
+                    # CRF bajo para no sumar pérdida de generación
+                    preset="ultrafast",
+                    crf=18,
                 )
                 video_to_process = temp_reframed_path
                 aspect_ratio = None
@@ -625,21 +898,14 @@ class VideoExporter:
                 )
                 video_to_process = video_path
 
-        # Architectural Decision: Use a two-step process when both logo and subtitles are enabled.
-        needs_two_steps = (
-            add_logo
-            and bool(logo_path)
-            and add_subtitles
-            and subtitle_file
-            and subtitle_file.exists()
+        # Subtítulos, logo y aspect ratio se resuelven en un único filtergraph:
+        # el video se decodifica/codifica una sola vez y no hay archivo intermedio.
+        burn_subtitles = bool(
+            add_subtitles and subtitle_file and subtitle_file.exists()
         )
 
-        # Determine the output target for the first command
-        first_step_output = temp_path_step1 if needs_two_steps else output_path
-
         try:
-            # --- STEP 1: Process all filters EXCEPT subtitles ---
-            inputs, filter_chains = [], []
+            inputs = []
             using_face_tracking = (
                 video_to_process == temp_reframed_path and temp_reframed_path.exists()
             )
@@ -661,8 +927,6 @@ class VideoExporter:
                 logo_input_idx = audio_input_idx + 1
                 logger.info(f"Adding logo from {logo_path}")
 
-            last_video_stream = f"[{video_input_idx}:v]"
-
             # Add filters that can be chained simply
             simple_filters = []
             if aspect_ratio and not using_face_tracking:
@@ -670,127 +934,183 @@ class VideoExporter:
                 if aspect_filter:
                     simple_filters.append(aspect_filter)
 
-            # If we are NOT doing two steps, add subtitles here
-            if (
-                not needs_two_steps
-                and add_subtitles
-                and subtitle_file
-                and subtitle_file.exists()
-            ):
+            subtitle_filter = None
+            if burn_subtitles:
                 subtitle_filter = self._get_subtitle_filter(
                     str(subtitle_file), subtitle_style, custom_style
                 )
-                simple_filters.append(subtitle_filter)
 
-            cmd = ["ffmpeg", *inputs]
+            build_cmd = functools.partial(
+                self._build_clip_cmd,
+                inputs=inputs,
+                output_path=output_path,
+                video_input_idx=video_input_idx,
+                audio_input_idx=audio_input_idx,
+                logo_input_idx=logo_input_idx,
+                simple_filters=simple_filters,
+                using_face_tracking=using_face_tracking,
+                logo_position=logo_position,
+                logo_scale=logo_scale,
+                video_crf=video_crf,
+                ffmpeg_threads=ffmpeg_threads,
+                fast_trim=fast_trim,
+                video_encoder=video_encoder,
+            )
+            result = subprocess.run(
+                build_cmd(subtitle_filter=subtitle_filter),
+                capture_output=True,
+                check=False,
+            )
 
-            # If a logo is present, we must use filter_complex
-            if logo_input_idx != -1:
-                # Apply simple filters first, if any
-                if simple_filters:
-                    filter_chains.append(
-                        f"{last_video_stream}{','.join(simple_filters)}[v_filtered]"
-                    )
-                    last_video_stream = "[v_filtered]"
+            # Un burn de subtítulos fallido (SRT roto, ffmpeg sin libass, fuentes)
+            # no debe tirar el clip entero: reintento una vez sin subtítulos.
+            if result.returncode != 0 and subtitle_filter:
+                logger.warning(
+                    f"Subtitle burn failed for clip {clip_id}, "
+                    f"exporting without subtitles: "
+                    f"{_decode_ffmpeg_output(result.stderr)}"
+                )
+                result = subprocess.run(
+                    build_cmd(subtitle_filter=None), capture_output=True, check=False
+                )
 
-                logo_stream = f"[{logo_input_idx}:v]"
-                logo_chains, last_video_stream = self._get_logo_overlay_filter(
-                    video_stream=last_video_stream,
-                    logo_stream=logo_stream,
-                    position=logo_position,
-                    scale=logo_scale,
+            if result.returncode != 0:
+                logger.error(
+                    f"Error in video processing for clip {clip_id}: "
+                    f"{_decode_ffmpeg_output(result.stderr)}"
                 )
-                filter_chains.extend(logo_chains)
+                # ffmpeg deja un archivo parcial; lo borro para que no pase por exportado
+                output_path.unlink(missing_ok=True)
+                return None
+
+            logger.info(f"✓ Exported clip {clip_id}: {output_path.name}")
+            return output_path
+
+        finally:
+            # Cleanup all temporary files (no esperamos al fin del lote para
+            # no acumular intermedios de tamaño completo en disco)
+            temp_reframed_path.unlink(missing_ok=True)
 
+    def _build_clip_cmd(
+        self,
+        *,
+        inputs: list[str],
+        output_path: Path,
+        video_input_idx: int,
+        audio_input_idx: int,
+        logo_input_idx: int,
+        simple_filters: list[str],
+        subtitle_filter: Optional[str],
+        using_face_tracking: bool,
+        logo_position: str,
+        logo_scale: float,
+        video_crf: int,
+        ffmpeg_threads: int,
+        fast_trim: bool,
+        video_encoder: str,
+    ) -> list[str]:
+        """
+        Armo el comando ffmpeg de un clip: aspect ratio, logo y subtítulos en un
+        único filtergraph (o stream copy si no hay nada que filtrar).
+        """
+        simple_filters = list(simple_filters)
+        filter_chains: list[str] = []
+        last_video_stream = f"[{video_input_idx}:v]"
+
+        cmd = [_resolve_binary("ffmpeg"), *_FFMPEG_QUIET_ARGS, *inputs]
+
+        # Fast trim: sin filtros de video no hace falta re-codificar, copio los
+        # streams tal cual. El corte se ajusta al keyframe más cercano.
+        stream_copy = (
+            fast_trim
+            and logo_input_idx == -1
+            and not simple_filters
+            and not subtitle_filter
+            and not using_face_tracking
+        )
+
+        # If a logo is present, we must use filter_complex
+        if logo_input_idx != -1:
+            # Apply simple filters first, if any
+            if simple_filters:
+                filter_chains.append(
+                    f"{last_video_stream}{','.join(simple_filters)}[v_filtered]"
+                )
+                last_video_stream = "[v_filtered]"
+
+            logo_stream = f"[{logo_input_idx}:v]"
+            logo_chains, last_video_stream = self._get_logo_overlay_filter(
+                video_stream=last_video_stream,
+                logo_stream=logo_stream,
+                position=logo_position,
+                scale=logo_scale,
+            )
+            filter_chains.extend(logo_chains)
+
+            # Subtitles go last so they are drawn on top of the logo
+            if subtitle_filter:
+                filter_chains.append(f"{last_video_stream}{subtitle_filter}[v_final]")
+                last_video_stream = "[v_final]"
+
+            cmd.extend(
+                [
+                    "-filter_complex_threads",
+                    str(_resolve_filter_threads(ffmpeg_threads)),
+                    "-filter_complex",
+                    ";".join(filter_chains),
+                    "-map",
+                    last_video_stream,
+                ]
+            )
+
+        else:
+            if subtitle_filter:
+                simple_filters.append(subtitle_filter)
+            if simple_filters:
                 cmd.extend(
                     [
-                        "-filter_complex",
-                        ";".join(filter_chains),
+                        "-filter_threads",
+                        str(_resolve_filter_threads(ffmpeg_threads)),
+                        "-vf",
+                        ",".join(simple_filters),
                         "-map",
-                        last_video_stream,
+                        f"{video_input_idx}:v",
                     ]
                 )
-
-            elif simple_filters:
-                cmd.extend(
-                    ["-vf", ",".join(simple_filters), "-map", f"{video_input_idx}:v"]
-                )
             else:
                 cmd.extend(["-map", f"{video_input_idx}:v"])
 
-            # BUGFIX: Add -sn flag when doing two-step processing to discard any subtitle streams
-            # This prevents FFmpeg from preserving subtitle metadata that would cause duplication in Step 2
-            if needs_two_steps:
-                cmd.extend(["-sn"])  # Discard subtitle streams
+        # BUGFIX: Discard source subtitle streams when burning subtitles so they
+        # are not carried into the output alongside the burned-in ones.
+        if subtitle_filter:
+            cmd.extend(["-sn"])
 
-            resolved_threads = _resolve_ffmpeg_threads(ffmpeg_threads)
+        resolved_threads = _resolve_ffmpeg_threads(ffmpeg_threads)
+        if stream_copy:
             cmd.extend(
                 [
                     "-map",
                     f"{audio_input_idx}:a?",
-                    "-c:v",
-                    "libx264",
-                    "-c:a",
-                    "aac",
-                    "-preset",
-                    "fast",
-                    "-crf",
-                    str(video_crf),
-                    "-threads",
-                    str(resolved_threads),
+                    *_STREAM_COPY_ARGS,
                     "-y",
-                    str(first_step_output),
+                    str(output_path),
                 ]
             )
-
-            result1 = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            if result1.returncode != 0:
-                logger.error(
-                    f"Error in video processing (Step 1) for clip {clip_id}: {result1.stderr}"
-                )
-                return None
-
-            # --- STEP 2: Add subtitles if required in a separate, safe step ---
-            if needs_two_steps:
-                logger.info(
-                    "Applying subtitles in a second step to avoid duplication bug."
-                )
-                subtitle_filter = self._get_subtitle_filter(
-                    str(subtitle_file), subtitle_style, custom_style
-                )
-                cmd2 = [
-                    "ffmpeg",
-                    "-i",
-                    str(first_step_output),
-                    "-vf",
-                    subtitle_filter,
-                    "-c:a",
-                    "copy",
+        else:
+            cmd.extend(
+                [
+                    "-map",
+                    f"{audio_input_idx}:a?",
+                    *_video_encoder_args(video_encoder, video_crf),
+                    *_AUDIO_ENCODER_ARGS,
+                    "-threads",
+                    str(resolved_threads),
                     "-y",
                     str(output_path),
                 ]
+            )
 
-                result2 = subprocess.run(
-                    cmd2, capture_output=True, text=True, check=False
-                )
-                if result2.returncode != 0:
-                    logger.error(
-                        f"Error adding subtitles (Step 2) for clip {clip_id}: {result2.stderr}"
-                    )
-                    first_step_output.replace(
-                        output_path
-                    )  # Fallback to the version without subtitles
-                    return output_path
-
-            logger.info(f"✓ Exported clip {clip_id}: {output_path.name}")
-            return output_path
-
-        finally:
-            # Cleanup all temporary files
-            if temp_path_step1.exists():
-                temp_path_step1.unlink()
-            if temp_reframed_path and temp_reframed_path.exists():
-                temp_reframed_path.unlink()
+        return cmd
 
     def _get_logo_overlay_filter(
         self,
@@ -812,13 +1132,7 @@ class VideoExporter:
         Returns:
             (filter_chains, output_stream_label)
         """
-        positions = {
-            "top-right": "W-w-20:20",
-            "top-left": "20:20",
-            "bottom-right": "W-w-20:H-h-20",
-            "bottom-left": "20:H-h-20",
-        }
-        pos = positions.get(position, positions["top-right"])
+        pos = _LOGO_POSITIONS.get(position, _LOGO_POSITIONS["top-right"])
 
         # 1) Escalo el logo relativo al ancho del video (iw en scale2ref) y preservo aspecto
         #    En scale2ref: iw/ih = dimensiones del video de referencia, main_w/main_h = dimensiones del logo
@@ -847,25 +1161,12 @@ class VideoExporter:
         Returns:
             String de filtro para ffmpeg, o None si no se reconoce
         """
-        if aspect_ratio == "9:16":
-            # Vertical (para Instagram Reels, TikTok, YouTube Shorts)
-            # Crop al centro y resize a 1080x1920
-            return "crop=ih*9/16:ih,scale=1080:1920"
-
-        elif aspect_ratio == "1:1":
-            # Cuadrado (para Instagram post)
-            # Crop al centro y resize a 1080x1080
-            return "crop=ih:ih,scale=1080:1080"
-
-        elif aspect_ratio == "16:9":
-            # Horizontal estándar (ya suele ser así, pero por si acaso)
-            return "scale=1920:1080"
-
-        else:
+        aspect_filter = _ASPECT_FILTERS.get(aspect_ratio)
+        if aspect_filter is None:
             logger.warning(
                 f"Aspect ratio '{aspect_ratio}' no reconocido, manteniendo original"
             )
-            return None
+        return aspect_filter
 
     def _get_subtitle_filter(
         self,
@@ -886,97 +1187,34 @@ class VideoExporter:
         """
         subtitle_path_escaped = self._escape_ffmpeg_filter_path(subtitle_path)
 
-        # Estilos predefinidos para subtítulos
-        # TODOS con texto AMARILLO para máxima visibilidad
-        styles = {
-            "default": {
-                "FontName": "Arial",
-                "FontSize": "18",
-                "PrimaryColour": "&H0000FFFF",  # AMARILLO
-                "OutlineColour": "&H00000000",  # Negro
-                "Outline": "2",
-                "Shadow": "1",
-                "Bold": "0",
-            },
-            "bold": {
-                "FontName": "Arial",
-                "FontSize": "22",
-                "PrimaryColour": "&H0000FFFF",  # AMARILLO
-                "OutlineColour": "&H00000000",
-                "Outline": "2",
-                "Shadow": "1",
-                "Bold": "-1",
-            },
-            "yellow": {
-                "FontName": "Arial",
-                "FontSize": "20",
-                "PrimaryColour": "&H0000FFFF",  # AMARILLO
-                "OutlineColour": "&H00000000",
-                "Outline": "2",
-                "Shadow": "1",
-                "Bold": "-1",
-            },
-            "tiktok": {
-                "FontName": "Arial",
-                "FontSize": "20",
-                "PrimaryColour": "&H0000FFFF",  # AMARILLO
-                "OutlineColour": "&H00000000",
-                "Outline": "2",
-                "Shadow": "2",
-                "Bold": "-1",
-                "Alignment": "10",  # Centro arriba
-            },
-            "small": {
-                "FontName": "Arial",
-                "FontSize": "10",
-                "PrimaryColour": "&H0000FFFF",  # AMARILLO
-                "OutlineColour": "&H00000000",
-                "Outline": "1",
-                "Shadow": "1",
-                "Bold": "0",
-                "Alignment": "6",  # Centro medio-arriba
-                "MarginV": "100",
-            },
-            "tiny": {
-                "FontName": "Arial",
-                "FontSize": "8",
-                "PrimaryColour": "&H0000FFFF",  # AMARILLO
-                "OutlineColour": "&H00000000",
-                "Outline": "1",
-                "Shadow": "0",
-                "Bold": "0",
-                "Alignment": "6",  # Centro medio-arriba
-                "MarginV": "100",
-            },
-        }
-
         # Use custom_style if provided and style is "__custom__"
         if style == "__custom__" and custom_style:
             selected_style = custom_style
         else:
-            selected_style = styles.get(style, styles["default"])
+            selected_style = _SUBTITLE_STYLES.get(style, _SUBTITLE_STYLES["default"])
 
         # Construyo el filtro subtitles con el estilo
         # subtitles filter quema los subtítulos directamente en el video
         # Wrapeamos el path con comillas simples para manejar espacios
-        subtitle_filter = f"subtitles='{subtitle_path_escaped}':force_style='"
-        subtitle_filter += f"FontName={selected_style['FontName']},"
-        subtitle_filter += f"FontSize={selected_style['FontSize']},"
-        subtitle_filter += f"PrimaryColour={selected_style['PrimaryColour']},"
-        subtitle_filter += f"OutlineColour={selected_style['OutlineColour']},"
-        subtitle_filter += f"Outline={selected_style['Outline']},"
-        subtitle_filter += f"Shadow={selected_style['Shadow']},"
-        subtitle_filter += f"Bold={selected_style['Bold']}"
+        style_parts = [
+            f"FontName={selected_style['FontName']}",
+            f"FontSize={selected_style['FontSize']}",
+            f"PrimaryColour={selected_style['PrimaryColour']}",
+            f"OutlineColour={selected_style['OutlineColour']}",
+            f"Outline={selected_style['Outline']}",
+            f"Shadow={selected_style['Shadow']}",
+            f"Bold={selected_style['Bold']}",
+        ]
 
         if "Alignment" in selected_style:
-            subtitle_filter += f",Alignment={selected_style['Alignment']}"
+            style_parts.append(f"Alignment={selected_style['Alignment']}")
 
         if "MarginV" in selected_style:
-            subtitle_filter += f",MarginV={selected_style['MarginV']}"
-
-        subtitle_filter += "'"
+            style_parts.append(f"MarginV={selected_style['MarginV']}")
 
-        return subtitle_filter
+        return (
+            f"subtitles='{subtitle_path_escaped}':force_style='{','.join(style_parts)}'"
+        )
 
     def get_video_info(self, video_path: str) -> dict:
         """
@@ -985,21 +1223,13 @@ class VideoExporter:
         Returns:
             Dict con duration, width, height, fps, etc.
         """
-        cmd = [
-            "ffprobe",
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_format",
-            "-show_streams",
-            str(video_path),
-        ]
-
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Cacheado por (path, mtime, size): los clips de un mismo video no
+            # vuelven a lanzar ffprobe
+            stat = os.stat(video_path)
+            stdout = _probe_cached(str(video_path), stat.st_mtime_ns, stat.st_size)
 
-            data = json.loads(result.stdout)
+            data = loads_json(stdout)
 
             # Extraigo info relevante del video stream
             video_stream = next(
@@ -1023,3 +1253,22 @@ class VideoExporter:
         except Exception as e:
             logger.error(f"Error getting video info: {e}")
             return {}
+
+    def get_video_info_batch(self, video_paths: list[str]) -> dict[str, dict]:
+        """
+        Obtengo información de varios videos lanzando los ffprobe en paralelo
+
+        Cada probe es un proceso independiente, así que corren a la vez (acotado
+        al número de CPUs) y comparten el cache de get_video_info.
+
+        Returns:
+            Dict path → info (mismo formato que get_video_info; {} si falla)
+        """
+        unique_paths = list(dict.fromkeys(str(p) for p in video_paths))
+        if not unique_paths:
+            return {}
+
+        workers = min(len(unique_paths), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            infos = executor.map(self.get_video_info, unique_paths)
+            return dict(zip(unique_paths, infos))
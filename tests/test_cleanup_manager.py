@@ -12,12 +12,26 @@ Covers:
 - Preservation of final outputs when not targeted for deletion
 """
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 
 from src.cleanup_manager import CleanupManager
 
+# Contents of the mock artifact files, encoded once for every fixture instance
+_VIDEO_BYTES = b"\0"
+_CLIP_BYTES = b"\0"
+_TRANSCRIPT_BYTES = b'{"segments": []}'
+_CLIPS_METADATA_BYTES = b'{"clips": []}'
+
+
+def _is_empty(path: Path) -> bool:
+    """True if the directory has no entries (stops at the first one)."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
 
 @pytest.fixture
 def cleanup_test_dirs(tmp_project_dir: Path):
@@ -28,22 +42,27 @@ def cleanup_test_dirs(tmp_project_dir: Path):
         - downloads/: Contains mock video files
         - temp/: Contains transcript and clips metadata files
         - output/: Contains exported clips directories
+
+    The three directories are removed on teardown: pytest keeps the last few
+    tmp_path trees around, and the artifacts are not needed after the test.
     """
     downloads_dir = tmp_project_dir / "downloads"
-    temp_dir = tmp_project_dir / "temp"
+    temp_dir = tmp_project_dir / "temp"  # Already created by tmp_project_dir
     output_dir = tmp_project_dir / "output"
 
-    downloads_dir.mkdir(parents=True, exist_ok=True)
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    downloads_dir.mkdir()
+    output_dir.mkdir()
 
-    return {
+    yield {
         "root": tmp_project_dir,
         "downloads": downloads_dir,
         "temp": temp_dir,
         "output": output_dir,
     }
 
+    for directory in (downloads_dir, temp_dir, output_dir):
+        shutil.rmtree(directory, ignore_errors=True)
+
 
 @pytest.fixture
 def cleanup_manager(cleanup_test_dirs):
@@ -73,34 +92,28 @@ def video_with_artifacts(cleanup_test_dirs, cleanup_manager):
 
     # Create mock files
     video_file = downloads_dir / "test_video.mp4"
-    video_file.write_bytes(b"mock video content" * 100)
+    video_file.write_bytes(_VIDEO_BYTES)
 
     transcript_file = temp_dir / "test_video_transcript.json"
-    transcript_file.write_text('{"segments": []}', encoding="utf-8")
+    transcript_file.write_bytes(_TRANSCRIPT_BYTES)
 
     clips_metadata_file = temp_dir / "test_video_clips.json"
-    clips_metadata_file.write_text('{"clips": []}', encoding="utf-8")
+    clips_metadata_file.write_bytes(_CLIPS_METADATA_BYTES)
 
     # Create output directory with clips
     output_video_dir = output_dir / video_key
     output_video_dir.mkdir(parents=True, exist_ok=True)
     clip_file = output_video_dir / "clip_001.mp4"
-    clip_file.write_bytes(b"mock clip content" * 50)
+    clip_file.write_bytes(_CLIP_BYTES)
 
-    # Register video in state
-    cleanup_manager.state_manager.register_video(
+    # Register video in state (single state write)
+    cleanup_manager.state_manager.register_video_full(
         video_id=video_key,
         filename="test_video.mp4",
         video_path=str(video_file),
-    )
-    cleanup_manager.state_manager.mark_transcribed(video_key, str(transcript_file))
-    cleanup_manager.state_manager.mark_clips_generated(
-        video_key,
+        transcript_path=str(transcript_file),
         clips=[{"clip_id": 1}],
         clips_metadata_path=str(clips_metadata_file),
-    )
-    cleanup_manager.state_manager.mark_clips_exported(
-        video_key,
         exported_paths=[str(clip_file)],
     )
 
@@ -129,6 +142,17 @@ class TestCleanupManagerInitialization:
         assert manager.temp_dir == cleanup_test_dirs["temp"]
         assert manager.output_dir == cleanup_test_dirs["output"]
 
+    def test_cleanup_manager_uses_shared_state_manager(self, cleanup_test_dirs):
+        """Verify the process-wide (test-isolated) StateManager is used."""
+        from src.utils.state_manager import get_state_manager
+
+        manager = CleanupManager()
+
+        assert manager.state_manager is get_state_manager()
+        assert manager.state_manager.settings_file.is_relative_to(
+            cleanup_test_dirs["root"]
+        )
+
     def test_cleanup_manager_default_initialization(self, tmp_project_dir):
         """Verify default directories are set when not provided."""
         manager = CleanupManager()
@@ -185,7 +209,7 @@ class TestGetVideoArtifacts:
 
         # Create orphaned temp file
         temp_file = output_dir / "clip_001_temp.mp4"
-        temp_file.write_bytes(b"temp content" * 100)
+        temp_file.write_bytes(b"\0")
 
         artifacts = cleanup_manager.get_video_artifacts(video_key)
 
@@ -208,10 +232,16 @@ class TestDeleteVideoArtifacts:
         results = cleanup_manager.delete_video_artifacts(video_key)
 
         assert all(results.values())
-        assert not video_with_artifacts["video_file"].exists()
-        assert not video_with_artifacts["transcript_file"].exists()
-        assert not video_with_artifacts["clips_metadata_file"].exists()
-        assert not video_with_artifacts["output_video_dir"].exists()
+        deleted = [
+            video_with_artifacts[key]
+            for key in (
+                "video_file",
+                "transcript_file",
+                "clips_metadata_file",
+                "output_video_dir",
+            )
+        ]
+        assert not any(os.path.lexists(path) for path in deleted)
 
     def test_delete_video_artifacts_selective_cleanup(
         self, cleanup_manager, video_with_artifacts
@@ -326,9 +356,9 @@ class TestDeleteAllProjectData:
         # Directories should exist but be empty (recreated)
         assert cleanup_manager.downloads_dir.exists()
         assert cleanup_manager.output_dir.exists()
-        assert list(cleanup_manager.downloads_dir.iterdir()) == []
+        assert _is_empty(cleanup_manager.downloads_dir)
         # temp dir may have state files, check output is empty
-        assert not list(cleanup_manager.output_dir.iterdir())
+        assert _is_empty(cleanup_manager.output_dir)
 
     def test_delete_all_project_data_dry_run(
         self, cleanup_manager, video_with_artifacts
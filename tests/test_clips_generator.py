@@ -4,11 +4,107 @@ Tests for ClipsGenerator - Automatic clip segmentation using ClipsAI
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.clips_generator import ClipsGenerator, generate_clips_from_transcript
+from src.clips_generator import (
+    ClipFinder,
+    ClipsGenerator,
+    generate_clips_from_transcript,
+)
+
+# Shared mock: built once, reset after every test instead of recreated
+_CLIP_FINDER_MOCK = MagicMock(spec=ClipFinder)
+
+# Transcripts are built and serialized once; tests write the bytes directly
+_TRANSCRIPT_WITH_WORDS = {
+    "video_id": "test_video_001",
+    "language": "es",
+    "segments": [
+        {
+            "start": 0.0,
+            "end": 5.0,
+            "text": "Bienvenidos al programa de hoy",
+            "words": [
+                {"word": "Bienvenidos", "start": 0.0, "end": 1.0},
+                {"word": "al", "start": 1.1, "end": 1.3},
+                {"word": "programa", "start": 1.4, "end": 2.2},
+                {"word": "de", "start": 2.3, "end": 2.5},
+                {"word": "hoy", "start": 2.6, "end": 5.0},
+            ],
+        },
+        {
+            "start": 5.5,
+            "end": 10.0,
+            "text": "Vamos a hablar de inteligencia artificial",
+            "words": [
+                {"word": "Vamos", "start": 5.5, "end": 6.0},
+                {"word": "a", "start": 6.1, "end": 6.2},
+                {"word": "hablar", "start": 6.3, "end": 6.8},
+                {"word": "de", "start": 6.9, "end": 7.0},
+                {"word": "inteligencia", "start": 7.1, "end": 8.0},
+                {"word": "artificial", "start": 8.1, "end": 10.0},
+            ],
+        },
+        {
+            "start": 35.0,
+            "end": 40.0,
+            "text": "Este es un segmento adicional",
+            "words": [
+                {"word": "Este", "start": 35.0, "end": 35.5},
+                {"word": "es", "start": 35.6, "end": 35.8},
+                {"word": "un", "start": 35.9, "end": 36.1},
+                {"word": "segmento", "start": 36.2, "end": 37.5},
+                {"word": "adicional", "start": 37.6, "end": 40.0},
+            ],
+        },
+        {
+            "start": 60.0,
+            "end": 65.0,
+            "text": "Llegamos al final del video",
+            "words": [
+                {"word": "Llegamos", "start": 60.0, "end": 60.8},
+                {"word": "al", "start": 60.9, "end": 61.1},
+                {"word": "final", "start": 61.2, "end": 62.0},
+                {"word": "del", "start": 62.1, "end": 62.4},
+                {"word": "video", "start": 62.5, "end": 65.0},
+            ],
+        },
+    ],
+}
+_TRANSCRIPT_WITH_WORDS_JSON = json.dumps(_TRANSCRIPT_WITH_WORDS).encode("utf-8")
+
+
+def _build_long_transcript() -> dict:
+    """Twenty 9.5s segments spaced 10s apart (~200s of speech)."""
+    segments = []
+    for i in range(20):
+        start = i * 10.0
+        end = start + 9.5
+        segments.append(
+            {
+                "start": start,
+                "end": end,
+                "text": f"Segment number {i + 1} with some content",
+                "words": [
+                    {"word": "Segment", "start": start, "end": start + 1.0},
+                    {"word": "number", "start": start + 1.1, "end": start + 2.0},
+                    {"word": str(i + 1), "start": start + 2.1, "end": start + 3.0},
+                ],
+            }
+        )
+    return {
+        "video_id": "long_video",
+        "language": "en",
+        "segments": segments,
+    }
+
+
+_LONG_TRANSCRIPT = _build_long_transcript()
+_LONG_TRANSCRIPT_JSON = json.dumps(_LONG_TRANSCRIPT).encode("utf-8")
+
 
 # ============================================================================
 # MOCK FIXTURES
@@ -17,94 +113,54 @@ from src.clips_generator import ClipsGenerator, generate_clips_from_transcript
 
 @pytest.fixture
 def mock_clip():
-    """Create a mock Clip object with start_time and end_time attributes."""
-    clip = MagicMock()
-    clip.start_time = 0.0
-    clip.end_time = 45.0
-    return clip
+    """Create a stand-in Clip object with start_time and end_time attributes."""
+    return SimpleNamespace(start_time=0.0, end_time=45.0)
+
+
+@pytest.fixture(scope="class", autouse=True)
+def _patch_clip_finder():
+    """Patch ClipFinder once per test class; instances are _CLIP_FINDER_MOCK."""
+    with patch(
+        "src.clips_generator.ClipFinder", return_value=_CLIP_FINDER_MOCK
+    ) as mock_class:
+        yield mock_class
 
 
 @pytest.fixture
 def mock_clip_finder():
-    """Create a mock ClipFinder that returns configurable clips."""
-    with patch("src.clips_generator.ClipFinder") as mock_class:
-        mock_instance = MagicMock()
-        mock_class.return_value = mock_instance
-        yield mock_instance
+    """Shared ClipFinder mock for tests that configure clips (reset afterwards)."""
+    yield _CLIP_FINDER_MOCK
+    _CLIP_FINDER_MOCK.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
 def mock_transcription():
-    """Create a mock Transcription class."""
-    with patch("src.clips_generator.Transcription") as mock_class:
-        mock_instance = MagicMock()
-        mock_class.return_value = mock_instance
-        yield mock_class
+    """Patch Transcription; yields the list of dicts it was constructed with."""
+    captured: list[dict] = []
 
+    def fake_transcription(transcription_dict: dict) -> object:
+        captured.append(transcription_dict)
+        return object()
 
-@pytest.fixture
+    with patch("src.clips_generator.Transcription", fake_transcription):
+        yield captured
+
+
+@pytest.fixture(scope="class")
+def generator(_patch_clip_finder):
+    """ClipsGenerator shared by all tests of a class."""
+    return ClipsGenerator()
+
+
+@pytest.fixture(scope="session")
 def transcript_with_words() -> dict:
-    """WhisperX transcript with word-level timestamps."""
-    return {
-        "video_id": "test_video_001",
-        "language": "es",
-        "segments": [
-            {
-                "start": 0.0,
-                "end": 5.0,
-                "text": "Bienvenidos al programa de hoy",
-                "words": [
-                    {"word": "Bienvenidos", "start": 0.0, "end": 1.0},
-                    {"word": "al", "start": 1.1, "end": 1.3},
-                    {"word": "programa", "start": 1.4, "end": 2.2},
-                    {"word": "de", "start": 2.3, "end": 2.5},
-                    {"word": "hoy", "start": 2.6, "end": 5.0},
-                ],
-            },
-            {
-                "start": 5.5,
-                "end": 10.0,
-                "text": "Vamos a hablar de inteligencia artificial",
-                "words": [
-                    {"word": "Vamos", "start": 5.5, "end": 6.0},
-                    {"word": "a", "start": 6.1, "end": 6.2},
-                    {"word": "hablar", "start": 6.3, "end": 6.8},
-                    {"word": "de", "start": 6.9, "end": 7.0},
-                    {"word": "inteligencia", "start": 7.1, "end": 8.0},
-                    {"word": "artificial", "start": 8.1, "end": 10.0},
-                ],
-            },
-            {
-                "start": 35.0,
-                "end": 40.0,
-                "text": "Este es un segmento adicional",
-                "words": [
-                    {"word": "Este", "start": 35.0, "end": 35.5},
-                    {"word": "es", "start": 35.6, "end": 35.8},
-                    {"word": "un", "start": 35.9, "end": 36.1},
-                    {"word": "segmento", "start": 36.2, "end": 37.5},
-                    {"word": "adicional", "start": 37.6, "end": 40.0},
-                ],
-            },
-            {
-                "start": 60.0,
-                "end": 65.0,
-                "text": "Llegamos al final del video",
-                "words": [
-                    {"word": "Llegamos", "start": 60.0, "end": 60.8},
-                    {"word": "al", "start": 60.9, "end": 61.1},
-                    {"word": "final", "start": 61.2, "end": 62.0},
-                    {"word": "del", "start": 62.1, "end": 62.4},
-                    {"word": "video", "start": 62.5, "end": 65.0},
-                ],
-            },
-        ],
-    }
+    """WhisperX transcript with word-level timestamps (shared; do not mutate)."""
+    return _TRANSCRIPT_WITH_WORDS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def transcript_without_words() -> dict:
-    """WhisperX transcript without word-level timestamps (segment-only)."""
+    """WhisperX transcript without word-level timestamps (shared; do not mutate)."""
     return {
         "video_id": "test_video_002",
         "language": "en",
@@ -115,30 +171,10 @@ def transcript_without_words() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def long_transcript() -> dict:
-    """Long transcript for testing fixed time clip generation."""
-    segments = []
-    for i in range(20):
-        start = i * 10.0
-        end = start + 9.5
-        segments.append(
-            {
-                "start": start,
-                "end": end,
-                "text": f"Segment number {i + 1} with some content",
-                "words": [
-                    {"word": "Segment", "start": start, "end": start + 1.0},
-                    {"word": "number", "start": start + 1.1, "end": start + 2.0},
-                    {"word": str(i + 1), "start": start + 2.1, "end": start + 3.0},
-                ],
-            }
-        )
-    return {
-        "video_id": "long_video",
-        "language": "en",
-        "segments": segments,
-    }
+    """Long transcript for fixed time clip generation (shared; do not mutate)."""
+    return _LONG_TRANSCRIPT
 
 
 # ============================================================================
@@ -149,14 +185,14 @@ def long_transcript() -> dict:
 class TestClipsGeneratorInit:
     """Tests for ClipsGenerator initialization."""
 
-    def test_init_default_parameters(self, mock_clip_finder):
+    def test_init_default_parameters(self):
         """ClipsGenerator initializes with default duration values."""
         generator = ClipsGenerator()
 
         assert generator.min_clip_duration == 30
         assert generator.max_clip_duration == 90
 
-    def test_init_custom_parameters(self, mock_clip_finder):
+    def test_init_custom_parameters(self):
         """ClipsGenerator accepts custom min/max duration parameters."""
         generator = ClipsGenerator(min_clip_duration=15, max_clip_duration=120)
 
@@ -182,14 +218,13 @@ class TestLoadTranscript:
     """Tests for transcript loading functionality."""
 
     def test_load_transcript_valid_json(
-        self, tmp_project_dir, mock_clip_finder, transcript_with_words
+        self, tmp_path, generator, transcript_with_words
     ):
         """_load_transcript loads valid JSON transcript successfully."""
         # Create transcript file
-        transcript_path = tmp_project_dir / "temp" / "test_transcript.json"
-        transcript_path.write_text(json.dumps(transcript_with_words), encoding="utf-8")
+        transcript_path = tmp_path / "test_transcript.json"
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
 
-        generator = ClipsGenerator()
         result = generator._load_transcript(str(transcript_path))
 
         assert result is not None
@@ -197,30 +232,48 @@ class TestLoadTranscript:
         assert result["language"] == "es"
         assert len(result["segments"]) == 4
 
-    def test_load_transcript_missing_file(self, tmp_project_dir, mock_clip_finder):
+    def test_load_transcript_reuses_parsed_data(self, tmp_path, generator):
+        """_load_transcript parses an unchanged file only once."""
+        transcript_path = tmp_path / "test_transcript.json"
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
+
+        first = generator._load_transcript(str(transcript_path))
+        second = generator._load_transcript(str(transcript_path))
+
+        assert second is first
+
+    def test_load_transcript_rereads_modified_file(self, tmp_path, generator):
+        """_load_transcript picks up changes made to the file on disk."""
+        transcript_path = tmp_path / "test_transcript.json"
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
+        generator._load_transcript(str(transcript_path))
+
+        transcript_path.write_text('{"segments": []}', encoding="utf-8")
+        result = generator._load_transcript(str(transcript_path))
+
+        assert result == {"segments": []}
+
+    def test_load_transcript_missing_file(self, generator):
         """_load_transcript returns None for non-existent file."""
-        generator = ClipsGenerator()
         result = generator._load_transcript("/nonexistent/path/transcript.json")
 
         assert result is None
 
-    def test_load_transcript_invalid_json(self, tmp_project_dir, mock_clip_finder):
+    def test_load_transcript_invalid_json(self, tmp_path, generator):
         """_load_transcript returns None for invalid JSON."""
         # Create invalid JSON file
-        transcript_path = tmp_project_dir / "temp" / "invalid.json"
+        transcript_path = tmp_path / "invalid.json"
         transcript_path.write_text("{ invalid json content }", encoding="utf-8")
 
-        generator = ClipsGenerator()
         result = generator._load_transcript(str(transcript_path))
 
         assert result is None
 
-    def test_load_transcript_empty_file(self, tmp_project_dir, mock_clip_finder):
+    def test_load_transcript_empty_file(self, tmp_path, generator):
         """_load_transcript handles empty file gracefully."""
-        transcript_path = tmp_project_dir / "temp" / "empty.json"
+        transcript_path = tmp_path / "empty.json"
         transcript_path.write_text("", encoding="utf-8")
 
-        generator = ClipsGenerator()
         result = generator._load_transcript(str(transcript_path))
 
         assert result is None
@@ -235,56 +288,50 @@ class TestConvertToClipsaiFormat:
     """Tests for WhisperX to ClipsAI format conversion."""
 
     def test_convert_with_words(
-        self, mock_clip_finder, mock_transcription, transcript_with_words
+        self, generator, mock_transcription, transcript_with_words
     ):
         """_convert_to_clipsai_format processes segments with word-level timestamps."""
-        generator = ClipsGenerator()
         result = generator._convert_to_clipsai_format(transcript_with_words)
 
         assert result is not None
         # Verify Transcription was called with a dict containing char_info
-        mock_transcription.assert_called_once()
-        call_args = mock_transcription.call_args[0][0]
+        assert len(mock_transcription) == 1
+        call_args = mock_transcription[0]
         assert "char_info" in call_args
         assert "source_software" in call_args
         assert call_args["source_software"] == "whisperx"
         assert call_args["language"] == "es"
 
     def test_convert_without_words(
-        self, mock_clip_finder, mock_transcription, transcript_without_words
+        self, generator, mock_transcription, transcript_without_words
     ):
         """_convert_to_clipsai_format processes segments without word timestamps."""
-        generator = ClipsGenerator()
         result = generator._convert_to_clipsai_format(transcript_without_words)
 
         assert result is not None
-        mock_transcription.assert_called_once()
-        call_args = mock_transcription.call_args[0][0]
+        assert len(mock_transcription) == 1
+        call_args = mock_transcription[0]
         # Characters should be extracted from segment text
         assert len(call_args["char_info"]) > 0
 
-    def test_convert_empty_segments(self, mock_clip_finder, mock_transcription):
+    def test_convert_empty_segments(self, generator, mock_transcription):
         """_convert_to_clipsai_format returns None for empty segments."""
-        generator = ClipsGenerator()
         result = generator._convert_to_clipsai_format({"segments": []})
 
         assert result is None
 
-    def test_convert_no_segments_key(self, mock_clip_finder, mock_transcription):
+    def test_convert_no_segments_key(self, generator, mock_transcription):
         """_convert_to_clipsai_format returns None when segments key is missing."""
-        generator = ClipsGenerator()
         result = generator._convert_to_clipsai_format({})
 
         assert result is None
 
-    def test_convert_default_language(self, mock_clip_finder, mock_transcription):
+    def test_convert_default_language(self, generator, mock_transcription):
         """_convert_to_clipsai_format uses 'en' as default language."""
         transcript_no_lang = {"segments": [{"start": 0.0, "end": 5.0, "text": "Test"}]}
-        generator = ClipsGenerator()
         generator._convert_to_clipsai_format(transcript_no_lang)
 
-        call_args = mock_transcription.call_args[0][0]
-        assert call_args["language"] == "en"
+        assert mock_transcription[0]["language"] == "en"
 
 
 # ============================================================================
@@ -295,9 +342,7 @@ class TestConvertToClipsaiFormat:
 class TestGetTextForTimerange:
     """Tests for extracting text within a time range."""
 
-    def test_get_text_overlapping_segments(
-        self, mock_clip_finder, transcript_with_words
-    ):
+    def test_get_text_overlapping_segments(self, transcript_with_words):
         """_get_text_for_timerange extracts text from overlapping segments."""
         generator = ClipsGenerator()
         result = generator._get_text_for_timerange(
@@ -307,7 +352,7 @@ class TestGetTextForTimerange:
         assert "Bienvenidos al programa de hoy" in result
         assert "Vamos a hablar de inteligencia artificial" in result
 
-    def test_get_text_single_segment(self, mock_clip_finder, transcript_with_words):
+    def test_get_text_single_segment(self, transcript_with_words):
         """_get_text_for_timerange extracts text from a single segment."""
         generator = ClipsGenerator()
         result = generator._get_text_for_timerange(
@@ -318,7 +363,7 @@ class TestGetTextForTimerange:
         # Second segment should not be included (starts at 5.5)
         assert "Vamos" not in result
 
-    def test_get_text_no_overlap(self, mock_clip_finder, transcript_with_words):
+    def test_get_text_no_overlap(self, transcript_with_words):
         """_get_text_for_timerange returns empty string for non-overlapping range."""
         generator = ClipsGenerator()
         result = generator._get_text_for_timerange(
@@ -327,9 +372,7 @@ class TestGetTextForTimerange:
 
         assert result == ""
 
-    def test_get_text_partial_overlap_start(
-        self, mock_clip_finder, transcript_with_words
-    ):
+    def test_get_text_partial_overlap_start(self, transcript_with_words):
         """_get_text_for_timerange includes segment with partial overlap at start."""
         generator = ClipsGenerator()
         # Range starts in the middle of segment 2 (5.5-10.0)
@@ -339,9 +382,7 @@ class TestGetTextForTimerange:
 
         assert "Vamos a hablar de inteligencia artificial" in result
 
-    def test_get_text_partial_overlap_end(
-        self, mock_clip_finder, transcript_with_words
-    ):
+    def test_get_text_partial_overlap_end(self, transcript_with_words):
         """_get_text_for_timerange includes segment with partial overlap at end."""
         generator = ClipsGenerator()
         # Range ends in the middle of segment 1 (0.0-5.0)
@@ -351,7 +392,7 @@ class TestGetTextForTimerange:
 
         assert "Bienvenidos al programa de hoy" in result
 
-    def test_get_text_empty_segments(self, mock_clip_finder):
+    def test_get_text_empty_segments(self):
         """_get_text_for_timerange handles transcript with no segments."""
         generator = ClipsGenerator()
         result = generator._get_text_for_timerange(
@@ -360,9 +401,7 @@ class TestGetTextForTimerange:
 
         assert result == ""
 
-    def test_get_text_boundary_conditions(
-        self, mock_clip_finder, transcript_with_words
-    ):
+    def test_get_text_boundary_conditions(self, transcript_with_words):
         """_get_text_for_timerange handles exact boundary conditions."""
         generator = ClipsGenerator()
         # Query exactly at segment boundary
@@ -374,6 +413,34 @@ class TestGetTextForTimerange:
         # Neither should be included with strict < and > comparison
         assert result == ""
 
+    def test_get_text_long_segment_spanning_later_ones(self):
+        """A long segment is found even when later segments end before it."""
+        generator = ClipsGenerator()
+        transcript = {
+            "segments": [
+                {"start": 0.0, "end": 50.0, "text": "Largo"},
+                {"start": 1.0, "end": 2.0, "text": "Corto"},
+                {"start": 60.0, "end": 70.0, "text": "Final"},
+            ]
+        }
+
+        result = generator._get_text_for_timerange(
+            transcript, start_time=40.0, end_time=45.0
+        )
+
+        assert result == "Largo"
+
+    def test_get_text_rebuilds_index_for_new_transcript(self, transcript_with_words):
+        """The cached segment index is not reused across transcripts."""
+        generator = ClipsGenerator()
+        generator._get_text_for_timerange(transcript_with_words, 0.0, 12.0)
+
+        result = generator._get_text_for_timerange(
+            {"segments": [{"start": 0.0, "end": 5.0, "text": "Otro"}]}, 0.0, 12.0
+        )
+
+        assert result == "Otro"
+
 
 # ============================================================================
 # TEST: _format_time()
@@ -383,27 +450,27 @@ class TestGetTextForTimerange:
 class TestFormatTime:
     """Tests for time formatting utility."""
 
-    def test_format_time_zero(self, mock_clip_finder):
+    def test_format_time_zero(self):
         """_format_time formats zero seconds correctly."""
         generator = ClipsGenerator()
         assert generator._format_time(0.0) == "00:00"
 
-    def test_format_time_seconds_only(self, mock_clip_finder):
+    def test_format_time_seconds_only(self):
         """_format_time formats seconds under one minute."""
         generator = ClipsGenerator()
         assert generator._format_time(45.5) == "00:45"
 
-    def test_format_time_minutes_and_seconds(self, mock_clip_finder):
+    def test_format_time_minutes_and_seconds(self):
         """_format_time formats minutes and seconds correctly."""
         generator = ClipsGenerator()
         assert generator._format_time(125.5) == "02:05"
 
-    def test_format_time_exact_minute(self, mock_clip_finder):
+    def test_format_time_exact_minute(self):
         """_format_time formats exact minutes correctly."""
         generator = ClipsGenerator()
         assert generator._format_time(60.0) == "01:00"
 
-    def test_format_time_large_value(self, mock_clip_finder):
+    def test_format_time_large_value(self):
         """_format_time handles large values correctly."""
         generator = ClipsGenerator()
         assert generator._format_time(3661.0) == "61:01"
@@ -423,16 +490,12 @@ class TestGenerateClips:
         """generate_clips returns formatted clips when ClipFinder finds clips."""
         # Setup transcript file
         transcript_path = tmp_project_dir / "temp" / "transcript.json"
-        transcript_path.write_text(json.dumps(transcript_with_words), encoding="utf-8")
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
 
         # Create mock clips
-        mock_clip1 = MagicMock()
-        mock_clip1.start_time = 0.0
-        mock_clip1.end_time = 45.0
+        mock_clip1 = SimpleNamespace(start_time=0.0, end_time=45.0)
 
-        mock_clip2 = MagicMock()
-        mock_clip2.start_time = 45.0
-        mock_clip2.end_time = 90.0
+        mock_clip2 = SimpleNamespace(start_time=45.0, end_time=90.0)
 
         mock_clip_finder.find_clips.return_value = [mock_clip1, mock_clip2]
 
@@ -448,7 +511,7 @@ class TestGenerateClips:
         assert result[0]["duration"] == 45.0
         assert result[0]["method"] == "clipsai"
 
-    def test_generate_clips_missing_transcript(self, tmp_project_dir, mock_clip_finder):
+    def test_generate_clips_missing_transcript(self, tmp_project_dir):
         """generate_clips returns None when transcript file is missing."""
         generator = ClipsGenerator()
         result = generator.generate_clips("/nonexistent/transcript.json")
@@ -460,7 +523,7 @@ class TestGenerateClips:
     ):
         """generate_clips falls back to fixed time clips when ClipFinder returns empty."""
         transcript_path = tmp_project_dir / "temp" / "transcript.json"
-        transcript_path.write_text(json.dumps(long_transcript), encoding="utf-8")
+        transcript_path.write_bytes(_LONG_TRANSCRIPT_JSON)
 
         # ClipFinder returns empty list
         mock_clip_finder.find_clips.return_value = []
@@ -479,14 +542,12 @@ class TestGenerateClips:
     ):
         """generate_clips respects max_clips parameter."""
         transcript_path = tmp_project_dir / "temp" / "transcript.json"
-        transcript_path.write_text(json.dumps(transcript_with_words), encoding="utf-8")
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
 
         # Create many mock clips
         mock_clips = []
         for i in range(10):
-            clip = MagicMock()
-            clip.start_time = i * 30.0
-            clip.end_time = (i + 1) * 30.0
+            clip = SimpleNamespace(start_time=i * 30.0, end_time=(i + 1) * 30.0)
             mock_clips.append(clip)
 
         mock_clip_finder.find_clips.return_value = mock_clips
@@ -502,11 +563,9 @@ class TestGenerateClips:
     ):
         """generate_clips logs warning when fewer clips than min_clips are found."""
         transcript_path = tmp_project_dir / "temp" / "transcript.json"
-        transcript_path.write_text(json.dumps(transcript_with_words), encoding="utf-8")
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
 
-        mock_clip = MagicMock()
-        mock_clip.start_time = 0.0
-        mock_clip.end_time = 45.0
+        mock_clip = SimpleNamespace(start_time=0.0, end_time=45.0)
         mock_clip_finder.find_clips.return_value = [mock_clip]
 
         with patch("src.clips_generator.Transcription"):
@@ -524,11 +583,9 @@ class TestGenerateClips:
     ):
         """generate_clips includes text_preview and full_text in clip data."""
         transcript_path = tmp_project_dir / "temp" / "transcript.json"
-        transcript_path.write_text(json.dumps(transcript_with_words), encoding="utf-8")
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
 
-        mock_clip = MagicMock()
-        mock_clip.start_time = 0.0
-        mock_clip.end_time = 12.0
+        mock_clip = SimpleNamespace(start_time=0.0, end_time=12.0)
         mock_clip_finder.find_clips.return_value = [mock_clip]
 
         with patch("src.clips_generator.Transcription"):
@@ -548,7 +605,7 @@ class TestGenerateClips:
 class TestGenerateFixedTimeClips:
     """Tests for fixed duration clip generation fallback."""
 
-    def test_fixed_time_clips_basic(self, mock_clip_finder, long_transcript):
+    def test_fixed_time_clips_basic(self, long_transcript):
         """_generate_fixed_time_clips divides video into fixed duration clips."""
         generator = ClipsGenerator()
         result = generator._generate_fixed_time_clips(
@@ -561,7 +618,7 @@ class TestGenerateFixedTimeClips:
             assert clip["method"] == "fixed_time"
             assert clip["duration"] >= 30  # Minimum duration requirement
 
-    def test_fixed_time_clips_empty_segments(self, mock_clip_finder):
+    def test_fixed_time_clips_empty_segments(self):
         """_generate_fixed_time_clips returns None for empty segments."""
         generator = ClipsGenerator()
         result = generator._generate_fixed_time_clips(
@@ -570,9 +627,7 @@ class TestGenerateFixedTimeClips:
 
         assert result is None
 
-    def test_fixed_time_clips_respects_max_clips(
-        self, mock_clip_finder, long_transcript
-    ):
+    def test_fixed_time_clips_respects_max_clips(self, long_transcript):
         """_generate_fixed_time_clips respects max_clips parameter."""
         generator = ClipsGenerator()
         result = generator._generate_fixed_time_clips(
@@ -581,7 +636,7 @@ class TestGenerateFixedTimeClips:
 
         assert len(result) <= 3
 
-    def test_fixed_time_clips_skips_short_clips(self, mock_clip_finder):
+    def test_fixed_time_clips_skips_short_clips(self):
         """_generate_fixed_time_clips skips clips shorter than 30 seconds."""
         # Create a transcript with total duration less than 60s
         short_transcript = {
@@ -596,7 +651,22 @@ class TestGenerateFixedTimeClips:
         # Should return None because the only possible clip is < 30s
         assert result is None
 
-    def test_fixed_time_clips_includes_text(self, mock_clip_finder, long_transcript):
+    def test_fixed_time_clips_too_short_video_skips_text_lookup(self):
+        """A video shorter than 30s returns None before extracting any text."""
+        short_transcript = {
+            "segments": [{"start": 0.0, "end": 25.0, "text": "Short segment"}]
+        }
+
+        generator = ClipsGenerator()
+        with patch.object(generator, "_get_text_for_timerange") as mock_get_text:
+            result = generator._generate_fixed_time_clips(
+                short_transcript, clip_duration=10
+            )
+
+        assert result is None
+        mock_get_text.assert_not_called()
+
+    def test_fixed_time_clips_includes_text(self, long_transcript):
         """_generate_fixed_time_clips extracts text for each clip."""
         generator = ClipsGenerator()
         result = generator._generate_fixed_time_clips(
@@ -615,10 +685,15 @@ class TestGenerateFixedTimeClips:
 
 
 class TestClipsMetadataPersistence:
-    """Tests for saving and loading clip metadata."""
+    """Tests for saving and loading clip metadata.
+
+    Only a scratch directory is needed here, so these use tmp_path instead of
+    the heavier tmp_project_dir (state files, StateManager reset).
+    """
 
-    def test_save_clips_metadata_default_path(self, tmp_project_dir, mock_clip_finder):
+    def test_save_clips_metadata_default_path(self, tmp_path, monkeypatch):
         """save_clips_metadata saves to default temp/{video_id}_clips.json."""
+        monkeypatch.chdir(tmp_path)
         generator = ClipsGenerator()
         clips = [{"clip_id": 1, "start_time": 0.0, "end_time": 45.0, "duration": 45.0}]
 
@@ -635,11 +710,11 @@ class TestClipsMetadataPersistence:
         assert saved_data["num_clips"] == 1
         assert len(saved_data["clips"]) == 1
 
-    def test_save_clips_metadata_custom_path(self, tmp_project_dir, mock_clip_finder):
+    def test_save_clips_metadata_custom_path(self, tmp_path):
         """save_clips_metadata saves to custom output path."""
         generator = ClipsGenerator()
         clips = [{"clip_id": 1, "duration": 45.0}]
-        custom_path = str(tmp_project_dir / "custom" / "clips.json")
+        custom_path = str(tmp_path / "custom" / "clips.json")
 
         result_path = generator.save_clips_metadata(
             clips, "test_video", output_path=custom_path
@@ -648,14 +723,14 @@ class TestClipsMetadataPersistence:
         assert result_path == custom_path
         assert Path(custom_path).exists()
 
-    def test_save_clips_metadata_includes_duration_settings(
-        self, tmp_project_dir, mock_clip_finder
-    ):
+    def test_save_clips_metadata_includes_duration_settings(self, tmp_path):
         """save_clips_metadata includes min/max duration settings."""
         generator = ClipsGenerator(min_clip_duration=20, max_clip_duration=120)
         clips = [{"clip_id": 1}]
 
-        result_path = generator.save_clips_metadata(clips, "test_video")
+        result_path = generator.save_clips_metadata(
+            clips, "test_video", output_path=str(tmp_path / "clips.json")
+        )
 
         with open(result_path, encoding="utf-8") as f:
             saved_data = json.load(f)
@@ -663,7 +738,7 @@ class TestClipsMetadataPersistence:
         assert saved_data["min_clip_duration"] == 20
         assert saved_data["max_clip_duration"] == 120
 
-    def test_load_clips_metadata_success(self, tmp_project_dir, mock_clip_finder):
+    def test_load_clips_metadata_success(self, tmp_path):
         """load_clips_metadata loads previously saved metadata."""
         generator = ClipsGenerator()
         clips = [
@@ -671,21 +746,47 @@ class TestClipsMetadataPersistence:
             {"clip_id": 2, "start_time": 45.0, "end_time": 90.0},
         ]
 
-        saved_path = generator.save_clips_metadata(clips, "test_video")
+        saved_path = generator.save_clips_metadata(
+            clips, "test_video", output_path=str(tmp_path / "clips.json")
+        )
         loaded_data = generator.load_clips_metadata(saved_path)
 
         assert loaded_data is not None
         assert loaded_data["video_id"] == "test_video"
         assert len(loaded_data["clips"]) == 2
 
-    def test_load_clips_metadata_missing_file(self, tmp_project_dir, mock_clip_finder):
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_clips_metadata_keeps_unicode_readable(self, tmp_path, use_orjson):
+        """save_clips_metadata writes non-ASCII text unescaped, with or without orjson."""
+        import src.utils.json_io as json_io_module
+
+        if use_orjson and json_io_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        generator = ClipsGenerator()
+        clips = [{"clip_id": 1, "full_text": "Canción número uno"}]
+
+        with patch.object(
+            json_io_module,
+            "orjson",
+            json_io_module.orjson if use_orjson else None,
+        ):
+            result_path = generator.save_clips_metadata(
+                clips, "test_video", output_path=str(tmp_path / "clips.json")
+            )
+            loaded_data = generator.load_clips_metadata(result_path)
+
+        assert "Canción número uno" in Path(result_path).read_text(encoding="utf-8")
+        assert loaded_data["clips"] == clips
+
+    def test_load_clips_metadata_missing_file(self):
         """load_clips_metadata returns None for non-existent file."""
         generator = ClipsGenerator()
         result = generator.load_clips_metadata("/nonexistent/clips.json")
 
         assert result is None
 
-    def test_save_load_roundtrip(self, tmp_project_dir, mock_clip_finder):
+    def test_save_load_roundtrip(self, tmp_path):
         """save and load clips_metadata preserves all clip data."""
         generator = ClipsGenerator(min_clip_duration=25, max_clip_duration=100)
         original_clips = [
@@ -709,7 +810,9 @@ class TestClipsMetadataPersistence:
             },
         ]
 
-        saved_path = generator.save_clips_metadata(original_clips, "roundtrip_test")
+        saved_path = generator.save_clips_metadata(
+            original_clips, "roundtrip_test", output_path=str(tmp_path / "clips.json")
+        )
         loaded_data = generator.load_clips_metadata(saved_path)
 
         assert loaded_data["video_id"] == "roundtrip_test"
@@ -737,11 +840,9 @@ class TestGenerateClipsFromTranscript:
     ):
         """generate_clips_from_transcript creates generator and calls generate_clips."""
         transcript_path = tmp_project_dir / "temp" / "transcript.json"
-        transcript_path.write_text(json.dumps(transcript_with_words), encoding="utf-8")
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
 
-        mock_clip = MagicMock()
-        mock_clip.start_time = 0.0
-        mock_clip.end_time = 45.0
+        mock_clip = SimpleNamespace(start_time=0.0, end_time=45.0)
         mock_clip_finder.find_clips.return_value = [mock_clip]
 
         with patch("src.clips_generator.Transcription"):
@@ -755,7 +856,7 @@ class TestGenerateClipsFromTranscript:
     ):
         """generate_clips_from_transcript passes custom parameters correctly."""
         transcript_path = tmp_project_dir / "temp" / "transcript.json"
-        transcript_path.write_text(json.dumps(transcript_with_words), encoding="utf-8")
+        transcript_path.write_bytes(_TRANSCRIPT_WITH_WORDS_JSON)
 
         with patch("src.clips_generator.ClipFinder") as mock_finder_class:
             mock_instance = MagicMock()
@@ -13,6 +13,7 @@ Uso:
 """
 
 import json
+import re
 import sys
 from pathlib import Path
 
@@ -29,6 +30,18 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 
 from src.prompts import get_prompt_for_style
 from src.prompts.classifier_prompt import get_classifier_prompt
+from src.utils.json_io import loads_json
+
+# Bloque ```json ... ``` en respuestas de Gemini (el cierre puede faltar)
+_JSON_FENCE_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def _strip_json_fence(response_text: str) -> str:
+    """Extraer el JSON de un bloque markdown ```json, si lo hay"""
+    match = _JSON_FENCE_RE.search(response_text)
+    if match:
+        response_text = match.group(1)
+    return response_text.strip()
 
 
 @pytest.fixture(scope="module")
@@ -72,6 +85,18 @@ def clips_data():
     return clips_data
 
 
+@pytest.fixture(scope="module")
+def classifier_llm():
+    """Fixture: LLM de clasificación, creado una vez por módulo"""
+    return ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.7)
+
+
+@pytest.fixture(scope="module")
+def copy_llm():
+    """Fixture: LLM de generación de copies, compartido por tests 3 y 4"""
+    return ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.8)
+
+
 def test_1_load_clips(clips_data):
     """Test 1: Verificar que los clips se cargaron correctamente"""
     print("\n" + "=" * 60)
@@ -87,7 +112,7 @@ def test_1_load_clips(clips_data):
     print(f"✓ Validación exitosa: {len(clips_data)} clips cargados")
 
 
-def test_2_classify_one_clip(clips_data):
+def test_2_classify_one_clip(clips_data, classifier_llm):
     """Test 2: Clasificar UN solo clip"""
     print("\n" + "=" * 60)
     print("TEST 2: Classify ONE Clip")
@@ -96,9 +121,6 @@ def test_2_classify_one_clip(clips_data):
     # Tomar solo el primer clip
     clip = clips_data[0]
 
-    # Inicializar LLM
-    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.7)
-
     # Prompt del classifier
     classifier_prompt = get_classifier_prompt()
 
@@ -110,7 +132,7 @@ def test_2_classify_one_clip(clips_data):
 
     user_message = f"""Clasifica este clip en viral/educational/storytelling:
 
-{json.dumps([clip_input], indent=2, ensure_ascii=False)}
+{json.dumps([clip_input], ensure_ascii=False, separators=(",", ":"))}
 
 Responde SOLO con JSON válido (sin markdown):"""
 
@@ -121,18 +143,16 @@ Responde SOLO con JSON válido (sin markdown):"""
     ]
 
     print(f"Clasificando clip {clip['clip_id']}...")
-    response = llm.invoke(messages)
+    response = classifier_llm.invoke(messages)
     response_text = response.content.strip()
 
     # Limpiar respuesta
-    if "```json" in response_text:
-        response_text = response_text.split("```json")[1].split("```")[0]
-    response_text = response_text.strip()
+    response_text = _strip_json_fence(response_text)
 
     print(f"\nRaw response:\n{response_text}\n")
 
     # Parsear JSON
-    classification_result = json.loads(response_text)
+    classification_result = loads_json(response_text)
     classifications = classification_result.get("classifications", [])
 
     assert classifications, "No se generaron clasificaciones"
@@ -149,7 +169,7 @@ Responde SOLO con JSON válido (sin markdown):"""
     print(f"✓ Reason: {classification.get('reason', 'N/A')}")
 
 
-def test_3_generate_copy_for_one_clip(clips_data):
+def test_3_generate_copy_for_one_clip(clips_data, copy_llm):
     """Test 3: Generar copy para UN solo clip con un estilo específico"""
     style = "viral"
     print("\n" + "=" * 60)
@@ -159,9 +179,6 @@ def test_3_generate_copy_for_one_clip(clips_data):
     # Tomar solo el primer clip
     clip = clips_data[0]
 
-    # Inicializar LLM
-    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.8)
-
     # Prompt del estilo
     full_prompt = get_prompt_for_style(style)
 
@@ -174,7 +191,7 @@ def test_3_generate_copy_for_one_clip(clips_data):
 
     user_message = f"""Genera copies para este 1 clip en estilo {style}:
 
-{json.dumps([clip_input], indent=2, ensure_ascii=False)}
+{json.dumps([clip_input], ensure_ascii=False, separators=(",", ":"))}
 
 Responde SOLO con JSON válido (sin markdown):"""
 
@@ -185,18 +202,16 @@ Responde SOLO con JSON válido (sin markdown):"""
     ]
 
     print(f"Generando copy para clip {clip['clip_id']} en estilo {style}...")
-    response = llm.invoke(messages)
+    response = copy_llm.invoke(messages)
     response_text = response.content.strip()
 
     # Limpiar respuesta
-    if "```json" in response_text:
-        response_text = response_text.split("```json")[1].split("```")[0]
-    response_text = response_text.strip()
+    response_text = _strip_json_fence(response_text)
 
     print(f"\nRaw response:\n{response_text}\n")
 
     # Parsear JSON
-    copies_data = json.loads(response_text)
+    copies_data = loads_json(response_text)
 
     assert "clips" in copies_data, f"Respuesta no tiene campo 'clips'. Keys: {copies_data.keys()}"
 
@@ -221,7 +236,7 @@ Responde SOLO con JSON válido (sin markdown):"""
         print("⚠️  WARNING: El copy no incluye #AICDMX")
 
 
-def test_4_generate_copies_batch(clips_data):
+def test_4_generate_copies_batch(clips_data, copy_llm):
     """Test 4: Generar copies para un BATCH de clips"""
     style = "educational"
     batch_size = 5
@@ -232,9 +247,6 @@ def test_4_generate_copies_batch(clips_data):
     # Tomar los primeros N clips
     batch = clips_data[:batch_size]
 
-    # Inicializar LLM
-    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", temperature=0.8)
-
     # Prompt del estilo
     full_prompt = get_prompt_for_style(style)
 
@@ -251,7 +263,7 @@ def test_4_generate_copies_batch(clips_data):
 
     user_message = f"""Genera copies para estos {len(clips_input)} clips en estilo {style}:
 
-{json.dumps(clips_input, indent=2, ensure_ascii=False)}
+{json.dumps(clips_input, ensure_ascii=False, separators=(",", ":"))}
 
 Responde SOLO con JSON válido (sin markdown):"""
 
@@ -262,18 +274,16 @@ Responde SOLO con JSON válido (sin markdown):"""
     ]
 
     print(f"Generando copies para {len(batch)} clips en estilo {style}...")
-    response = llm.invoke(messages)
+    response = copy_llm.invoke(messages)
     response_text = response.content.strip()
 
     # Limpiar respuesta
-    if "```json" in response_text:
-        response_text = response_text.split("```json")[1].split("```")[0]
-    response_text = response_text.strip()
+    response_text = _strip_json_fence(response_text)
 
     print(f"\nRaw response (first 500 chars):\n{response_text[:500]}...\n")
 
     # Parsear JSON
-    copies_data = json.loads(response_text)
+    copies_data = loads_json(response_text)
 
     assert "clips" in copies_data, f"Respuesta no tiene campo 'clips'. Keys: {copies_data.keys()}"
 
@@ -5,6 +5,8 @@ Tests all Pydantic models, validators, and helper functions with both
 positive and negative test cases.
 """
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -18,51 +20,116 @@ from src.models.copy_schemas import (
     create_saved_copys,
 )
 
-# ============================================================================
-# FIXTURES
-# ============================================================================
-
-
-@pytest.fixture
-def valid_metadata_dict():
-    """Returns a valid CopyMetadata dictionary."""
-    return {
+# Valid payloads are defined once (read-only, topics included as a tuple);
+# fixtures hand out copies of them and tests override single fields with
+# {**_VALID_METADATA, ...}
+_VALID_METADATA = MappingProxyType(
+    {
         "sentiment": "educational",
         "sentiment_score": 0.75,
         "engagement_score": 8.5,
         "suggested_thumbnail_timestamp": 12.5,
-        "primary_topics": ["AI", "tech", "innovation"],
+        "primary_topics": ("AI", "tech", "innovation"),
         "hook_strength": "high",
         "viral_potential": 7.8,
     }
+)
+
+_VALID_CLIP_COPY = MappingProxyType(
+    {
+        "clip_id": 1,
+        "copy": "This is amazing content! #TechTips #AICDMX",
+        "metadata": _VALID_METADATA,
+    }
+)
+
+# Short valid copy (hashtags incl. #AICDMX) for tests that don't care about the text
+_COPY_WITH_AICDMX = "Great content here! #Tech #AICDMX"
+
+# generated_at for tests where the actual time does not matter
+_FIXED_TS = datetime(2025, 1, 1)
+
+
+def _metadata_dict(metadata) -> dict:
+    """Copy of a metadata payload with its own primary_topics list."""
+    return {**metadata, "primary_topics": list(metadata["primary_topics"])}
+
+
+def _construct_metadata(metadata) -> CopyMetadata:
+    """Build a CopyMetadata from trusted data without running validators."""
+    # model_construct keeps values as given, so copy the topics list first
+    return CopyMetadata.model_construct(**_metadata_dict(metadata))
+
+
+def _construct_clip(clip_dict: dict) -> ClipCopy:
+    """Build a ClipCopy from trusted data without running validators."""
+    return ClipCopy.model_construct(
+        **{**clip_dict, "metadata": _construct_metadata(clip_dict["metadata"])}
+    )
+
+
+def _make_clip(clip_id: int, engagement: float, viral: float) -> ClipCopy:
+    """Valid ClipCopy with the given id and engagement/viral scores."""
+    return _construct_clip(
+        {
+            **_VALID_CLIP_COPY,
+            "clip_id": clip_id,
+            "metadata": {
+                **_VALID_METADATA,
+                "engagement_score": engagement,
+                "viral_potential": viral,
+            },
+        }
+    )
+
+
+# Multi-clip outputs for the averaging tests
+_TWO_CLIP_OUTPUT = CopysOutput(clips=[_make_clip(1, 8.0, 7.0), _make_clip(2, 6.0, 5.0)])
+_THREE_CLIP_OUTPUT = CopysOutput(
+    clips=[_make_clip(1, 7.0, 6.0), _make_clip(2, 8.0, 7.0), _make_clip(3, 9.0, 8.0)]
+)
+
+
+def _assert_field_error(field: str, model_cls, **kwargs) -> None:
+    """Assert that model_cls(**kwargs) raises a ValidationError located at field."""
+    with pytest.raises(ValidationError) as exc_info:
+        model_cls(**kwargs)
+    assert any(field in err["loc"] for err in exc_info.value.errors())
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
 
 
 @pytest.fixture
-def valid_metadata(valid_metadata_dict):
-    """Returns a valid CopyMetadata instance."""
-    return CopyMetadata(**valid_metadata_dict)
+def valid_metadata_dict():
+    """Returns a valid CopyMetadata dictionary (fresh copy, safe to mutate)."""
+    return _metadata_dict(_VALID_METADATA)
+
+
+@pytest.fixture(scope="module")
+def valid_metadata():
+    """Returns a valid CopyMetadata instance (shared; do not mutate)."""
+    return _construct_metadata(_VALID_METADATA)
 
 
 @pytest.fixture
 def valid_clip_copy_dict(valid_metadata_dict):
-    """Returns a valid ClipCopy dictionary."""
-    return {
-        "clip_id": 1,
-        "copy": "This is amazing content! #TechTips #AICDMX",
-        "metadata": valid_metadata_dict,
-    }
+    """Returns a valid ClipCopy dictionary (fresh copy, safe to mutate)."""
+    return {**_VALID_CLIP_COPY, "metadata": valid_metadata_dict}
 
 
-@pytest.fixture
-def valid_clip_copy(valid_clip_copy_dict):
-    """Returns a valid ClipCopy instance."""
-    return ClipCopy(**valid_clip_copy_dict)
+@pytest.fixture(scope="module")
+def valid_clip_copy():
+    """Returns a valid ClipCopy instance (shared; do not mutate)."""
+    return _construct_clip(_VALID_CLIP_COPY)
 
 
-@pytest.fixture
-def valid_copys_output(valid_clip_copy_dict):
-    """Returns a valid CopysOutput instance."""
-    return CopysOutput(clips=[ClipCopy(**valid_clip_copy_dict)])
+@pytest.fixture(scope="module")
+def valid_copys_output(valid_clip_copy):
+    """Returns a valid CopysOutput instance (shared; do not mutate)."""
+    return CopysOutput.model_construct(clips=[valid_clip_copy])
 
 
 # ============================================================================
@@ -85,10 +152,9 @@ class TestCopyMetadataSentimentValidator:
             "storytelling",
         ],
     )
-    def test_valid_sentiments_accepted(self, valid_metadata_dict, sentiment):
+    def test_valid_sentiments_accepted(self, sentiment):
         """All valid sentiment literals should be accepted as-is."""
-        valid_metadata_dict["sentiment"] = sentiment
-        metadata = CopyMetadata(**valid_metadata_dict)
+        metadata = CopyMetadata(**{**_VALID_METADATA, "sentiment": sentiment})
         assert metadata.sentiment == sentiment
 
     @pytest.mark.parametrize(
@@ -107,10 +173,9 @@ class TestCopyMetadataSentimentValidator:
             ("curious_educational_humorous", "curious_educational"),
         ],
     )
-    def test_hybrid_sentiments_normalized(self, valid_metadata_dict, hybrid, expected):
+    def test_hybrid_sentiments_normalized(self, hybrid, expected):
         """Hybrid sentiments should be normalized to first valid match in valid_sentiments order."""
-        valid_metadata_dict["sentiment"] = hybrid
-        metadata = CopyMetadata(**valid_metadata_dict)
+        metadata = CopyMetadata(**{**_VALID_METADATA, "sentiment": hybrid})
         assert metadata.sentiment == expected
 
     def test_unknown_sentiment_falls_back_to_relatable(self, valid_metadata_dict):
@@ -140,72 +205,38 @@ class TestCopyMetadataSentimentValidator:
 class TestCopyMetadataTopicsValidator:
     """Tests for CopyMetadata.topics_must_be_unique_and_limited() validator."""
 
-    def test_valid_topics_pass_through(self, valid_metadata_dict):
-        """Valid unique topics should pass through unchanged."""
-        valid_metadata_dict["primary_topics"] = ["AI", "tech", "innovation"]
-        metadata = CopyMetadata(**valid_metadata_dict)
-        assert metadata.primary_topics == ["AI", "tech", "innovation"]
-
-    def test_duplicate_topics_removed(self, valid_metadata_dict):
-        """Duplicate topics should be removed (case-insensitive)."""
-        valid_metadata_dict["primary_topics"] = [
-            "AI",
-            "ai",
-            "Tech",
-            "tech",
-            "innovation",
-        ]
-        metadata = CopyMetadata(**valid_metadata_dict)
-        # Should keep first occurrence, remove duplicates
-        assert len(metadata.primary_topics) == 3
-        assert "AI" in metadata.primary_topics
-        assert "Tech" in metadata.primary_topics
-        assert "innovation" in metadata.primary_topics
-
-    def test_topics_truncated_to_five(self, valid_metadata_dict):
-        """More than 5 unique topics should be truncated to 5."""
-        valid_metadata_dict["primary_topics"] = [
-            "AI",
-            "tech",
-            "innovation",
-            "startup",
-            "coding",
-            "Python",
-            "ML",
-        ]
-        metadata = CopyMetadata(**valid_metadata_dict)
-        assert len(metadata.primary_topics) == 5
-        assert metadata.primary_topics == [
-            "AI",
-            "tech",
-            "innovation",
-            "startup",
-            "coding",
-        ]
-
-    def test_duplicate_removal_before_truncation(self, valid_metadata_dict):
-        """Duplicates should be removed before truncation."""
-        valid_metadata_dict["primary_topics"] = [
-            "AI",
-            "ai",
-            "AI",
-            "tech",
-            "TECH",
-            "innovation",
-            "startup",
-            "coding",
-        ]
-        metadata = CopyMetadata(**valid_metadata_dict)
-        # After dedup: AI, tech, innovation, startup, coding (5 unique)
-        assert len(metadata.primary_topics) == 5
-
-    def test_maintains_original_order(self, valid_metadata_dict):
-        """Original order should be maintained after deduplication."""
-        valid_metadata_dict["primary_topics"] = ["first", "second", "FIRST", "third"]
-        metadata = CopyMetadata(**valid_metadata_dict)
-        assert metadata.primary_topics[0] == "first"
-        assert metadata.primary_topics[1] == "second"
-        assert metadata.primary_topics[2] == "third"
+    @pytest.mark.parametrize(
+        "topics,expected",
+        [
+            # Valid unique topics pass through unchanged
+            (["AI", "tech", "innovation"], ["AI", "tech", "innovation"]),
+            # Duplicates removed case-insensitively, first occurrence kept
+            (["AI", "ai", "Tech", "tech", "innovation"], ["AI", "Tech", "innovation"]),
+            # More than 5 unique topics truncated to 5
+            (
+                ["AI", "tech", "innovation", "startup", "coding", "Python", "ML"],
+                ["AI", "tech", "innovation", "startup", "coding"],
+            ),
+            # Duplicates removed before truncation
+            (
+                ["AI", "ai", "AI", "tech", "TECH", "innovation", "startup", "coding"],
+                ["AI", "tech", "innovation", "startup", "coding"],
+            ),
+            # Original order maintained after deduplication
+            (["first", "second", "FIRST", "third"], ["first", "second", "third"]),
+        ],
+        ids=[
+            "unique",
+            "case_insensitive_dedup",
+            "truncated_to_five",
+            "dedup_before_truncation",
+            "keeps_order",
+        ],
+    )
+    def test_topics_normalized(self, topics, expected):
+        """Topics are deduplicated (case-insensitive, in order) and capped at 5."""
+        metadata = CopyMetadata(**{**_VALID_METADATA, "primary_topics": topics})
+        assert metadata.primary_topics == expected
 
 
 # ============================================================================
@@ -223,20 +254,6 @@ class TestCopyMetadataFieldConstraints:
             metadata = CopyMetadata(**valid_metadata_dict)
             assert metadata.sentiment_score == score
 
-    def test_sentiment_score_below_range_rejected(self, valid_metadata_dict):
-        """sentiment_score below 0 should raise ValidationError."""
-        valid_metadata_dict["sentiment_score"] = -0.1
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "sentiment_score" in str(exc_info.value)
-
-    def test_sentiment_score_above_range_rejected(self, valid_metadata_dict):
-        """sentiment_score above 1 should raise ValidationError."""
-        valid_metadata_dict["sentiment_score"] = 1.1
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "sentiment_score" in str(exc_info.value)
-
     def test_engagement_score_valid_range(self, valid_metadata_dict):
         """engagement_score should accept values in [1, 10]."""
         for score in [1.0, 5.5, 10.0]:
@@ -244,20 +261,6 @@ class TestCopyMetadataFieldConstraints:
             metadata = CopyMetadata(**valid_metadata_dict)
             assert metadata.engagement_score == score
 
-    def test_engagement_score_below_range_rejected(self, valid_metadata_dict):
-        """engagement_score below 1 should raise ValidationError."""
-        valid_metadata_dict["engagement_score"] = 0.9
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "engagement_score" in str(exc_info.value)
-
-    def test_engagement_score_above_range_rejected(self, valid_metadata_dict):
-        """engagement_score above 10 should raise ValidationError."""
-        valid_metadata_dict["engagement_score"] = 10.1
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "engagement_score" in str(exc_info.value)
-
     def test_viral_potential_valid_range(self, valid_metadata_dict):
         """viral_potential should accept values in [1, 10]."""
         for score in [1.0, 5.5, 10.0]:
@@ -265,33 +268,37 @@ class TestCopyMetadataFieldConstraints:
             metadata = CopyMetadata(**valid_metadata_dict)
             assert metadata.viral_potential == score
 
-    def test_viral_potential_below_range_rejected(self, valid_metadata_dict):
-        """viral_potential below 1 should raise ValidationError."""
-        valid_metadata_dict["viral_potential"] = 0.5
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "viral_potential" in str(exc_info.value)
-
-    def test_viral_potential_above_range_rejected(self, valid_metadata_dict):
-        """viral_potential above 10 should raise ValidationError."""
-        valid_metadata_dict["viral_potential"] = 10.5
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "viral_potential" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "field,bad_value",
+        [
+            ("sentiment_score", -0.1),
+            ("sentiment_score", 1.1),
+            ("engagement_score", 0.9),
+            ("engagement_score", 10.1),
+            ("viral_potential", 0.5),
+            ("viral_potential", 10.5),
+            ("suggested_thumbnail_timestamp", -1.0),
+        ],
+    )
+    def test_score_out_of_range_rejected(self, field, bad_value):
+        """Scores outside their allowed range should raise ValidationError."""
+        _assert_field_error(
+            field, CopyMetadata, **{**_VALID_METADATA, field: bad_value}
+        )
 
     @pytest.mark.parametrize("hook_strength", ["very_high", "high", "medium", "low"])
-    def test_hook_strength_valid_literals(self, valid_metadata_dict, hook_strength):
+    def test_hook_strength_valid_literals(self, hook_strength):
         """hook_strength should accept valid literals."""
-        valid_metadata_dict["hook_strength"] = hook_strength
-        metadata = CopyMetadata(**valid_metadata_dict)
+        metadata = CopyMetadata(**{**_VALID_METADATA, "hook_strength": hook_strength})
         assert metadata.hook_strength == hook_strength
 
-    def test_hook_strength_invalid_literal_rejected(self, valid_metadata_dict):
+    def test_hook_strength_invalid_literal_rejected(self):
         """hook_strength with invalid literal should raise ValidationError."""
-        valid_metadata_dict["hook_strength"] = "super_high"
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "hook_strength" in str(exc_info.value)
+        _assert_field_error(
+            "hook_strength",
+            CopyMetadata,
+            **{**_VALID_METADATA, "hook_strength": "super_high"},
+        )
 
     def test_suggested_thumbnail_timestamp_non_negative(self, valid_metadata_dict):
         """suggested_thumbnail_timestamp should accept non-negative values."""
@@ -299,19 +306,13 @@ class TestCopyMetadataFieldConstraints:
         metadata = CopyMetadata(**valid_metadata_dict)
         assert metadata.suggested_thumbnail_timestamp == 0.0
 
-    def test_suggested_thumbnail_timestamp_negative_rejected(self, valid_metadata_dict):
-        """suggested_thumbnail_timestamp negative values should raise ValidationError."""
-        valid_metadata_dict["suggested_thumbnail_timestamp"] = -1.0
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "suggested_thumbnail_timestamp" in str(exc_info.value)
-
-    def test_topics_min_length_violation(self, valid_metadata_dict):
+    def test_topics_min_length_violation(self):
         """primary_topics with less than 2 items should raise ValidationError."""
-        valid_metadata_dict["primary_topics"] = ["only_one"]
-        with pytest.raises(ValidationError) as exc_info:
-            CopyMetadata(**valid_metadata_dict)
-        assert "primary_topics" in str(exc_info.value)
+        _assert_field_error(
+            "primary_topics",
+            CopyMetadata,
+            **{**_VALID_METADATA, "primary_topics": ["only_one"]},
+        )
 
 
 # ============================================================================
@@ -324,22 +325,25 @@ class TestClipCopyCopyValidator:
 
     def test_valid_copy_with_hashtags_passes(self, valid_clip_copy_dict):
         """Valid copy with hashtags including #AICDMX should pass."""
-        valid_clip_copy_dict["copy"] = "Great content here! #Tech #AICDMX"
+        valid_clip_copy_dict["copy"] = _COPY_WITH_AICDMX
         clip = ClipCopy(**valid_clip_copy_dict)
-        assert clip.copy_text == "Great content here! #Tech #AICDMX"
+        assert clip.copy_text == _COPY_WITH_AICDMX
 
-    def test_copy_without_hashtag_rejected(self, valid_clip_copy_dict):
+    def test_copy_without_hashtag_rejected(self):
         """Copy without any hashtag should raise ValidationError."""
-        valid_clip_copy_dict["copy"] = "This is content without any hashtag"
+        bad = {**_VALID_CLIP_COPY, "copy": "This is content without any hashtag"}
         with pytest.raises(ValidationError) as exc_info:
-            ClipCopy(**valid_clip_copy_dict)
+            ClipCopy(**bad)
         assert "hashtag" in str(exc_info.value).lower()
 
-    def test_copy_without_aicdmx_hashtag_rejected(self, valid_clip_copy_dict):
+    def test_copy_without_aicdmx_hashtag_rejected(self):
         """Copy without #AICDMX hashtag should raise ValidationError."""
-        valid_clip_copy_dict["copy"] = "This has hashtag but not branding #Tech #AI"
+        bad = {
+            **_VALID_CLIP_COPY,
+            "copy": "This has hashtag but not branding #Tech #AI",
+        }
         with pytest.raises(ValidationError) as exc_info:
-            ClipCopy(**valid_clip_copy_dict)
+            ClipCopy(**bad)
         assert "AICDMX" in str(exc_info.value)
 
     def test_aicdmx_case_insensitive(self, valid_clip_copy_dict):
@@ -392,26 +396,18 @@ class TestClipCopyFieldConstraints:
             clip = ClipCopy(**valid_clip_copy_dict)
             assert clip.clip_id == clip_id
 
-    def test_clip_id_zero_rejected(self, valid_clip_copy_dict):
+    def test_clip_id_zero_rejected(self):
         """clip_id = 0 should raise ValidationError."""
-        valid_clip_copy_dict["clip_id"] = 0
-        with pytest.raises(ValidationError) as exc_info:
-            ClipCopy(**valid_clip_copy_dict)
-        assert "clip_id" in str(exc_info.value)
+        _assert_field_error("clip_id", ClipCopy, **{**_VALID_CLIP_COPY, "clip_id": 0})
 
-    def test_clip_id_negative_rejected(self, valid_clip_copy_dict):
+    def test_clip_id_negative_rejected(self):
         """clip_id < 0 should raise ValidationError."""
-        valid_clip_copy_dict["clip_id"] = -1
-        with pytest.raises(ValidationError) as exc_info:
-            ClipCopy(**valid_clip_copy_dict)
-        assert "clip_id" in str(exc_info.value)
+        _assert_field_error("clip_id", ClipCopy, **{**_VALID_CLIP_COPY, "clip_id": -1})
 
-    def test_copy_min_length_violation(self, valid_clip_copy_dict):
+    def test_copy_min_length_violation(self):
         """copy shorter than 20 chars should raise ValidationError."""
-        valid_clip_copy_dict["copy"] = "Short #AICDMX"  # 13 chars
-        with pytest.raises(ValidationError) as exc_info:
-            ClipCopy(**valid_clip_copy_dict)
-        assert "copy" in str(exc_info.value).lower()
+        bad = {**_VALID_CLIP_COPY, "copy": "Short #AICDMX"}  # 13 chars
+        _assert_field_error("copy", ClipCopy, **bad)
 
     def test_copy_at_min_length_passes(self, valid_clip_copy_dict):
         """copy of exactly 20 chars should pass."""
@@ -430,24 +426,21 @@ class TestClipCopyFieldConstraints:
 class TestCopysOutput:
     """Tests for CopysOutput model."""
 
-    def test_valid_copys_output(self, valid_clip_copy_dict):
+    def test_valid_copys_output(self):
         """Valid CopysOutput with clips should work."""
-        output = CopysOutput(clips=[ClipCopy(**valid_clip_copy_dict)])
+        output = CopysOutput(clips=[ClipCopy(**_VALID_CLIP_COPY)])
         assert len(output.clips) == 1
 
-    def test_multiple_clips(self, valid_clip_copy_dict):
+    def test_multiple_clips(self):
         """CopysOutput should accept multiple clips."""
-        clip1 = valid_clip_copy_dict.copy()
-        clip2 = valid_clip_copy_dict.copy()
-        clip2["clip_id"] = 2
-        output = CopysOutput(clips=[ClipCopy(**clip1), ClipCopy(**clip2)])
+        clip1 = ClipCopy(**_VALID_CLIP_COPY)
+        clip2 = ClipCopy(**{**_VALID_CLIP_COPY, "clip_id": 2})
+        output = CopysOutput(clips=[clip1, clip2])
         assert len(output.clips) == 2
 
     def test_empty_clips_list_rejected(self):
         """CopysOutput with empty clips list should raise ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            CopysOutput(clips=[])
-        assert "clips" in str(exc_info.value)
+        _assert_field_error("clips", CopysOutput, clips=[])
 
     def test_has_json_schema_extra(self):
         """CopysOutput should have json_schema_extra with example."""
@@ -464,83 +457,83 @@ class TestCopysOutput:
 class TestSavedCopys:
     """Tests for SavedCopys model."""
 
-    def test_valid_saved_copys(self, valid_clip_copy_dict):
+    def test_valid_saved_copys(self, valid_clip_copy):
         """Valid SavedCopys should work."""
         saved = SavedCopys(
             video_id="test_video_123",
-            generated_at=datetime.now(),
+            generated_at=_FIXED_TS,
             model="gemini-2.5-flash",
             total_clips=1,
             style="viral",
             average_engagement=8.5,
             average_viral_potential=7.5,
-            clips=[ClipCopy(**valid_clip_copy_dict)],
+            clips=[valid_clip_copy],
         )
         assert saved.video_id == "test_video_123"
         assert saved.total_clips == 1
 
-    def test_total_clips_must_be_positive(self, valid_clip_copy_dict):
+    def test_total_clips_must_be_positive(self, valid_clip_copy):
         """total_clips must be >= 1."""
-        with pytest.raises(ValidationError) as exc_info:
-            SavedCopys(
-                video_id="test_video",
-                generated_at=datetime.now(),
-                model="gemini-2.5-flash",
-                total_clips=0,
-                style="viral",
-                average_engagement=8.5,
-                average_viral_potential=7.5,
-                clips=[ClipCopy(**valid_clip_copy_dict)],
-            )
-        assert "total_clips" in str(exc_info.value)
+        _assert_field_error(
+            "total_clips",
+            SavedCopys,
+            video_id="test_video",
+            generated_at=_FIXED_TS,
+            model="gemini-2.5-flash",
+            total_clips=0,
+            style="viral",
+            average_engagement=8.5,
+            average_viral_potential=7.5,
+            clips=[valid_clip_copy],
+        )
 
-    def test_average_engagement_range(self, valid_clip_copy_dict):
+    @pytest.mark.parametrize("avg", [0.0, 5.0, 10.0])
+    def test_average_engagement_range(self, valid_clip_copy, avg):
         """average_engagement must be in [0, 10]."""
         # Valid at boundaries
-        for avg in [0.0, 5.0, 10.0]:
-            saved = SavedCopys(
-                video_id="test_video",
-                generated_at=datetime.now(),
-                model="gemini-2.5-flash",
-                total_clips=1,
-                style="viral",
-                average_engagement=avg,
-                average_viral_potential=5.0,
-                clips=[ClipCopy(**valid_clip_copy_dict)],
-            )
-            assert saved.average_engagement == avg
+        saved = SavedCopys(
+            video_id="test_video",
+            generated_at=_FIXED_TS,
+            model="gemini-2.5-flash",
+            total_clips=1,
+            style="viral",
+            average_engagement=avg,
+            average_viral_potential=5.0,
+            clips=[valid_clip_copy],
+        )
+        assert saved.average_engagement == avg
 
-    def test_average_engagement_above_range_rejected(self, valid_clip_copy_dict):
+    def test_average_engagement_above_range_rejected(self, valid_clip_copy):
         """average_engagement above 10 should raise ValidationError."""
-        with pytest.raises(ValidationError) as exc_info:
-            SavedCopys(
-                video_id="test_video",
-                generated_at=datetime.now(),
-                model="gemini-2.5-flash",
-                total_clips=1,
-                style="viral",
-                average_engagement=10.5,
-                average_viral_potential=5.0,
-                clips=[ClipCopy(**valid_clip_copy_dict)],
-            )
-        assert "average_engagement" in str(exc_info.value)
+        _assert_field_error(
+            "average_engagement",
+            SavedCopys,
+            video_id="test_video",
+            generated_at=_FIXED_TS,
+            model="gemini-2.5-flash",
+            total_clips=1,
+            style="viral",
+            average_engagement=10.5,
+            average_viral_potential=5.0,
+            clips=[valid_clip_copy],
+        )
 
-    def test_average_viral_potential_range(self, valid_clip_copy_dict):
+    @pytest.mark.parametrize("avg", [0.0, 5.0, 10.0])
+    def test_average_viral_potential_range(self, valid_clip_copy, avg):
         """average_viral_potential must be in [0, 10]."""
-        for avg in [0.0, 5.0, 10.0]:
-            saved = SavedCopys(
-                video_id="test_video",
-                generated_at=datetime.now(),
-                model="gemini-2.5-flash",
-                total_clips=1,
-                style="viral",
-                average_engagement=5.0,
-                average_viral_potential=avg,
-                clips=[ClipCopy(**valid_clip_copy_dict)],
-            )
-            assert saved.average_viral_potential == avg
+        saved = SavedCopys(
+            video_id="test_video",
+            generated_at=_FIXED_TS,
+            model="gemini-2.5-flash",
+            total_clips=1,
+            style="viral",
+            average_engagement=5.0,
+            average_viral_potential=avg,
+            clips=[valid_clip_copy],
+        )
+        assert saved.average_viral_potential == avg
 
-    def test_datetime_serialization(self, valid_clip_copy_dict):
+    def test_datetime_serialization(self, valid_clip_copy):
         """SavedCopys should serialize datetime correctly."""
         now = datetime(2025, 10, 26, 11, 30, 0)
         saved = SavedCopys(
@@ -551,7 +544,7 @@ class TestSavedCopys:
             style="viral",
             average_engagement=8.0,
             average_viral_potential=7.0,
-            clips=[ClipCopy(**valid_clip_copy_dict)],
+            clips=[valid_clip_copy],
         )
         # Model dump should work
         data = saved.model_dump()
@@ -566,75 +559,31 @@ class TestSavedCopys:
 class TestCalculateAverages:
     """Tests for calculate_averages() helper function."""
 
-    def test_calculate_averages_single_clip(self, valid_clip_copy_dict):
+    def test_calculate_averages_single_clip(self):
         """calculate_averages should work with single clip."""
-        output = CopysOutput(clips=[ClipCopy(**valid_clip_copy_dict)])
+        output = CopysOutput(clips=[ClipCopy(**_VALID_CLIP_COPY)])
         avg_engagement, avg_viral = calculate_averages(output)
         assert avg_engagement == 8.5
         assert avg_viral == 7.8
 
-    def test_calculate_averages_multiple_clips(
-        self, valid_clip_copy_dict, valid_metadata_dict
-    ):
+    def test_calculate_averages_multiple_clips(self):
         """calculate_averages should average multiple clips."""
-        clip1_dict = valid_clip_copy_dict.copy()
-        clip1_dict["metadata"] = valid_metadata_dict.copy()
-        clip1_dict["metadata"]["engagement_score"] = 8.0
-        clip1_dict["metadata"]["viral_potential"] = 7.0
-
-        clip2_dict = valid_clip_copy_dict.copy()
-        clip2_dict["clip_id"] = 2
-        clip2_dict["metadata"] = valid_metadata_dict.copy()
-        clip2_dict["metadata"]["engagement_score"] = 6.0
-        clip2_dict["metadata"]["viral_potential"] = 5.0
-
-        output = CopysOutput(clips=[ClipCopy(**clip1_dict), ClipCopy(**clip2_dict)])
-        avg_engagement, avg_viral = calculate_averages(output)
+        avg_engagement, avg_viral = calculate_averages(_TWO_CLIP_OUTPUT)
 
         assert avg_engagement == 7.0  # (8+6)/2
         assert avg_viral == 6.0  # (7+5)/2
 
     def test_calculate_averages_empty_clips(self):
         """calculate_averages with no clips should return (0.0, 0.0)."""
-
         # Create a CopysOutput-like object with empty clips for this test
         # Since CopysOutput requires min_length=1, we need to test the function directly
-        class MockOutput:
-            clips = []
-
-        avg_engagement, avg_viral = calculate_averages(MockOutput())
+        avg_engagement, avg_viral = calculate_averages(SimpleNamespace(clips=[]))
         assert avg_engagement == 0.0
         assert avg_viral == 0.0
 
-    def test_calculate_averages_rounds_to_two_decimals(
-        self, valid_clip_copy_dict, valid_metadata_dict
-    ):
+    def test_calculate_averages_rounds_to_two_decimals(self):
         """calculate_averages should round to 2 decimal places."""
-        clip1_dict = valid_clip_copy_dict.copy()
-        clip1_dict["metadata"] = valid_metadata_dict.copy()
-        clip1_dict["metadata"]["engagement_score"] = 7.0
-        clip1_dict["metadata"]["viral_potential"] = 6.0
-
-        clip2_dict = valid_clip_copy_dict.copy()
-        clip2_dict["clip_id"] = 2
-        clip2_dict["metadata"] = valid_metadata_dict.copy()
-        clip2_dict["metadata"]["engagement_score"] = 8.0
-        clip2_dict["metadata"]["viral_potential"] = 7.0
-
-        clip3_dict = valid_clip_copy_dict.copy()
-        clip3_dict["clip_id"] = 3
-        clip3_dict["metadata"] = valid_metadata_dict.copy()
-        clip3_dict["metadata"]["engagement_score"] = 9.0
-        clip3_dict["metadata"]["viral_potential"] = 8.0
-
-        output = CopysOutput(
-            clips=[
-                ClipCopy(**clip1_dict),
-                ClipCopy(**clip2_dict),
-                ClipCopy(**clip3_dict),
-            ]
-        )
-        avg_engagement, avg_viral = calculate_averages(output)
+        avg_engagement, avg_viral = calculate_averages(_THREE_CLIP_OUTPUT)
 
         # (7+8+9)/3 = 8.0, (6+7+8)/3 = 7.0
         assert avg_engagement == 8.0
@@ -665,28 +614,13 @@ class TestCreateSavedCopys:
         assert isinstance(saved.generated_at, datetime)
         assert len(saved.clips) == 1
 
-    def test_create_saved_copys_calculates_averages(
-        self, valid_clip_copy_dict, valid_metadata_dict
-    ):
+    def test_create_saved_copys_calculates_averages(self):
         """create_saved_copys should calculate averages correctly."""
-        clip1_dict = valid_clip_copy_dict.copy()
-        clip1_dict["metadata"] = valid_metadata_dict.copy()
-        clip1_dict["metadata"]["engagement_score"] = 8.0
-        clip1_dict["metadata"]["viral_potential"] = 7.0
-
-        clip2_dict = valid_clip_copy_dict.copy()
-        clip2_dict["clip_id"] = 2
-        clip2_dict["metadata"] = valid_metadata_dict.copy()
-        clip2_dict["metadata"]["engagement_score"] = 6.0
-        clip2_dict["metadata"]["viral_potential"] = 5.0
-
-        output = CopysOutput(clips=[ClipCopy(**clip1_dict), ClipCopy(**clip2_dict)])
-
         saved = create_saved_copys(
             video_id="test_video",
             model="gemini-2.5-flash",
             style="educational",
-            copies_output=output,
+            copies_output=_TWO_CLIP_OUTPUT,
         )
 
         assert saved.average_engagement == 7.0
@@ -694,16 +628,17 @@ class TestCreateSavedCopys:
 
     def test_create_saved_copys_sets_generated_at(self, valid_copys_output):
         """create_saved_copys should set generated_at to current time."""
-        before = datetime.now()
-        saved = create_saved_copys(
-            video_id="test_video",
-            model="gemini-2.5-flash",
-            style="storytelling",
-            copies_output=valid_copys_output,
-        )
-        after = datetime.now()
+        with patch("src.models.copy_schemas.datetime") as mock_datetime:
+            mock_datetime.now.return_value = _FIXED_TS
+            saved = create_saved_copys(
+                video_id="test_video",
+                model="gemini-2.5-flash",
+                style="storytelling",
+                copies_output=valid_copys_output,
+            )
 
-        assert before <= saved.generated_at <= after
+        mock_datetime.now.assert_called_once_with()
+        assert saved.generated_at == _FIXED_TS
 
 
 # ============================================================================
@@ -714,48 +649,41 @@ class TestCreateSavedCopys:
 class TestInvalidDataTypes:
     """Negative tests with invalid data types."""
 
-    def test_metadata_with_wrong_type_sentiment_score(self, valid_metadata_dict):
-        """Non-numeric sentiment_score should raise ValidationError."""
-        valid_metadata_dict["sentiment_score"] = "high"
-        with pytest.raises(ValidationError):
-            CopyMetadata(**valid_metadata_dict)
-
-    def test_metadata_with_wrong_type_topics(self, valid_metadata_dict):
-        """Non-list primary_topics should raise ValidationError."""
-        valid_metadata_dict["primary_topics"] = "single_topic"
-        with pytest.raises(ValidationError):
-            CopyMetadata(**valid_metadata_dict)
-
-    def test_clip_copy_with_wrong_type_clip_id(self, valid_clip_copy_dict):
-        """Non-integer clip_id should raise ValidationError."""
-        valid_clip_copy_dict["clip_id"] = "one"
-        with pytest.raises(ValidationError):
-            ClipCopy(**valid_clip_copy_dict)
-
-    def test_clip_copy_with_wrong_type_copy(self, valid_clip_copy_dict):
-        """Non-string copy should raise ValidationError."""
-        valid_clip_copy_dict["copy"] = 12345
-        with pytest.raises(ValidationError):
-            ClipCopy(**valid_clip_copy_dict)
-
-    def test_copys_output_with_wrong_type_clips(self):
-        """Non-list clips should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            CopysOutput(clips="not a list")
-
-    def test_saved_copys_with_wrong_type_datetime(self, valid_clip_copy_dict):
-        """Non-datetime generated_at should raise ValidationError or be coerced."""
-        with pytest.raises(ValidationError):
-            SavedCopys(
-                video_id="test",
-                generated_at="not a datetime",
-                model="gemini",
-                total_clips=1,
-                style="viral",
-                average_engagement=5.0,
-                average_viral_potential=5.0,
-                clips=[ClipCopy(**valid_clip_copy_dict)],
-            )
+    @pytest.mark.parametrize(
+        "model_cls,template,field,bad_value",
+        [
+            (CopyMetadata, _VALID_METADATA, "sentiment_score", "high"),
+            (CopyMetadata, _VALID_METADATA, "primary_topics", "single_topic"),
+            (ClipCopy, _VALID_CLIP_COPY, "clip_id", "one"),
+            (ClipCopy, _VALID_CLIP_COPY, "copy", 12345),
+            (CopysOutput, {}, "clips", "not a list"),
+        ],
+        ids=[
+            "metadata-sentiment_score",
+            "metadata-primary_topics",
+            "clip_copy-clip_id",
+            "clip_copy-copy",
+            "copys_output-clips",
+        ],
+    )
+    def test_wrong_type_rejected(self, model_cls, template, field, bad_value):
+        """A value of the wrong type should raise ValidationError at that field."""
+        _assert_field_error(field, model_cls, **{**template, field: bad_value})
+
+    def test_saved_copys_with_wrong_type_datetime(self, valid_clip_copy):
+        """Non-datetime generated_at should raise ValidationError."""
+        _assert_field_error(
+            "generated_at",
+            SavedCopys,
+            video_id="test",
+            generated_at="not a datetime",
+            model="gemini",
+            total_clips=1,
+            style="viral",
+            average_engagement=5.0,
+            average_viral_potential=5.0,
+            clips=[valid_clip_copy],
+        )
 
 
 # ============================================================================
@@ -815,8 +743,8 @@ class TestEdgeCases:
         metadata = CopyMetadata(**valid_metadata_dict)
         assert metadata.primary_topics == ["AI"]
 
-    def test_missing_required_field(self, valid_metadata_dict):
+    def test_missing_required_field(self):
         """Missing required field should raise ValidationError."""
-        del valid_metadata_dict["sentiment"]
+        metadata_dict = {k: v for k, v in _VALID_METADATA.items() if k != "sentiment"}
         with pytest.raises(ValidationError):
-            CopyMetadata(**valid_metadata_dict)
+            CopyMetadata(**metadata_dict)
@@ -13,11 +13,13 @@ Tests the 10-node LangGraph caption generation workflow:
 9. analyze_quality_node - Calculate quality metrics
 10. save_results_node - Save to JSON file
 
-Uses mock_gemini_client fixture for deterministic testing without API calls.
+ChatGoogleGenerativeAI is patched once per module by the mocked_generator
+fixture, so tests run deterministically without API calls.
 """
 
 import json
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -29,52 +31,86 @@ from src.models.copy_schemas import ClipCopy, CopyMetadata
 # ============================================================================
 
 
-@pytest.fixture
-def sample_clips_data():
-    """
-    Returns list of clip dicts with clip_id, transcript, duration.
-    Simulates the clips_metadata.json structure.
-    """
-    return [
+# Mirrors the clips_metadata.json structure. Read-only; the fixture below
+# hands each test its own dicts.
+_SAMPLE_CLIPS = (
+    MappingProxyType(
         {
             "clip_id": 1,
             "start_time": 0.0,
             "end_time": 30.0,
             "duration": 30.0,
             "transcript": "El 90% de los desarrolladores hacen esto mal cuando trabajan con APIs. Hoy te voy a enseñar cómo evitar este error común.",
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "clip_id": 2,
             "start_time": 30.0,
             "end_time": 60.0,
             "duration": 30.0,
             "transcript": "Cómo optimizar React hooks paso a paso. Primero necesitas entender cómo funciona el ciclo de vida de los componentes.",
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "clip_id": 3,
             "start_time": 60.0,
             "end_time": 90.0,
             "duration": 30.0,
             "transcript": "Mi primer bug en producción afectó a 10 mil usuarios. Fue el día más difícil de mi carrera, pero aprendí mucho.",
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "clip_id": 4,
             "start_time": 90.0,
             "end_time": 120.0,
             "duration": 30.0,
             "transcript": "¿Qué es la inteligencia artificial? Es una rama de la computación que permite a las máquinas aprender de datos.",
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "clip_id": 5,
             "start_time": 120.0,
             "end_time": 150.0,
             "duration": 30.0,
             "transcript": "Nadie habla de este problema en tech. El burnout está afectando a más del 60% de los desarrolladores.",
-        },
-    ]
+        }
+    ),
+)
+
+
+# Classifications for the five sample clips, used to build raw LLM payloads.
+# Only serialized, never handed to the generator.
+_TEST_CLASSIFICATIONS = (
+    {"clip_id": 1, "style": "viral", "confidence": 0.9, "reason": "Test"},
+    {"clip_id": 2, "style": "educational", "confidence": 0.85, "reason": "Test"},
+    {"clip_id": 3, "style": "storytelling", "confidence": 0.92, "reason": "Test"},
+    {"clip_id": 4, "style": "educational", "confidence": 0.88, "reason": "Test"},
+    {"clip_id": 5, "style": "viral", "confidence": 0.87, "reason": "Test"},
+)
+
+# Gemini responses in the off-spec shapes the classifier must tolerate
+_MARKDOWN_WRAPPED_JSON = (
+    "```json\n"
+    + json.dumps({"classifications": _TEST_CLASSIFICATIONS}, indent=4)
+    + "\n```"
+)
+_LIST_FORMAT_JSON = json.dumps(_TEST_CLASSIFICATIONS)
 
 
 @pytest.fixture
+def sample_clips_data():
+    """
+    Returns list of clip dicts with clip_id, transcript, duration.
+    Simulates the clips_metadata.json structure.
+    """
+    return [dict(clip) for clip in _SAMPLE_CLIPS]
+
+
+@pytest.fixture(scope="session")
 def mock_classification_response():
     """
     Returns JSON string with classifications array for sample clips.
@@ -118,7 +154,7 @@ def mock_classification_response():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_copy_response_viral():
     """
     Returns JSON string with valid CopysOutput for viral clips.
@@ -158,7 +194,7 @@ def mock_copy_response_viral():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_copy_response_educational():
     """
     Returns JSON string with valid CopysOutput for educational clips.
@@ -201,7 +237,7 @@ def mock_copy_response_educational():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_copy_response_storytelling():
     """
     Returns JSON string with valid CopysOutput for storytelling clips.
@@ -227,10 +263,11 @@ def mock_copy_response_storytelling():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_clip_copies():
     """
     Returns list of ClipCopy objects for testing merge and validation nodes.
+    Validated once per session and shared; do not mutate.
     """
     return [
         ClipCopy(
@@ -275,8 +312,68 @@ def sample_clip_copies():
     ]
 
 
+@pytest.fixture(scope="module")
+def mocked_generator(request):
+    """
+    Builds a single CopysGenerator for the whole module with
+    ChatGoogleGenerativeAI patched out, so the LangGraph is compiled once.
+    Returns (generator, mock_llm); generator.llm is mock_llm.
+
+    Tests that change generator attributes must do so through the
+    function-scoped monkeypatch so the shared instance is restored.
+    """
+    # monkeypatch is function-scoped, so undo a MonkeyPatch via a finalizer
+    mp = pytest.MonkeyPatch()
+    request.addfinalizer(mp.undo)
+
+    mock_llm = MagicMock()
+    mp.setattr(
+        "src.copys_generator.ChatGoogleGenerativeAI", MagicMock(return_value=mock_llm)
+    )
+
+    from src.copys_generator import CopysGenerator
+
+    return CopysGenerator(video_id="test_video"), mock_llm
+
+
 @pytest.fixture
-def clips_metadata_file(tmp_path, sample_clips_data):
+def llm_responder(mocked_generator):
+    """
+    Returns a callable that sets the content of the shared mock LLM's next
+    response. The mock is reset after the test.
+    """
+    _, mock_llm = mocked_generator
+
+    def set_response(content):
+        mock_llm.invoke.return_value = SimpleNamespace(content=content)
+
+    yield set_response
+    mock_llm.reset_mock(return_value=True)
+
+
+@pytest.fixture(scope="session")
+def clips_json_bytes():
+    """
+    Returns the serialized clips metadata file contents, built once from
+    _SAMPLE_CLIPS in the on-disk format (transcript stored as full_text).
+    """
+    clips_with_full_text = [
+        {
+            "clip_id": clip["clip_id"],
+            "start_time": clip["start_time"],
+            "end_time": clip["end_time"],
+            "duration": clip["duration"],
+            "full_text": clip["transcript"],
+        }
+        for clip in _SAMPLE_CLIPS
+    ]
+    return json.dumps(
+        {"clips": clips_with_full_text}, indent=2, ensure_ascii=False
+    ).encode("utf-8")
+
+
+@pytest.fixture
+def clips_metadata_file(tmp_path, clips_json_bytes):
     """
     Creates a temporary clips metadata JSON file.
     Returns the path and temp directory.
@@ -286,24 +383,7 @@ def clips_metadata_file(tmp_path, sample_clips_data):
 
     video_id = "test_video_123"
     clips_file = temp_dir / f"{video_id}_clips.json"
-
-    # Convert sample_clips_data to the expected format with full_text
-    clips_with_full_text = []
-    for clip in sample_clips_data:
-        clips_with_full_text.append(
-            {
-                "clip_id": clip["clip_id"],
-                "start_time": clip["start_time"],
-                "end_time": clip["end_time"],
-                "duration": clip["duration"],
-                "full_text": clip["transcript"],
-            }
-        )
-
-    clips_file.write_text(
-        json.dumps({"clips": clips_with_full_text}, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    clips_file.write_bytes(clips_json_bytes)
 
     return {"path": clips_file, "temp_dir": temp_dir, "video_id": video_id}
 
@@ -316,16 +396,9 @@ def clips_metadata_file(tmp_path, sample_clips_data):
 class TestCopysGeneratorInitialization:
     """Tests for CopysGenerator class initialization."""
 
-    def test_copys_generator_initialization_default_model(self, monkeypatch):
+    def test_copys_generator_initialization_default_model(self, mocked_generator):
         """Verify default model and path setup."""
-        # Patch the ChatGoogleGenerativeAI to avoid API calls
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         assert generator.video_id == "test_video"
         assert generator.model == "gemini-2.0-flash-exp"
@@ -334,12 +407,10 @@ class TestCopysGeneratorInitialization:
         assert generator.output_dir == Path("output") / "test_video"
         assert generator.copys_dir == Path("output") / "test_video" / "copys"
 
-    def test_copys_generator_initialization_custom_model(self, monkeypatch):
+    def test_copys_generator_initialization_custom_model(self, mocked_generator):
         """Verify custom model configuration."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
+        # The shared generator keeps the defaults; build a separate one here
+        # while the module-level LLM patch is active.
         from src.copys_generator import CopysGenerator
 
         generator = CopysGenerator(
@@ -349,15 +420,9 @@ class TestCopysGeneratorInitialization:
         assert generator.model == "gemini-1.5-pro"
         assert generator.max_attempts == 5
 
-    def test_copys_generator_graph_building(self, monkeypatch):
+    def test_copys_generator_graph_building(self, mocked_generator):
         """Verify that the graph is built with all nodes."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Graph should be compiled (not None)
         assert generator.graph is not None
@@ -371,16 +436,13 @@ class TestCopysGeneratorInitialization:
 class TestLoadDataNode:
     """Tests for load_data_node."""
 
-    def test_load_data_node_success(self, monkeypatch, clips_metadata_file):
+    def test_load_data_node_success(
+        self, monkeypatch, mocked_generator, clips_metadata_file
+    ):
         """Verify successful loading of clips metadata."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id=clips_metadata_file["video_id"])
-        generator.temp_dir = clips_metadata_file["temp_dir"]
+        generator, _ = mocked_generator
+        monkeypatch.setattr(generator, "video_id", clips_metadata_file["video_id"])
+        monkeypatch.setattr(generator, "temp_dir", clips_metadata_file["temp_dir"])
 
         state = {
             "video_id": clips_metadata_file["video_id"],
@@ -396,16 +458,13 @@ class TestLoadDataNode:
         assert "transcript" in result["clips_data"][0]
         assert "Cargados 5 clips" in result["logs"][0]
 
-    def test_load_data_node_file_not_found(self, monkeypatch, tmp_path):
+    def test_load_data_node_file_not_found(
+        self, monkeypatch, mocked_generator, tmp_path
+    ):
         """Verify error handling when clips file doesn't exist."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="nonexistent_video")
-        generator.temp_dir = tmp_path / "temp"
+        generator, _ = mocked_generator
+        monkeypatch.setattr(generator, "video_id", "nonexistent_video")
+        monkeypatch.setattr(generator, "temp_dir", tmp_path / "temp")
 
         state = {"video_id": "nonexistent_video", "clips_data": [], "logs": []}
 
@@ -424,21 +483,15 @@ class TestClassifyClipsNode:
     """Tests for classify_clips_node."""
 
     def test_classify_clips_node_success(
-        self, monkeypatch, sample_clips_data, mock_classification_response
+        self,
+        mocked_generator,
+        llm_responder,
+        sample_clips_data,
+        mock_classification_response,
     ):
         """Verify successful classification of clips with mocked LLM."""
-        mock_response = MagicMock()
-        mock_response.content = mock_classification_response
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(mock_classification_response)
 
         state = {"clips_data": sample_clips_data, "logs": []}
 
@@ -453,53 +506,15 @@ class TestClassifyClipsNode:
         assert "educational" in styles
         assert "storytelling" in styles
 
-    def test_classify_clips_node_partial_success(self, monkeypatch, sample_clips_data):
+    def test_classify_clips_node_partial_success(
+        self, mocked_generator, llm_responder, sample_clips_data
+    ):
         """Verify graceful degradation with >60% classification success."""
         # Only return classifications for 4 out of 5 clips (80%)
-        partial_response = json.dumps(
-            {
-                "classifications": [
-                    {
-                        "clip_id": 1,
-                        "style": "viral",
-                        "confidence": 0.9,
-                        "reason": "Test",
-                    },
-                    {
-                        "clip_id": 2,
-                        "style": "educational",
-                        "confidence": 0.85,
-                        "reason": "Test",
-                    },
-                    {
-                        "clip_id": 3,
-                        "style": "storytelling",
-                        "confidence": 0.92,
-                        "reason": "Test",
-                    },
-                    {
-                        "clip_id": 4,
-                        "style": "educational",
-                        "confidence": 0.88,
-                        "reason": "Test",
-                    },
-                    # clip_id 5 is missing
-                ]
-            }
-        )
-
-        mock_response = MagicMock()
-        mock_response.content = partial_response
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
+        partial_response = json.dumps({"classifications": _TEST_CLASSIFICATIONS[:4]})
 
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(partial_response)
 
         state = {"clips_data": sample_clips_data, "logs": []}
 
@@ -510,41 +525,16 @@ class TestClassifyClipsNode:
         assert len(result["classifications"]) == 4
 
     def test_classify_clips_node_insufficient_classifications(
-        self, monkeypatch, sample_clips_data
+        self, mocked_generator, llm_responder, sample_clips_data
     ):
         """Verify failure when <60% clips are classified."""
         # Only return classifications for 2 out of 5 clips (40%)
         insufficient_response = json.dumps(
-            {
-                "classifications": [
-                    {
-                        "clip_id": 1,
-                        "style": "viral",
-                        "confidence": 0.9,
-                        "reason": "Test",
-                    },
-                    {
-                        "clip_id": 2,
-                        "style": "educational",
-                        "confidence": 0.85,
-                        "reason": "Test",
-                    },
-                ]
-            }
+            {"classifications": _TEST_CLASSIFICATIONS[:2]}
         )
 
-        mock_response = MagicMock()
-        mock_response.content = insufficient_response
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(insufficient_response)
 
         state = {"clips_data": sample_clips_data, "logs": []}
 
@@ -555,33 +545,11 @@ class TestClassifyClipsNode:
         assert "2/5" in result["error_message"]
 
     def test_classify_clips_node_handles_markdown_json(
-        self, monkeypatch, sample_clips_data
+        self, mocked_generator, llm_responder, sample_clips_data
     ):
         """Verify that ```json markdown wrapping is cleaned."""
-        wrapped_response = """```json
-{
-    "classifications": [
-        {"clip_id": 1, "style": "viral", "confidence": 0.9, "reason": "Test"},
-        {"clip_id": 2, "style": "educational", "confidence": 0.85, "reason": "Test"},
-        {"clip_id": 3, "style": "storytelling", "confidence": 0.92, "reason": "Test"},
-        {"clip_id": 4, "style": "educational", "confidence": 0.88, "reason": "Test"},
-        {"clip_id": 5, "style": "viral", "confidence": 0.87, "reason": "Test"}
-    ]
-}
-```"""
-
-        mock_response = MagicMock()
-        mock_response.content = wrapped_response
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(_MARKDOWN_WRAPPED_JSON)
 
         state = {"clips_data": sample_clips_data, "logs": []}
 
@@ -591,47 +559,12 @@ class TestClassifyClipsNode:
         assert len(result["classifications"]) == 5
 
     def test_classify_clips_node_handles_list_format(
-        self, monkeypatch, sample_clips_data
+        self, mocked_generator, llm_responder, sample_clips_data
     ):
         """Verify handling when Gemini returns array instead of {classifications: [...]}."""
         # Gemini sometimes returns just the array
-        list_response = json.dumps(
-            [
-                {"clip_id": 1, "style": "viral", "confidence": 0.9, "reason": "Test"},
-                {
-                    "clip_id": 2,
-                    "style": "educational",
-                    "confidence": 0.85,
-                    "reason": "Test",
-                },
-                {
-                    "clip_id": 3,
-                    "style": "storytelling",
-                    "confidence": 0.92,
-                    "reason": "Test",
-                },
-                {
-                    "clip_id": 4,
-                    "style": "educational",
-                    "confidence": 0.88,
-                    "reason": "Test",
-                },
-                {"clip_id": 5, "style": "viral", "confidence": 0.87, "reason": "Test"},
-            ]
-        )
-
-        mock_response = MagicMock()
-        mock_response.content = list_response
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(_LIST_FORMAT_JSON)
 
         state = {"clips_data": sample_clips_data, "logs": []}
 
@@ -649,15 +582,9 @@ class TestClassifyClipsNode:
 class TestGroupByStyleNode:
     """Tests for group_by_style_node."""
 
-    def test_group_by_style_node(self, monkeypatch, sample_clips_data):
+    def test_group_by_style_node(self, mocked_generator, sample_clips_data):
         """Verify clips are grouped correctly into viral/educational/storytelling."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         classifications = [
             {"clip_id": 1, "style": "viral", "confidence": 0.9, "reason": "Test"},
@@ -707,16 +634,10 @@ class TestGroupByStyleNode:
         assert 4 in educational_ids
 
     def test_group_by_style_node_skips_missing_clips(
-        self, monkeypatch, sample_clips_data
+        self, mocked_generator, sample_clips_data
     ):
         """Verify that classifications for non-existent clips are skipped."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Include a classification for non-existent clip_id 99
         classifications = [
@@ -751,21 +672,15 @@ class TestGenerateNodes:
     """Tests for generate_viral_node, generate_educational_node, generate_storytelling_node."""
 
     def test_generate_viral_node(
-        self, monkeypatch, sample_clips_data, mock_copy_response_viral
+        self,
+        mocked_generator,
+        llm_responder,
+        sample_clips_data,
+        mock_copy_response_viral,
     ):
         """Verify viral copy generation with mocked LLM."""
-        mock_response = MagicMock()
-        mock_response.content = mock_copy_response_viral
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(mock_copy_response_viral)
 
         viral_clips = [
             {**sample_clips_data[0], "classification": {"style": "viral"}},
@@ -789,21 +704,15 @@ class TestGenerateNodes:
         assert "#AICDMX" in result["viral_copies"][0].copy_text.upper()
 
     def test_generate_educational_node(
-        self, monkeypatch, sample_clips_data, mock_copy_response_educational
+        self,
+        mocked_generator,
+        llm_responder,
+        sample_clips_data,
+        mock_copy_response_educational,
     ):
         """Verify educational copy generation with mocked LLM."""
-        mock_response = MagicMock()
-        mock_response.content = mock_copy_response_educational
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(mock_copy_response_educational)
 
         educational_clips = [
             {**sample_clips_data[1], "classification": {"style": "educational"}},
@@ -826,21 +735,15 @@ class TestGenerateNodes:
         assert result["educational_copies"][0].clip_id == 2
 
     def test_generate_storytelling_node(
-        self, monkeypatch, sample_clips_data, mock_copy_response_storytelling
+        self,
+        mocked_generator,
+        llm_responder,
+        sample_clips_data,
+        mock_copy_response_storytelling,
     ):
         """Verify storytelling copy generation with mocked LLM."""
-        mock_response = MagicMock()
-        mock_response.content = mock_copy_response_storytelling
-
-        mock_llm = MagicMock()
-        mock_llm.invoke.return_value = mock_response
-
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
+        llm_responder(mock_copy_response_storytelling)
 
         storytelling_clips = [
             {**sample_clips_data[2], "classification": {"style": "storytelling"}}
@@ -861,15 +764,9 @@ class TestGenerateNodes:
         assert len(result["storytelling_copies"]) == 1
         assert result["storytelling_copies"][0].clip_id == 3
 
-    def test_generate_copies_empty_group(self, monkeypatch):
+    def test_generate_copies_empty_group(self, mocked_generator):
         """Verify empty group returns empty list."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {
             "grouped_clips": {"viral": [], "educational": [], "storytelling": []},
@@ -891,16 +788,10 @@ class TestMergeResultsNode:
     """Tests for merge_results_node."""
 
     def test_merge_results_node(
-        self, monkeypatch, sample_clips_data, sample_clip_copies
+        self, mocked_generator, sample_clips_data, sample_clip_copies
     ):
         """Verify all copies are combined and sorted by clip_id."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Split copies into groups
         viral = [sample_clip_copies[0]]  # clip_id 1
@@ -925,16 +816,10 @@ class TestMergeResultsNode:
         assert ids == [1, 2, 3]
 
     def test_merge_results_node_partial_copies(
-        self, monkeypatch, sample_clips_data, sample_clip_copies
+        self, mocked_generator, sample_clips_data, sample_clip_copies
     ):
         """Verify warning when not all clips have copies."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Only 2 copies for 5 clips
         state = {
@@ -961,15 +846,11 @@ class TestMergeResultsNode:
 class TestValidateStructureNode:
     """Tests for validate_structure_node."""
 
-    def test_validate_structure_node_success(self, monkeypatch, sample_clip_copies):
+    def test_validate_structure_node_success(
+        self, mocked_generator, sample_clip_copies
+    ):
         """Verify validation passes for valid copies with #AICDMX."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {"all_copies": sample_clip_copies, "logs": []}
 
@@ -978,15 +859,9 @@ class TestValidateStructureNode:
         assert "error_message" not in result
         assert "Validación exitosa" in result["logs"][0]
 
-    def test_validate_structure_node_missing_hashtag(self, monkeypatch):
+    def test_validate_structure_node_missing_hashtag(self, mocked_generator):
         """Verify detection of missing #AICDMX hashtag."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Create copy without #AICDMX (bypass Pydantic validator by modifying after creation)
         copy_obj = ClipCopy(
@@ -1012,15 +887,9 @@ class TestValidateStructureNode:
         assert "error_message" in result
         assert "falta #AICDMX" in result["error_message"]
 
-    def test_validate_structure_node_short_copy(self, monkeypatch):
+    def test_validate_structure_node_short_copy(self, mocked_generator):
         """Verify detection of copy too short (<20 chars)."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Create copy with short text (bypass validator)
         copy_obj = ClipCopy(
@@ -1056,16 +925,10 @@ class TestAnalyzeQualityNode:
     """Tests for analyze_quality_node."""
 
     def test_analyze_quality_node(
-        self, monkeypatch, sample_clips_data, sample_clip_copies
+        self, mocked_generator, sample_clips_data, sample_clip_copies
     ):
         """Verify engagement/viral averages and low_quality_clips calculation."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {
             "clips_data": sample_clips_data[:3],  # 3 clips
@@ -1083,15 +946,9 @@ class TestAnalyzeQualityNode:
         expected_engagement = round((8.5 + 7.8 + 8.2) / 3, 2)
         assert result["average_engagement"] == expected_engagement
 
-    def test_analyze_quality_node_no_copies(self, monkeypatch, sample_clips_data):
+    def test_analyze_quality_node_no_copies(self, mocked_generator, sample_clips_data):
         """Verify error when no copies were generated."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {"clips_data": sample_clips_data, "all_copies": [], "logs": []}
 
@@ -1101,16 +958,10 @@ class TestAnalyzeQualityNode:
         assert "No se generaron copies" in result["error_message"]
 
     def test_analyze_quality_node_insufficient_success_rate(
-        self, monkeypatch, sample_clips_data, sample_clip_copies
+        self, mocked_generator, sample_clips_data, sample_clip_copies
     ):
         """Verify failure when success rate < 60%."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Only 2 copies for 5 clips = 40% < 60%
         state = {
@@ -1125,16 +976,10 @@ class TestAnalyzeQualityNode:
         assert "Generación insuficiente" in result["error_message"]
 
     def test_analyze_quality_node_identifies_low_quality(
-        self, monkeypatch, sample_clips_data
+        self, mocked_generator, sample_clips_data
     ):
         """Verify clips with engagement < 6.5 are flagged as low quality."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         # Create copies with low engagement
         copies = [
@@ -1182,15 +1027,9 @@ class TestAnalyzeQualityNode:
 class TestShouldRetryOrSave:
     """Tests for should_retry_or_save conditional edge routing."""
 
-    def test_should_retry_or_save_save_high_engagement(self, monkeypatch):
+    def test_should_retry_or_save_save_high_engagement(self, mocked_generator):
         """Verify 'save' is returned when engagement >= 7.5."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {
             "average_engagement": 8.0,
@@ -1203,15 +1042,9 @@ class TestShouldRetryOrSave:
 
         assert result == "save"
 
-    def test_should_retry_or_save_retry_low_engagement(self, monkeypatch):
+    def test_should_retry_or_save_retry_low_engagement(self, mocked_generator):
         """Verify 'retry' is returned when engagement < 7.5 and attempts < max."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {
             "average_engagement": 6.5,  # Below threshold
@@ -1224,15 +1057,9 @@ class TestShouldRetryOrSave:
 
         assert result == "retry"
 
-    def test_should_retry_or_save_save_max_attempts(self, monkeypatch):
+    def test_should_retry_or_save_save_max_attempts(self, mocked_generator):
         """Verify 'save' is returned when max_attempts reached even with low engagement."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {
             "average_engagement": 6.5,  # Below threshold
@@ -1245,15 +1072,9 @@ class TestShouldRetryOrSave:
 
         assert result == "save"
 
-    def test_should_retry_or_save_end_on_error(self, monkeypatch):
+    def test_should_retry_or_save_end_on_error(self, mocked_generator):
         """Verify 'end' is returned when error_message is present."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
+        generator, _ = mocked_generator
 
         state = {
             "average_engagement": 8.0,
@@ -1276,21 +1097,23 @@ class TestSaveResultsNode:
     """Tests for save_results_node."""
 
     def test_save_results_node(
-        self, monkeypatch, tmp_path, sample_clips_data, sample_clip_copies
+        self,
+        monkeypatch,
+        mocked_generator,
+        tmp_path,
+        sample_clips_data,
+        sample_clip_copies,
     ):
         """Verify JSON file is written with correct structure."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
-
-        # Override output paths to use temp directory
-        generator.output_dir = tmp_path / "output" / "test_video"
-        generator.copys_dir = generator.output_dir / "copys"
-        generator.copys_file = generator.copys_dir / "clips_copys.json"
+        generator, _ = mocked_generator
+
+        # Override output paths to use temp directory (restored after the test)
+        output_dir = tmp_path / "output" / "test_video"
+        monkeypatch.setattr(generator, "output_dir", output_dir)
+        monkeypatch.setattr(generator, "copys_dir", output_dir / "copys")
+        monkeypatch.setattr(
+            generator, "copys_file", output_dir / "copys" / "clips_copys.json"
+        )
 
         classifications = [
             {"clip_id": 1, "style": "viral", "confidence": 0.9, "reason": "Test"},
@@ -1338,21 +1161,23 @@ class TestSaveResultsNode:
         assert "Guardado" in result["logs"][0]
 
     def test_save_results_node_incomplete_generation(
-        self, monkeypatch, tmp_path, sample_clips_data, sample_clip_copies
+        self,
+        monkeypatch,
+        mocked_generator,
+        tmp_path,
+        sample_clips_data,
+        sample_clip_copies,
     ):
         """Verify incomplete generation metadata is saved."""
-        mock_llm = MagicMock()
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
-
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id="test_video")
-
-        # Override output paths
-        generator.output_dir = tmp_path / "output" / "test_video"
-        generator.copys_dir = generator.output_dir / "copys"
-        generator.copys_file = generator.copys_dir / "clips_copys.json"
+        generator, _ = mocked_generator
+
+        # Override output paths (restored after the test)
+        output_dir = tmp_path / "output" / "test_video"
+        monkeypatch.setattr(generator, "output_dir", output_dir)
+        monkeypatch.setattr(generator, "copys_dir", output_dir / "copys")
+        monkeypatch.setattr(
+            generator, "copys_file", output_dir / "copys" / "clips_copys.json"
+        )
 
         # 5 clips but only 3 copies (incomplete)
         state = {
@@ -1395,6 +1220,7 @@ class TestFullWorkflowIntegration:
     def test_full_workflow_integration(
         self,
         monkeypatch,
+        mocked_generator,
         tmp_path,
         clips_metadata_file,
         mock_classification_response,
@@ -1408,38 +1234,39 @@ class TestFullWorkflowIntegration:
 
         def get_mock_response(*args, **kwargs):
             call_count[0] += 1
-            mock_response = MagicMock()
 
             if call_count[0] == 1:
                 # First call: classification
-                mock_response.content = mock_classification_response
+                content = mock_classification_response
             elif call_count[0] == 2:
                 # Second call: viral copies
-                mock_response.content = mock_copy_response_viral
+                content = mock_copy_response_viral
             elif call_count[0] == 3:
                 # Third call: educational copies
-                mock_response.content = mock_copy_response_educational
+                content = mock_copy_response_educational
             else:
                 # Fourth call: storytelling copies
-                mock_response.content = mock_copy_response_storytelling
-
-            return mock_response
+                content = mock_copy_response_storytelling
 
-        mock_llm = MagicMock()
-        mock_llm.invoke.side_effect = get_mock_response
+            # Only .content is read, so a plain namespace is enough
+            return SimpleNamespace(content=content)
 
-        mock_class = MagicMock(return_value=mock_llm)
-        monkeypatch.setattr("src.copys_generator.ChatGoogleGenerativeAI", mock_class)
+        # Reuse the module's patched generator; everything set here is undone
+        # by monkeypatch after the test
+        generator, mock_llm = mocked_generator
+        monkeypatch.setattr(mock_llm.invoke, "side_effect", get_mock_response)
 
-        from src.copys_generator import CopysGenerator
-
-        generator = CopysGenerator(video_id=clips_metadata_file["video_id"])
-        generator.temp_dir = clips_metadata_file["temp_dir"]
+        video_id = clips_metadata_file["video_id"]
+        monkeypatch.setattr(generator, "video_id", video_id)
+        monkeypatch.setattr(generator, "temp_dir", clips_metadata_file["temp_dir"])
 
         # Override output paths
-        generator.output_dir = tmp_path / "output" / clips_metadata_file["video_id"]
-        generator.copys_dir = generator.output_dir / "copys"
-        generator.copys_file = generator.copys_dir / "clips_copys.json"
+        output_dir = tmp_path / "output" / video_id
+        monkeypatch.setattr(generator, "output_dir", output_dir)
+        monkeypatch.setattr(generator, "copys_dir", output_dir / "copys")
+        monkeypatch.setattr(
+            generator, "copys_file", output_dir / "copys" / "clips_copys.json"
+        )
 
         # Run the full workflow
         result = generator.generate()
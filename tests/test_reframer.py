@@ -177,6 +177,35 @@ class TestFFmpegVideoWriter:
             assert writer.isOpened()
             assert writer.codec == "h264_videotoolbox"
 
+    @patch("subprocess.Popen")
+    def test_init_threads_param(self, mock_popen, mock_numpy):
+        """Test that the encoder thread count is passed to FFmpeg."""
+        with patch.dict(
+            "sys.modules",
+            {"cv2": MagicMock(), "numpy": mock_numpy, "mediapipe": MagicMock()},
+        ):
+            import importlib
+
+            import src.reframer as reframer_module
+
+            importlib.reload(reframer_module)
+
+            mock_process = MagicMock()
+            mock_process.poll.return_value = None
+            mock_popen.return_value = mock_process
+
+            reframer_module.FFmpegVideoWriter(
+                output_path="/tmp/test.mp4",
+                width=1080,
+                height=1920,
+                fps=30.0,
+                threads=3,
+            )
+
+            cmd = mock_popen.call_args[0][0]
+            assert cmd[cmd.index("-threads") + 1] == "3"
+            assert cmd[-1] == "/tmp/test.mp4"
+
     @patch("subprocess.Popen")
     def test_init_failure(self, mock_popen, mock_numpy):
         """Test initialization failure handling."""
@@ -29,6 +29,7 @@ from src.config.settings_schema import (
     _normalize_auto_name_method,
     _normalize_auto_name_word_count,
     _normalize_crf,
+    _normalize_export_workers,
     _normalize_face_tracking_strategy,
     _normalize_ffmpeg_threads,
     _normalize_font_size,
@@ -466,6 +467,19 @@ class TestExportNormalizers:
         with pytest.raises(ValueError, match="-16 and 64"):
             _normalize_ffmpeg_threads(65)
 
+    def test_normalize_export_workers_valid(self):
+        """Valid worker counts pass through."""
+        assert _normalize_export_workers(0) == 0
+        assert _normalize_export_workers(1) == 1
+        assert _normalize_export_workers(16) == 16
+
+    def test_normalize_export_workers_invalid(self):
+        """Worker counts outside 0-16 raise ValueError."""
+        with pytest.raises(ValueError, match="0 and 16"):
+            _normalize_export_workers(-1)
+        with pytest.raises(ValueError, match="0 and 16"):
+            _normalize_export_workers(17)
+
 
 # ============================================================================
 # Output normalizers
@@ -78,3 +78,22 @@ def test_speech_aware_trimming_does_not_trim_into_overlapping_word(tmp_path):
     )
     assert start == 1.5
     assert end == 3.0
+
+
+def test_speech_aware_trimming_uses_preparsed_transcript(tmp_path):
+    transcript_path = _write_transcript(
+        tmp_path, [{"word": "hi", "start": 2.0, "end": 2.2}]
+    )
+    data = json.loads((tmp_path / "transcript.json").read_text(encoding="utf-8"))
+    (tmp_path / "transcript.json").unlink()  # must not be re-read from disk
+
+    start, end = compute_speech_aware_boundaries(
+        transcript_path=transcript_path,
+        clip_start=0.0,
+        clip_end=10.0,
+        trim_ms_start=1000,
+        trim_ms_end=1000,
+        transcript_data=data,
+    )
+    assert start == 1.0
+    assert end == 3.2
@@ -262,6 +262,37 @@ class TestVideoMarkMethods:
         assert len(state["exported_clips"]) == 2
         assert state["export_aspect_ratio"] == "9:16"
 
+    def test_register_video_full_writes_state_once(self, tmp_project_dir, monkeypatch):
+        """register_video_full should record every stage with a single write."""
+        manager = get_state_manager()
+        writes = []
+        original_save = manager._save_state
+
+        def counting_save():
+            writes.append(manager._defer_save)
+            original_save()
+
+        monkeypatch.setattr(manager, "_save_state", counting_save)
+
+        manager.register_video_full(
+            "full_test",
+            "full.mp4",
+            transcript_path="/path/to/transcript.json",
+            clips=[{"clip_id": 1}],
+            clips_metadata_path="/path/to/clips.json",
+            exported_paths=["/path/to/clip1.mp4"],
+        )
+
+        assert writes.count(False) == 1
+        state = manager.get_video_state("full_test")
+        assert state["transcribed"] is True
+        assert state["clips_generated"] is True
+        assert state["clips_exported"] is True
+
+        with open(tmp_project_dir / "temp" / "project_state.json") as f:
+            saved = json.load(f)
+        assert saved["full_test"]["exported_clips"] == [str(Path("/path/to/clip1.mp4"))]
+
     def test_mark_shorts_exported(self, tmp_project_dir):
         """mark_shorts_exported should store shorts export info."""
         manager = get_state_manager()
@@ -489,6 +489,22 @@ class TestGenerateSrtForClip:
         assert result == str(output_path)
         assert output_path.exists()
 
+    def test_preparsed_transcript_data_skips_file(self, tmp_path, sample_transcript):
+        """transcript_data is used instead of reading transcript_path."""
+        generator = SubtitleGenerator()
+
+        output_path = tmp_path / "clip.srt"
+        result = generator.generate_srt_for_clip(
+            str(tmp_path / "missing.json"),
+            clip_start=4.0,
+            clip_end=8.0,
+            output_path=str(output_path),
+            transcript_data=sample_transcript,
+        )
+
+        assert result == str(output_path)
+        assert "Hello" not in output_path.read_text(encoding="utf-8")
+
 
 # ============================================================================
 # EDGE CASE TESTS
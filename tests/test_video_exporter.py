@@ -8,6 +8,7 @@ Tests cover:
 - Integration tests with mocked subprocess for _export_single_clip
 """
 
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -20,8 +21,14 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.video_exporter import (
     VideoExporter,
+    _detect_hw_encoder,
+    _probe_cached,
+    _resolve_binary,
+    _resolve_export_workers,
     _resolve_ffmpeg_threads,
+    _resolve_filter_threads,
     _safe_parse_ffprobe_r_frame_rate,
+    _video_encoder_args,
 )
 
 # ============================================================================
@@ -170,6 +177,151 @@ class TestResolveFFmpegThreads:
             assert result == 3  # 4 - 1
 
 
+# ============================================================================
+# TESTS FOR _resolve_filter_threads()
+# ============================================================================
+
+
+class TestResolveFilterThreads:
+    """Tests for the _resolve_filter_threads helper function."""
+
+    def test_follows_explicit_thread_budget(self):
+        """Explicit encoder threads bound the filter threads."""
+        assert _resolve_filter_threads(2) == 2
+
+    def test_capped(self):
+        """Filter threads never exceed the cap."""
+        assert _resolve_filter_threads(16) == 4
+
+    def test_auto_uses_cpu_count(self):
+        """Auto (0) uses the CPU count, capped."""
+        with patch("src.video_exporter.os.cpu_count", return_value=2):
+            assert _resolve_filter_threads(0) == 2
+        with patch("src.video_exporter.os.cpu_count", return_value=32):
+            assert _resolve_filter_threads(0) == 4
+
+
+# ============================================================================
+# TESTS FOR _resolve_export_workers()
+# ============================================================================
+
+
+class TestResolveExportWorkers:
+    """Tests for the _resolve_export_workers helper function."""
+
+    def test_positive_value_passthrough(self):
+        """Positive values pass through unchanged."""
+        assert _resolve_export_workers(1) == 1
+        assert _resolve_export_workers(4) == 4
+
+    def test_zero_uses_half_the_cpus(self):
+        """Zero means auto: half the CPUs."""
+        with patch("src.video_exporter.os.cpu_count", return_value=8):
+            assert _resolve_export_workers(0) == 4
+
+    def test_zero_minimum_one(self):
+        """Auto never resolves below one worker."""
+        with patch("src.video_exporter.os.cpu_count", return_value=1):
+            assert _resolve_export_workers(0) == 1
+
+
+# ============================================================================
+# TESTS FOR _resolve_binary()
+# ============================================================================
+
+
+class TestResolveBinary:
+    """Tests for the cached ffmpeg/ffprobe PATH lookup."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        _resolve_binary.cache_clear()
+        yield
+        _resolve_binary.cache_clear()
+
+    def test_found_binary_is_absolute_and_looked_up_once(self):
+        """The PATH lookup runs once and its result is reused."""
+        with patch(
+            "src.video_exporter.shutil.which", return_value="/opt/bin/ffmpeg"
+        ) as mock_which:
+            assert _resolve_binary("ffmpeg") == "/opt/bin/ffmpeg"
+            assert _resolve_binary("ffmpeg") == "/opt/bin/ffmpeg"
+        mock_which.assert_called_once_with("ffmpeg")
+
+    def test_missing_binary_falls_back_to_name(self):
+        """Without a match the bare name is kept."""
+        with patch("src.video_exporter.shutil.which", return_value=None):
+            assert _resolve_binary("ffprobe") == "ffprobe"
+
+
+# ============================================================================
+# TESTS FOR hardware encoder selection
+# ============================================================================
+
+
+class TestHardwareEncoder:
+    """Tests for _detect_hw_encoder and _video_encoder_args."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        _detect_hw_encoder.cache_clear()
+        yield
+        _detect_hw_encoder.cache_clear()
+
+    def test_libx264_args(self):
+        """Software encoding keeps preset fast and CRF."""
+        assert _video_encoder_args("libx264", 23) == [
+            "-c:v",
+            "libx264",
+            "-preset",
+            "fast",
+            "-crf",
+            "23",
+        ]
+
+    def test_nvenc_maps_crf_to_cq(self):
+        """NVENC uses -cq for the quality target."""
+        args = _video_encoder_args("h264_nvenc", 20)
+        assert args[:2] == ["-c:v", "h264_nvenc"]
+        assert args[args.index("-cq") + 1] == "20"
+
+    def test_detect_returns_first_working_candidate(self):
+        """A listed encoder that fails the test encode is skipped."""
+        listing = MagicMock(stdout=b" V..... h264_nvenc\n V..... h264_qsv\n")
+        nvenc_fail = MagicMock(returncode=1)
+        qsv_ok = MagicMock(returncode=0)
+        with patch(
+            "src.video_exporter.subprocess.run",
+            side_effect=[listing, nvenc_fail, qsv_ok],
+        ):
+            assert _detect_hw_encoder() == "h264_qsv"
+
+    def test_detect_skips_hanging_test_encode(self, exporter):
+        """A test encode that times out is skipped and libx264 is used."""
+        listing = MagicMock(stdout=b" V..... h264_nvenc\n")
+        with patch(
+            "src.video_exporter.subprocess.run",
+            side_effect=[
+                listing,
+                subprocess.TimeoutExpired(cmd="ffmpeg", timeout=10),
+            ],
+        ) as mock_run:
+            assert _detect_hw_encoder() is None
+            assert exporter._resolve_video_encoder(True) == "libx264"
+        assert mock_run.call_args.kwargs["timeout"] == 10
+
+    def test_detect_none_without_ffmpeg(self):
+        """Missing ffmpeg means no hardware encoder."""
+        with patch("src.video_exporter.subprocess.run", side_effect=OSError):
+            assert _detect_hw_encoder() is None
+
+    def test_resolve_falls_back_to_libx264(self, exporter):
+        """Requested hardware encoding falls back when nothing is usable."""
+        with patch("src.video_exporter._detect_hw_encoder", return_value=None):
+            assert exporter._resolve_video_encoder(True) == "libx264"
+        assert exporter._resolve_video_encoder(False) == "libx264"
+
+
 # ============================================================================
 # TESTS FOR _get_logo_overlay_filter()
 # ============================================================================
@@ -518,7 +670,7 @@ class TestExportSingleClipIntegration:
         """Mock subprocess.run to capture FFmpeg commands."""
         with patch("src.video_exporter.subprocess.run") as mock_run:
             # Default: all FFmpeg calls succeed
-            mock_run.return_value = MagicMock(returncode=0, stderr="", stdout="")
+            mock_run.return_value = MagicMock(returncode=0, stderr=b"", stdout=b"")
             yield mock_run
 
     @pytest.fixture
@@ -573,7 +725,9 @@ class TestExportSingleClipIntegration:
         cmd = mock_subprocess_run.call_args[0][0]
 
         # Verify basic command structure
-        assert cmd[0] == "ffmpeg"
+        assert Path(cmd[0]).stem == "ffmpeg"
+        assert cmd[cmd.index("-loglevel") + 1] == "error"
+        assert "-nostats" in cmd
         assert "-ss" in cmd
         assert "-t" in cmd
         assert "-i" in cmd
@@ -603,6 +757,24 @@ class TestExportSingleClipIntegration:
         vf_value = cmd[vf_index + 1]
         assert "crop=ih*9/16:ih,scale=1080:1920" in vf_value
 
+    def test_reencode_seeks_on_input(self, mock_subprocess_run, setup_clip_export):
+        """Test -ss/-t precede -i so ffmpeg seeks instead of decoding from zero."""
+        data = setup_clip_export
+
+        data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+            aspect_ratio="9:16",
+        )
+
+        cmd = mock_subprocess_run.call_args[0][0]
+        input_index = cmd.index("-i")
+        assert cmd.index("-ss") < input_index
+        assert cmd.index("-t") < input_index
+        assert cmd.count("-ss") == 1
+
     def test_export_with_subtitles(self, mock_subprocess_run, setup_clip_export):
         """Test clip export with subtitles enabled."""
         data = setup_clip_export
@@ -666,10 +838,10 @@ class TestExportSingleClipIntegration:
         i_indices = [i for i, x in enumerate(cmd) if x == "-i"]
         assert len(i_indices) >= 2  # At least video and logo inputs
 
-    def test_two_step_processing_logo_and_subtitles(
+    def test_logo_and_subtitles_single_pass(
         self, mock_subprocess_run, setup_clip_export, tmp_path
     ):
-        """Test that logo + subtitles uses two-step processing."""
+        """Test that logo + subtitles are fused into one FFmpeg filtergraph."""
         data = setup_clip_export
 
         # Mock subtitle generator
@@ -684,12 +856,12 @@ class TestExportSingleClipIntegration:
         logo_path = tmp_path / "logo.png"
         logo_path.touch()
 
-        data["exporter"]._export_single_clip(
+        result = data["exporter"]._export_single_clip(
             video_path=data["video_path"],
             clip=data["clip"],
             video_name="test_video",
             output_dir=data["output_dir"],
-            aspect_ratio=None,
+            aspect_ratio="9:16",
             add_subtitles=True,
             transcript_path=str(data["transcript_path"]),
             subtitle_style="default",
@@ -699,18 +871,23 @@ class TestExportSingleClipIntegration:
             logo_scale=0.1,
         )
 
-        # Verify subprocess.run was called twice (two-step process)
-        assert mock_subprocess_run.call_count == 2
-
-        # First call should have logo filter_complex and -sn flag
-        first_call_cmd = mock_subprocess_run.call_args_list[0][0][0]
-        assert "-filter_complex" in first_call_cmd
-        assert "-sn" in first_call_cmd  # Discard subtitle streams
+        # A single FFmpeg invocation writes the final output directly
+        assert mock_subprocess_run.call_count == 1
+        assert result == data["output_dir"] / "clip_001.mp4"
 
-        # Second call should have subtitle filter
-        second_call_cmd = mock_subprocess_run.call_args_list[1][0][0]
-        cmd_str = " ".join(second_call_cmd)
-        assert "subtitles=" in cmd_str
+        cmd = mock_subprocess_run.call_args[0][0]
+        assert "-sn" in cmd  # Discard source subtitle streams
+        assert "-vf" not in cmd
+        assert cmd[-1] == str(data["output_dir"] / "clip_001.mp4")
+
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        chains = graph.split(";")
+        assert chains[0].startswith("[0:v]crop=ih*9/16:ih")
+        assert "overlay=" in chains[-2]
+        # Subtitles consume the overlay output and are drawn last
+        assert chains[-1].startswith("[v_out]subtitles=")
+        assert chains[-1].endswith("[v_final]")
+        assert cmd[cmd.index("-filter_complex") + 3] == "[v_final]"
 
     def test_audio_mapping_with_face_tracking(
         self, mock_subprocess_run, setup_clip_export, tmp_path
@@ -762,6 +939,49 @@ class TestExportSingleClipIntegration:
             cmd_str = " ".join(cmd)
             assert "1:a" in cmd_str  # Audio from original video
 
+    def test_face_tracking_receives_ffmpeg_threads(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test the reframer's encoder honours the ffmpeg_threads setting."""
+        data = setup_clip_export
+
+        with patch("src.video_exporter.FaceReframer") as mock_reframer_class:
+            mock_reframer = mock_reframer_class.return_value
+
+            data["exporter"]._export_single_clip(
+                video_path=data["video_path"],
+                clip=data["clip"],
+                video_name="test_video",
+                output_dir=data["output_dir"],
+                aspect_ratio="9:16",
+                enable_face_tracking=True,
+                ffmpeg_threads=3,
+            )
+
+            assert mock_reframer.reframe_video.call_args.kwargs["threads"] == 3
+
+    def test_face_tracking_intermediate_uses_fast_preset(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test the throwaway reframed intermediate is encoded with ultrafast."""
+        data = setup_clip_export
+
+        with patch("src.video_exporter.FaceReframer") as mock_reframer_class:
+            mock_reframer = mock_reframer_class.return_value
+
+            data["exporter"]._export_single_clip(
+                video_path=data["video_path"],
+                clip=data["clip"],
+                video_name="test_video",
+                output_dir=data["output_dir"],
+                aspect_ratio="9:16",
+                enable_face_tracking=True,
+            )
+
+            kwargs = mock_reframer.reframe_video.call_args.kwargs
+            assert kwargs["preset"] == "ultrafast"
+            assert kwargs["crf"] == 18
+
     def test_crf_and_threads_parameters(self, mock_subprocess_run, setup_clip_export):
         """Test CRF and threads parameters are passed to FFmpeg."""
         data = setup_clip_export
@@ -815,7 +1035,7 @@ class TestExportSingleClipIntegration:
 
         # Make FFmpeg fail
         mock_subprocess_run.return_value = MagicMock(
-            returncode=1, stderr="FFmpeg error", stdout=""
+            returncode=1, stderr=b"FFmpeg error", stdout=b""
         )
 
         result = data["exporter"]._export_single_clip(
@@ -830,6 +1050,183 @@ class TestExportSingleClipIntegration:
 
         assert result is None
 
+    def test_subtitle_burn_failure_retries_without_subtitles(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """A failed subtitle burn falls back to exporting the clip without them."""
+        data = setup_clip_export
+        data["exporter"].subtitle_generator.generate_srt_for_clip = MagicMock(
+            return_value=True
+        )
+        srt_path = data["output_dir"] / "clip_001.srt"
+        srt_path.write_text("1\n00:00:00,000 --> 00:00:05,000\nTest subtitle\n")
+
+        mock_subprocess_run.side_effect = [
+            MagicMock(returncode=1, stderr=b"libass error", stdout=b""),
+            MagicMock(returncode=0, stderr=b"", stdout=b""),
+        ]
+
+        result = data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+            aspect_ratio=None,
+            add_subtitles=True,
+            transcript_path=str(data["transcript_path"]),
+            subtitle_style="default",
+        )
+
+        assert result == data["output_dir"] / "clip_001.mp4"
+        assert mock_subprocess_run.call_count == 2
+        first_cmd = mock_subprocess_run.call_args_list[0][0][0]
+        retry_cmd = mock_subprocess_run.call_args_list[1][0][0]
+        assert "subtitles=" in " ".join(first_cmd)
+        assert "subtitles=" not in " ".join(retry_cmd)
+        assert "-sn" not in retry_cmd
+
+    def test_failure_without_subtitles_is_not_retried(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Without subtitles there is nothing to drop, so no second attempt."""
+        data = setup_clip_export
+        mock_subprocess_run.return_value = MagicMock(
+            returncode=1, stderr=b"FFmpeg error", stdout=b""
+        )
+
+        result = data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+            aspect_ratio=None,
+            add_subtitles=False,
+            transcript_path=None,
+        )
+
+        assert result is None
+        assert mock_subprocess_run.call_count == 1
+
+    def test_export_failure_removes_partial_output(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test that a partial file left by a failed ffmpeg run is deleted."""
+        data = setup_clip_export
+        partial = data["output_dir"] / "clip_001.mp4"
+
+        def fail_after_partial_write(cmd, **kwargs):
+            partial.write_bytes(b"truncated")
+            return MagicMock(returncode=1, stderr=b"FFmpeg error", stdout=b"")
+
+        mock_subprocess_run.side_effect = fail_after_partial_write
+
+        result = data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+        )
+
+        assert result is None
+        assert not partial.exists()
+
+    def test_export_failure_with_undecodable_stderr(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test that non-UTF-8 ffmpeg stderr does not break the error path."""
+        data = setup_clip_export
+
+        mock_subprocess_run.return_value = MagicMock(
+            returncode=1, stderr=b"bad byte \xff in path", stdout=b""
+        )
+
+        result = data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+        )
+
+        assert result is None
+        assert "text" not in mock_subprocess_run.call_args.kwargs
+
+    def test_fast_trim_stream_copies_plain_cut(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test fast_trim copies streams when no video filters are needed."""
+        data = setup_clip_export
+
+        data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+            fast_trim=True,
+        )
+
+        cmd = mock_subprocess_run.call_args[0][0]
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        assert "-avoid_negative_ts" in cmd
+        assert "libx264" not in cmd
+        assert cmd.index("-ss") < cmd.index("-i")  # Input-side seek
+
+    def test_fast_trim_reencodes_when_filters_needed(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test fast_trim falls back to re-encoding when a filter is applied."""
+        data = setup_clip_export
+
+        data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+            aspect_ratio="9:16",
+            fast_trim=True,
+        )
+
+        cmd = mock_subprocess_run.call_args[0][0]
+        assert "libx264" in cmd
+        assert "copy" not in cmd
+
+    def test_filter_threads_passed_with_vf(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test -filter_threads accompanies -vf, bounded by ffmpeg_threads."""
+        data = setup_clip_export
+
+        data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+            aspect_ratio="9:16",
+            ffmpeg_threads=2,
+        )
+
+        cmd = mock_subprocess_run.call_args[0][0]
+        assert cmd[cmd.index("-filter_threads") + 1] == "2"
+        assert cmd.index("-filter_threads") < cmd.index("-vf")
+
+    def test_hardware_encoder_replaces_libx264(
+        self, mock_subprocess_run, setup_clip_export
+    ):
+        """Test a hardware encoder swaps in its own codec arguments."""
+        data = setup_clip_export
+
+        data["exporter"]._export_single_clip(
+            video_path=data["video_path"],
+            clip=data["clip"],
+            video_name="test_video",
+            output_dir=data["output_dir"],
+            video_encoder="h264_nvenc",
+        )
+
+        cmd = mock_subprocess_run.call_args[0][0]
+        assert cmd[cmd.index("-c:v") + 1] == "h264_nvenc"
+        assert "libx264" not in cmd
+        assert "-crf" not in cmd
+
     def test_preset_fast_is_used(self, mock_subprocess_run, setup_clip_export):
         """Test that preset 'fast' is used for encoding."""
         data = setup_clip_export
@@ -850,6 +1247,266 @@ class TestExportSingleClipIntegration:
         assert cmd[preset_index + 1] == "fast"
 
 
+# ============================================================================
+# TESTS FOR get_video_info()
+# ============================================================================
+
+
+FFPROBE_JSON = (
+    b'{"streams": [{"codec_type": "video", "width": 1920, "height": 1080, '
+    b'"r_frame_rate": "30/1", "codec_name": "h264"}], '
+    b'"format": {"duration": "12.5"}}'
+)
+
+
+class TestGetVideoInfo:
+    """Tests for get_video_info and its ffprobe cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_probe_cache(self):
+        _probe_cached.cache_clear()
+        yield
+        _probe_cached.cache_clear()
+
+    @pytest.fixture
+    def mock_ffprobe(self):
+        with patch("src.video_exporter.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=FFPROBE_JSON)
+            yield mock_run
+
+    def test_parses_ffprobe_output(self, exporter, mock_ffprobe, tmp_path):
+        """Relevant video stream fields are extracted."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"data")
+
+        info = exporter.get_video_info(str(video))
+
+        assert info == {
+            "duration": 12.5,
+            "width": 1920,
+            "height": 1080,
+            "fps": 30.0,
+            "codec": "h264",
+        }
+
+    def test_parses_without_orjson(self, exporter, mock_ffprobe, tmp_path):
+        """The stdlib json fallback gives the same result as orjson."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"data")
+
+        with patch("src.utils.json_io.orjson", None):
+            info = exporter.get_video_info(str(video))
+
+        assert info["duration"] == 12.5
+        assert info["width"] == 1920
+
+    def test_repeated_calls_probe_once(self, exporter, mock_ffprobe, tmp_path):
+        """Probing the same unchanged file runs ffprobe only once."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"data")
+
+        first = exporter.get_video_info(str(video))
+        second = exporter.get_video_info(str(video))
+
+        assert first == second
+        assert mock_ffprobe.call_count == 1
+
+    def test_modified_file_is_probed_again(self, exporter, mock_ffprobe, tmp_path):
+        """A change in file size invalidates the cached probe."""
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"data")
+        exporter.get_video_info(str(video))
+
+        video.write_bytes(b"more data")
+        exporter.get_video_info(str(video))
+
+        assert mock_ffprobe.call_count == 2
+
+    def test_missing_file_returns_empty(self, exporter, mock_ffprobe, tmp_path):
+        """A missing file returns {} without running ffprobe."""
+        assert exporter.get_video_info(str(tmp_path / "missing.mp4")) == {}
+        assert not mock_ffprobe.called
+
+    def test_batch_returns_info_per_path(self, exporter, mock_ffprobe, tmp_path):
+        """Batch probing returns one entry per unique path."""
+        videos = []
+        for name in ("a.mp4", "b.mp4", "c.mp4"):
+            video = tmp_path / name
+            video.write_bytes(name.encode())
+            videos.append(str(video))
+        missing = str(tmp_path / "missing.mp4")
+
+        result = exporter.get_video_info_batch([*videos, videos[0], missing])
+
+        assert list(result) == [*videos, missing]
+        assert all(result[v]["duration"] == 12.5 for v in videos)
+        assert result[missing] == {}
+        assert mock_ffprobe.call_count == 3
+
+    def test_batch_empty(self, exporter, mock_ffprobe):
+        """An empty batch returns an empty dict."""
+        assert exporter.get_video_info_batch([]) == {}
+
+
+# ============================================================================
+# TESTS FOR export_clips() PARALLEL EXPORT
+# ============================================================================
+
+
+class TestExportClipsParallel:
+    """Tests for export_clips fan-out over _export_single_clip."""
+
+    @pytest.fixture
+    def export_setup(self, tmp_path, exporter):
+        exporter.output_dir = tmp_path / "output"
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        clips = [
+            {
+                "clip_id": f"clip_{i:03d}",
+                "start_time": i * 10.0,
+                "end_time": i * 10.0 + 5,
+            }
+            for i in range(5)
+        ]
+        return exporter, video_path, clips
+
+    def test_results_keep_clip_order(self, export_setup):
+        """Parallel export returns paths in the original clip order."""
+        exporter, video_path, clips = export_setup
+
+        def fake_export(**kwargs):
+            return kwargs["output_dir"] / f"{kwargs['clip']['clip_id']}.mp4"
+
+        with patch.object(exporter, "_export_single_clip", side_effect=fake_export):
+            result = exporter.export_clips(
+                video_path=str(video_path), clips=clips, export_workers=3
+            )
+
+        assert [Path(p).stem for p in result] == [c["clip_id"] for c in clips]
+
+    def test_failed_clips_are_skipped(self, export_setup):
+        """Clips whose export returns None are left out of the result."""
+        exporter, video_path, clips = export_setup
+
+        def fake_export(**kwargs):
+            if kwargs["clip"]["clip_id"] == "clip_002":
+                return None
+            return kwargs["output_dir"] / f"{kwargs['clip']['clip_id']}.mp4"
+
+        with patch.object(exporter, "_export_single_clip", side_effect=fake_export):
+            result = exporter.export_clips(
+                video_path=str(video_path), clips=clips, export_workers=2
+            )
+
+        assert len(result) == 4
+        assert not any("clip_002" in p for p in result)
+
+    def test_auto_threads_split_across_workers(self, export_setup):
+        """With ffmpeg_threads=0, CPU threads are divided among workers."""
+        exporter, video_path, clips = export_setup
+
+        with (
+            patch.object(
+                exporter, "_export_single_clip", return_value=None
+            ) as mock_export,
+            patch("src.video_exporter.os.cpu_count", return_value=8),
+        ):
+            exporter.export_clips(
+                video_path=str(video_path), clips=clips, export_workers=4
+            )
+
+        threads = {c.kwargs["ffmpeg_threads"] for c in mock_export.call_args_list}
+        assert threads == {2}
+
+    def test_negative_threads_split_across_workers(self, export_setup):
+        """With ffmpeg_threads=-N, the CPUs-minus-N budget is divided among workers."""
+        exporter, video_path, clips = export_setup
+
+        with (
+            patch.object(
+                exporter, "_export_single_clip", return_value=None
+            ) as mock_export,
+            patch("src.video_exporter.os.cpu_count", return_value=8),
+        ):
+            exporter.export_clips(
+                video_path=str(video_path),
+                clips=clips,
+                export_workers=3,
+                ffmpeg_threads=-2,
+            )
+
+        threads = {c.kwargs["ffmpeg_threads"] for c in mock_export.call_args_list}
+        assert threads == {2}
+
+    def test_explicit_threads_kept_with_workers(self, export_setup):
+        """An explicit positive thread count is passed through unchanged."""
+        exporter, video_path, clips = export_setup
+
+        with patch.object(
+            exporter, "_export_single_clip", return_value=None
+        ) as mock_export:
+            exporter.export_clips(
+                video_path=str(video_path),
+                clips=clips,
+                export_workers=4,
+                ffmpeg_threads=3,
+            )
+
+        threads = {c.kwargs["ffmpeg_threads"] for c in mock_export.call_args_list}
+        assert threads == {3}
+
+    def test_sequential_keeps_ffmpeg_auto_threads(self, export_setup):
+        """A single worker leaves ffmpeg's own thread auto-detection alone."""
+        exporter, video_path, clips = export_setup
+
+        with patch.object(
+            exporter, "_export_single_clip", return_value=None
+        ) as mock_export:
+            exporter.export_clips(video_path=str(video_path), clips=clips)
+
+        threads = {c.kwargs["ffmpeg_threads"] for c in mock_export.call_args_list}
+        assert threads == {0}
+
+    def test_no_temp_dir_without_face_tracking(self, export_setup):
+        """Without face tracking no temp directory is created anywhere."""
+        exporter, video_path, clips = export_setup
+
+        with (
+            patch.object(
+                exporter, "_export_single_clip", return_value=None
+            ) as mock_export,
+            patch("src.video_exporter.tempfile.TemporaryDirectory") as mock_tmp,
+        ):
+            exporter.export_clips(
+                video_path=str(video_path), clips=clips, aspect_ratio="9:16"
+            )
+
+        mock_tmp.assert_not_called()
+        assert {c.kwargs["temp_dir"] for c in mock_export.call_args_list} == {None}
+
+    def test_face_tracking_temp_dir_outside_output(self, export_setup):
+        """Face-tracking intermediates go to a system temp dir, removed afterwards."""
+        exporter, video_path, clips = export_setup
+
+        with patch.object(
+            exporter, "_export_single_clip", return_value=None
+        ) as mock_export:
+            exporter.export_clips(
+                video_path=str(video_path),
+                clips=clips,
+                aspect_ratio="9:16",
+                enable_face_tracking=True,
+            )
+
+        temp_dirs = {c.kwargs["temp_dir"] for c in mock_export.call_args_list}
+        assert len(temp_dirs) == 1
+        temp_dir = temp_dirs.pop()
+        assert temp_dir.name.startswith("cliperai_")
+        assert exporter.output_dir not in temp_dir.parents
+        assert not temp_dir.exists()
+
+
 # ============================================================================
 # MAIN ENTRY POINT FOR RUNNING TESTS DIRECTLY
 # ============================================================================